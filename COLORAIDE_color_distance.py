@@ -0,0 +1,173 @@
+"""
+Perceptual color distance (ΔE) kernels on LAB arrays.
+
+All functions take LAB values as produced by COLORAIDE_utils.rgb_to_lab /
+rgb_to_lab_array and broadcast like ordinary NumPy arithmetic, so the same
+kernel serves one-vs-one, one-vs-many and (chunked) many-vs-many queries.
+"""
+
+import numpy as np
+
+# Upper bound on pair count evaluated at once by delta_e_matrix.
+# CIEDE2000 keeps ~30 temporaries per pair, so 1M pairs ≈ 250 MB peak at float64.
+DEFAULT_MAX_PAIRS = 250_000
+
+METHODS = ('CIE76', 'CIE94', 'CIEDE2000')
+
+
+def delta_e_76(lab1: np.ndarray, lab2: np.ndarray) -> np.ndarray:
+    """
+    CIE76 color difference (Euclidean distance in LAB).
+
+    Args:
+        lab1, lab2: Broadcastable arrays of shape (..., 3)
+
+    Returns:
+        np.ndarray: ΔE of the broadcast shape without the last axis
+    """
+    diff = np.asarray(lab1) - np.asarray(lab2)
+    return np.sqrt(np.sum(diff * diff, axis=-1))
+
+
+def delta_e_94(lab1: np.ndarray, lab2: np.ndarray) -> np.ndarray:
+    """
+    CIE94 color difference (graphic arts weights, kL = 1, K1 = 0.045, K2 = 0.015).
+
+    Not symmetric: lab1 is the reference color.
+    """
+    lab1 = np.asarray(lab1)
+    lab2 = np.asarray(lab2)
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    C1 = np.hypot(a1, b1)
+    C2 = np.hypot(a2, b2)
+    dL = L1 - L2
+    dC = C1 - C2
+    da = a1 - a2
+    db = b1 - b2
+    dH2 = np.maximum(da * da + db * db - dC * dC, 0.0)
+
+    sC = 1.0 + 0.045 * C1
+    sH = 1.0 + 0.015 * C1
+    return np.sqrt(dL * dL + (dC / sC) ** 2 + dH2 / (sH * sH))
+
+
+def delta_e_2000(lab1: np.ndarray, lab2: np.ndarray) -> np.ndarray:
+    """
+    CIEDE2000 color difference (kL = kC = kH = 1).
+
+    Follows Sharma, Wu & Dalal (2005), including the hue-wrap handling.
+    """
+    lab1 = np.asarray(lab1)
+    lab2 = np.asarray(lab2)
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    C_bar = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2.0
+    C_bar7 = C_bar ** 7
+    G = 0.5 * (1.0 - np.sqrt(C_bar7 / (C_bar7 + 25.0 ** 7)))
+
+    a1p = (1.0 + G) * a1
+    a2p = (1.0 + G) * a2
+    C1p = np.hypot(a1p, b1)
+    C2p = np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360.0
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360.0
+
+    dLp = L2 - L1
+    dCp = C2p - C1p
+    chroma_zero = (C1p * C2p) == 0
+    dhp = h2p - h1p
+    dhp = np.where(dhp > 180.0, dhp - 360.0, np.where(dhp < -180.0, dhp + 360.0, dhp))
+    dhp = np.where(chroma_zero, 0.0, dhp)
+    dHp = 2.0 * np.sqrt(C1p * C2p) * np.sin(np.radians(dhp) / 2.0)
+
+    Lp_bar = (L1 + L2) / 2.0
+    Cp_bar = (C1p + C2p) / 2.0
+    h_sum = h1p + h2p
+    h_far = np.abs(h1p - h2p) > 180.0
+    hp_bar = np.where(h_far, np.where(h_sum < 360.0, h_sum + 360.0, h_sum - 360.0), h_sum) / 2.0
+    hp_bar = np.where(chroma_zero, h_sum, hp_bar)
+
+    T = (1.0
+         - 0.17 * np.cos(np.radians(hp_bar - 30.0))
+         + 0.24 * np.cos(np.radians(2.0 * hp_bar))
+         + 0.32 * np.cos(np.radians(3.0 * hp_bar + 6.0))
+         - 0.20 * np.cos(np.radians(4.0 * hp_bar - 63.0)))
+    d_theta = 30.0 * np.exp(-(((hp_bar - 275.0) / 25.0) ** 2))
+    Cp_bar7 = Cp_bar ** 7
+    R_C = 2.0 * np.sqrt(Cp_bar7 / (Cp_bar7 + 25.0 ** 7))
+    Lp50 = (Lp_bar - 50.0) ** 2
+    S_L = 1.0 + 0.015 * Lp50 / np.sqrt(20.0 + Lp50)
+    S_C = 1.0 + 0.045 * Cp_bar
+    S_H = 1.0 + 0.015 * Cp_bar * T
+    R_T = -np.sin(np.radians(2.0 * d_theta)) * R_C
+
+    tL = dLp / S_L
+    tC = dCp / S_C
+    tH = dHp / S_H
+    return np.sqrt(tL * tL + tC * tC + tH * tH + R_T * tC * tH)
+
+
+_KERNELS = {
+    'CIE76': delta_e_76,
+    'CIE94': delta_e_94,
+    'CIEDE2000': delta_e_2000,
+}
+
+
+def _kernel(method):
+    try:
+        return _KERNELS[method]
+    except KeyError:
+        raise ValueError(f"Unknown ΔE method '{method}', expected one of {METHODS}")
+
+
+def delta_e(lab: np.ndarray, others: np.ndarray, method: str = 'CIEDE2000') -> np.ndarray:
+    """
+    ΔE between one LAB color and many (or element-wise between equal-length arrays).
+
+    Args:
+        lab: (3,) reference color, or (N, 3)
+        others: (N, 3) colors to compare against
+        method: 'CIE76', 'CIE94' or 'CIEDE2000'
+
+    Returns:
+        np.ndarray: (N,) distances
+    """
+    return _kernel(method)(np.asarray(lab, dtype=np.float64), np.asarray(others, dtype=np.float64))
+
+
+def delta_e_matrix(labs_a: np.ndarray, labs_b: np.ndarray, method: str = 'CIEDE2000',
+                   max_pairs: int = DEFAULT_MAX_PAIRS) -> np.ndarray:
+    """
+    Pairwise ΔE between every color in labs_a and every color in labs_b.
+
+    Rows are evaluated in chunks of at most max_pairs pairs so peak memory
+    stays bounded regardless of input size; only the (N, M) result is full size.
+
+    Returns:
+        np.ndarray: (N, M) distances
+    """
+    kernel = _kernel(method)
+    a = np.asarray(labs_a, dtype=np.float64).reshape(-1, 3)
+    b = np.asarray(labs_b, dtype=np.float64).reshape(-1, 3)
+    out = np.empty((len(a), len(b)))
+    if not len(b):
+        return out
+    rows = max(1, max_pairs // len(b))
+    for start in range(0, len(a), rows):
+        chunk = a[start:start + rows, None, :]
+        out[start:start + rows] = kernel(chunk, b[None, :, :])
+    return out
+
+
+__all__ = [
+    'delta_e_76',
+    'delta_e_94',
+    'delta_e_2000',
+    'delta_e',
+    'delta_e_matrix',
+    'METHODS',
+]
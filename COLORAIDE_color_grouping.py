@@ -4,7 +4,10 @@ Groups identical colors with tolerance-based matching.
 """
 
 import bpy
+import numpy as np
 from .COLORAIDE_colorspace import linear_to_hex
+from .COLORAIDE_utils import rgb_to_lab_array
+from .COLORAIDE_color_distance import delta_e
 
 
 def colors_match(color1, color2, tolerance=0.001):
@@ -43,13 +46,43 @@ def find_color_group_index(color, existing_groups, tolerance):
     return -1
 
 
-def group_colors_by_value(detected_colors, tolerance=0.001):
+def _group_indices(colors, tolerance, metric):
+    """
+    Greedy grouping: each color joins the first earlier group within
+    tolerance. Runs one vector op per group rather than per color, since the
+    first ungrouped color always starts the next group and claims every
+    ungrouped color within tolerance of it.
+    
+    Returns:
+        list: Member indices per group, in creation order
+    """
+    keys = np.array(colors, dtype=np.float64)
+    if metric == 'DELTA_E':
+        keys = rgb_to_lab_array(keys)
+    ungrouped = np.arange(len(keys))
+    groups = []
+    while ungrouped.size:
+        candidates = keys[ungrouped]
+        if metric == 'DELTA_E':
+            claimed = delta_e(candidates[0], candidates) < tolerance
+        else:
+            claimed = np.abs(candidates - candidates[0]).max(axis=1) < tolerance
+        claimed[0] = True
+        groups.append(ungrouped[claimed].tolist())
+        ungrouped = ungrouped[~claimed]
+    return groups
+
+
+def group_colors_by_value(detected_colors, tolerance=0.001, metric='LINEAR'):
     """
     Group color properties by similar color values.
     
     Args:
         detected_colors: List of color property dicts from scan functions
         tolerance: Color matching tolerance
+        metric: 'LINEAR' — max per-channel difference in scene linear (tolerance
+                is in 0-1 channel units), or 'DELTA_E' — CIEDE2000 distance
+                (tolerance is in ΔE units)
     
     Returns:
         List of dicts with structure:
@@ -61,29 +94,18 @@ def group_colors_by_value(detected_colors, tolerance=0.001):
         }
     """
     groups = []
-    
-    for color_data in detected_colors:
-        color = tuple(color_data['color'][:3])
-        
-        # Find existing group or create new one
-        group_idx = -1
-        for i, group in enumerate(groups):
-            if colors_match(color, group['color'], tolerance):
-                group_idx = i
-                break
-        
-        if group_idx >= 0:
-            # Add to existing group
-            groups[group_idx]['instances'].append(color_data)
-            groups[group_idx]['count'] += 1
-        else:
-            # Create new group
-            groups.append({
-                'color': color,
-                'hex': linear_to_hex(color),
-                'count': 1,
-                'instances': [color_data]
-            })
+    if not detected_colors:
+        return groups
+
+    colors = [tuple(c['color'][:3]) for c in detected_colors]
+    for members in _group_indices(colors, tolerance, metric):
+        color = colors[members[0]]
+        groups.append({
+            'color': color,
+            'hex': linear_to_hex(color),
+            'count': len(members),
+            'instances': [detected_colors[i] for i in members]
+        })
     
     # Sort by usage count (most used first)
     groups.sort(key=lambda g: g['count'], reverse=True)
@@ -91,7 +113,7 @@ def group_colors_by_value(detected_colors, tolerance=0.001):
     return groups
 
 
-def build_grouped_properties(context, detected_colors, tolerance):
+def build_grouped_properties(context, detected_colors, tolerance, metric='LINEAR'):
     """
     Build grouped color properties from detected colors.
     
@@ -99,6 +121,7 @@ def build_grouped_properties(context, detected_colors, tolerance):
         context: Blender context
         detected_colors: List of color property dicts
         tolerance: Color matching tolerance
+        metric: 'LINEAR' or 'DELTA_E' (see group_colors_by_value)
     
     Returns:
         None (updates context.window_manager.coloraide_object_colors directly)
@@ -107,7 +130,7 @@ def build_grouped_properties(context, detected_colors, tolerance):
     obj_colors = wm.coloraide_object_colors
     
     # Group colors
-    groups_data = group_colors_by_value(detected_colors, tolerance)
+    groups_data = group_colors_by_value(detected_colors, tolerance, metric)
     
     # Clear existing grouped properties (if we add them later)
     # For now we'll just use the object mode items
@@ -0,0 +1,110 @@
+"""
+Memoized color representations for the sync pipeline.
+
+sync_all needs bytes, HSV, LAB and hex for every color it pushes, and the
+picker, history and palette keep re-submitting colors that were already
+converted. get_color_record() computes every representation at once and
+keeps the result in a bounded LRU keyed on the quantized linear color.
+
+When an OCIO engine is active (non-Rec.709 scene linear, see COLORAIDE_ocio)
+the display representations are computed from the color converted to linear
+Rec.709; rgb_linear itself stays in scene linear. The cache is cleared when
+the engine changes.
+"""
+
+from typing import NamedTuple
+from .COLORAIDE_colorspace import rgb_linear_to_srgb, rgb_linear_to_bytes, linear_to_hex
+from .COLORAIDE_utils import rgb_to_hsv, rgb_to_lab, rgb_to_oklab, oklab_to_oklch
+from . import COLORAIDE_state as _state
+
+# Maximum number of cached records before the least recently used is dropped.
+COLOR_RECORD_CACHE_SIZE = 512
+
+# Linear values are quantized to 16 bits per channel for the cache key —
+# well below anything the 8-bit hex or 0-decimal sliders can show.
+_QUANTIZE_STEPS = 65535
+
+
+class ColorRecord(NamedTuple):
+    """Every representation of one scene linear color (immutable)."""
+    rgb_linear: tuple   # (r, g, b) scene linear (unclamped)
+    srgb: tuple         # (r, g, b) sRGB [0.0, 1.0] (Rec.709 primaries)
+    bytes: tuple        # (r, g, b) sRGB [0, 255]
+    hsv: tuple          # (h, s, v) each [0.0, 1.0]
+    lab: tuple          # (L, a, b)
+    oklab: tuple        # (L, a, b) Oklab
+    oklch: tuple        # (L, C, h) OkLCh, h in degrees
+    hex: str            # "#RRGGBB"
+
+
+def _quantize(rgb_linear):
+    # Not clamped: HDR and negative colors keep distinct keys
+    return tuple(round(c * _QUANTIZE_STEPS) for c in rgb_linear[:3])
+
+
+def _build_record(rgb_linear):
+    rgb_linear = tuple(rgb_linear[:3])
+    working = rgb_linear
+    if _state.ocio_engine is not None:
+        working = tuple(_state.ocio_engine.scene_to_rec709(rgb_linear))
+    oklab = rgb_to_oklab(working)
+    return ColorRecord(
+        rgb_linear=rgb_linear,
+        srgb=rgb_linear_to_srgb(working),
+        bytes=rgb_linear_to_bytes(working),
+        hsv=rgb_to_hsv(working),
+        lab=rgb_to_lab(working),
+        oklab=oklab,
+        oklch=oklab_to_oklch(oklab),
+        hex=linear_to_hex(working),
+    )
+
+
+def get_color_record(rgb_linear) -> ColorRecord:
+    """
+    Return the ColorRecord for a scene linear color, converting only on a miss.
+
+    Args:
+        rgb_linear: (r, g, b) in scene linear space; values outside
+                    [0.0, 1.0] are kept (HDR / negative) and every
+                    representation is computed from the color as given
+    """
+    cache = _state.color_record_cache
+    key = _quantize(rgb_linear)
+    record = cache.get(key)
+    if record is not None:
+        cache.move_to_end(key)
+        _state.color_record_hits += 1
+        return record
+
+    _state.color_record_misses += 1
+    record = _build_record(rgb_linear)
+    cache[key] = record
+    if len(cache) > COLOR_RECORD_CACHE_SIZE:
+        cache.popitem(last=False)
+    return record
+
+
+def color_record_stats() -> dict:
+    """Hit/miss counters and current size of the record cache."""
+    return {
+        'hits': _state.color_record_hits,
+        'misses': _state.color_record_misses,
+        'size': len(_state.color_record_cache),
+    }
+
+
+def clear_color_records() -> None:
+    """Drop all cached records and reset the counters."""
+    _state.color_record_cache.clear()
+    _state.color_record_hits = 0
+    _state.color_record_misses = 0
+
+
+__all__ = [
+    'ColorRecord',
+    'get_color_record',
+    'color_record_stats',
+    'clear_color_records',
+    'COLOR_RECORD_CACHE_SIZE',
+]
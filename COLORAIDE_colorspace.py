@@ -1,6 +1,7 @@
 import bpy
 import numpy as np
 from math import pow
+from bisect import bisect_right
 
 """
 Color space conversion utilities for Blender 5.0+
@@ -73,6 +74,214 @@ def rgb_linear_to_srgb(rgb_linear: tuple[float, float, float]) -> tuple[float, f
     return tuple(linear_to_srgb(c) for c in rgb_linear[:3])
 
 
+# ---------------------------------------------------------------------------
+# dtype policy
+# ---------------------------------------------------------------------------
+# Array kernels here and in COLORAIDE_utils take ``dtype=None`` and keep the
+# input's float precision: float32 screen/image buffers stay float32 end to
+# end, float64 UI values stay float64, and anything else (lists, tuples,
+# integer arrays) becomes UI_DTYPE. Passing ``dtype`` forces a precision;
+# ``out``, where offered, receives the result in a caller-owned buffer and
+# sets the dtype. Constant tables and matrices are pre-cast per dtype so they
+# never promote the data to float64 behind the caller's back.
+
+IMAGE_DTYPE = np.float32
+UI_DTYPE = np.float64
+_FLOAT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def as_float_array(data, dtype=None, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    View data as a float array under the dtype policy, copying only when the
+    dtype has to change.
+
+    Args:
+        data: Array-like input
+        dtype: Target dtype, or None to keep float32/float64 input as is
+        out: Optional output buffer; its dtype wins when dtype is None
+    """
+    arr = np.asarray(data)
+    if dtype is None:
+        if out is not None:
+            dtype = out.dtype
+        elif arr.dtype in _FLOAT_DTYPES:
+            return arr
+        else:
+            dtype = UI_DTYPE
+    return arr.astype(dtype, copy=False)
+
+
+def _per_dtype(table: np.ndarray) -> dict:
+    """float32 and float64 copies of a constant table, keyed by dtype."""
+    return {dt: table.astype(dt) for dt in _FLOAT_DTYPES}
+
+
+def srgb_to_linear_array(srgb: np.ndarray, dtype=None, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Convert an array of sRGB values to scene linear color space.
+
+    Vectorized counterpart of ``srgb_to_linear`` for whole pixel buffers.
+    Accepts any shape, e.g. ``(N, 3)`` sample windows or ``(H, W, 3)`` images.
+    Uses one scratch array and one mask besides the result (``out`` may be
+    the input itself for an in-place conversion).
+
+    Args:
+        srgb: Array of channel values in sRGB space [0.0, 1.0]
+        dtype: Result dtype (see dtype policy)
+        out: Optional output buffer
+
+    Returns:
+        np.ndarray: Array of the same shape in scene linear space [0.0, 1.0]
+    """
+    c = as_float_array(srgb, dtype, out)
+    c = np.clip(c, 0.0, 1.0, out=np.empty_like(c) if out is None else out)
+    curve = c > 0.04045
+    tmp = c + 0.055
+    tmp /= 1.055
+    tmp **= 2.4
+    c /= 12.92
+    np.copyto(c, tmp, where=curve)
+    return c
+
+
+def linear_to_srgb_array(linear: np.ndarray, dtype=None, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Convert an array of scene linear values to sRGB color space.
+
+    Vectorized counterpart of ``linear_to_srgb`` for whole pixel buffers.
+
+    Args:
+        linear: Array of channel values in scene linear space [0.0, 1.0]
+        dtype: Result dtype (see dtype policy)
+        out: Optional output buffer
+
+    Returns:
+        np.ndarray: Array of the same shape in sRGB space [0.0, 1.0]
+    """
+    c = as_float_array(linear, dtype, out)
+    c = np.clip(c, 0.0, 1.0, out=np.empty_like(c) if out is None else out)
+    curve = c > 0.0031308
+    tmp = c ** (1.0 / 2.4)
+    tmp *= 1.055
+    tmp -= 0.055
+    c *= 12.92
+    np.copyto(c, tmp, where=curve)
+    return c
+
+
+# ---------------------------------------------------------------------------
+# Lookup tables
+# ---------------------------------------------------------------------------
+# Built once at import from the exact transfer functions above.
+#
+# _BYTE_TO_LINEAR          256 entries, exact (it *is* the formula, evaluated
+#                          for every possible 8-bit code value).
+# _LINEAR_TO_SRGB_LUT      LINEAR_TO_SRGB_LUT_SIZE + 1 samples of the encoding
+#                          curve, linearly interpolated. Max absolute error vs
+#                          linear_to_srgb() is LINEAR_TO_SRGB_LUT_MAX_ERROR
+#                          (1.7e-5, about 1/240 of an 8-bit step), reached
+#                          just above the 0.0031308 knee.
+# _LINEAR_BYTE_THRESHOLDS  The 255 linear values where the rounded sRGB byte
+#                          steps up. Linear → bytes through this table is
+#                          exact, not an approximation.
+
+LINEAR_TO_SRGB_LUT_SIZE = 4096
+LINEAR_TO_SRGB_LUT_MAX_ERROR = 1.7e-5
+
+_BYTE_TO_LINEAR = np.array([srgb_to_linear(i / 255.0) for i in range(256)])
+_BYTE_TO_LINEAR_LIST = tuple(float(v) for v in _BYTE_TO_LINEAR)
+_BYTE_TO_LINEAR_BY_DTYPE = _per_dtype(_BYTE_TO_LINEAR)
+
+_LINEAR_TO_SRGB_GRID = np.linspace(0.0, 1.0, LINEAR_TO_SRGB_LUT_SIZE + 1)
+_LINEAR_TO_SRGB_LUT = linear_to_srgb_array(_LINEAR_TO_SRGB_GRID)
+_LINEAR_TO_SRGB_LUT_LIST = tuple(float(v) for v in _LINEAR_TO_SRGB_LUT)
+# Segment start values and slopes, so array lookups are take() + fused lerp
+_LINEAR_TO_SRGB_LUT_BY_DTYPE = _per_dtype(_LINEAR_TO_SRGB_LUT[:-1])
+_LINEAR_TO_SRGB_SLOPE_BY_DTYPE = _per_dtype(np.diff(_LINEAR_TO_SRGB_LUT))
+
+_LINEAR_BYTE_THRESHOLDS = np.array([srgb_to_linear((i + 0.5) / 255.0) for i in range(255)])
+_LINEAR_BYTE_THRESHOLDS_LIST = tuple(float(v) for v in _LINEAR_BYTE_THRESHOLDS)
+# float32 thresholds rounded *up* (smallest float32 ≥ the exact threshold), so
+# comparing float32 input against them gives the same bytes as float64 would
+_LINEAR_BYTE_THRESHOLDS_F32 = _LINEAR_BYTE_THRESHOLDS.astype(np.float32)
+_LINEAR_BYTE_THRESHOLDS_F32 = np.where(
+    _LINEAR_BYTE_THRESHOLDS_F32 < _LINEAR_BYTE_THRESHOLDS,
+    np.nextafter(_LINEAR_BYTE_THRESHOLDS_F32, np.float32(np.inf)),
+    _LINEAR_BYTE_THRESHOLDS_F32)
+
+
+def linear_to_srgb_lut(c: float) -> float:
+    """
+    Convert single scene linear channel to sRGB using the interpolated table.
+
+    Error vs ``linear_to_srgb`` is at most ``LINEAR_TO_SRGB_LUT_MAX_ERROR``.
+    """
+    x = max(0.0, min(1.0, c)) * LINEAR_TO_SRGB_LUT_SIZE
+    i = min(int(x), LINEAR_TO_SRGB_LUT_SIZE - 1)
+    f = x - i
+    lo = _LINEAR_TO_SRGB_LUT_LIST[i]
+    return lo + (_LINEAR_TO_SRGB_LUT_LIST[i + 1] - lo) * f
+
+
+def bytes_to_linear_array(rgb_bytes: np.ndarray, dtype=IMAGE_DTYPE,
+                          out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Convert an array of 8-bit sRGB code values to scene linear.
+
+    Single table ``take`` — no transfer math is evaluated per element. Byte
+    input is screen/image data, so the result defaults to IMAGE_DTYPE.
+
+    Args:
+        rgb_bytes: Integer array (typically uint8) of values in [0, 255]
+        dtype: Result dtype (float32 or float64); ignored when out is given
+        out: Optional output buffer
+
+    Returns:
+        np.ndarray: Float array of the same shape in scene linear space
+    """
+    if out is not None:
+        dtype = out.dtype
+    # mode='clip': the default 'raise' buffers the whole result before
+    # copying it into out; byte codes are in range anyway
+    return _BYTE_TO_LINEAR_BY_DTYPE[np.dtype(dtype)].take(rgb_bytes, out=out, mode='clip')
+
+
+def linear_to_srgb_lut_array(linear: np.ndarray, dtype=None,
+                             out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Convert an array of scene linear values to sRGB using the interpolated table.
+
+    Error vs ``linear_to_srgb_array`` is at most ``LINEAR_TO_SRGB_LUT_MAX_ERROR``
+    (plus float32 rounding for float32 data).
+    """
+    x = as_float_array(linear, dtype, out)
+    x = np.clip(x, 0.0, 1.0, out=np.empty_like(x) if out is None else out)
+    x *= LINEAR_TO_SRGB_LUT_SIZE
+    i = x.astype(np.intp)
+    np.minimum(i, LINEAR_TO_SRGB_LUT_SIZE - 1, out=i)
+    np.subtract(x, i, out=x, casting='unsafe')
+    x *= _LINEAR_TO_SRGB_SLOPE_BY_DTYPE[x.dtype].take(i)
+    x += _LINEAR_TO_SRGB_LUT_BY_DTYPE[x.dtype].take(i)
+    return x
+
+
+def linear_to_bytes_array(linear: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of scene linear values to 8-bit sRGB code values.
+
+    Exact: equivalent to ``round(linear_to_srgb(c) * 255)`` per element, for
+    float32 input as well (searched against up-rounded float32 thresholds,
+    so the data is never up-cast).
+
+    Returns:
+        np.ndarray: uint8 array of the same shape
+    """
+    linear = np.asarray(linear)
+    thresholds = (_LINEAR_BYTE_THRESHOLDS_F32 if linear.dtype == np.float32
+                  else _LINEAR_BYTE_THRESHOLDS)
+    return np.searchsorted(thresholds, linear, side='right').astype(np.uint8)
+
+
 def rgb_bytes_to_linear(rgb_bytes: tuple[int, int, int]) -> tuple[float, float, float]:
     """
     Convert RGB bytes (0-255) to scene linear float values.
@@ -83,8 +292,7 @@ def rgb_bytes_to_linear(rgb_bytes: tuple[int, int, int]) -> tuple[float, float,
     Returns:
         tuple: (r, g, b) in scene linear space [0.0, 1.0]
     """
-    rgb_srgb = tuple(c / 255.0 for c in rgb_bytes)
-    return rgb_srgb_to_linear(rgb_srgb)
+    return tuple(_BYTE_TO_LINEAR_LIST[max(0, min(255, int(round(c))))] for c in rgb_bytes[:3])
 
 
 def rgb_linear_to_bytes(rgb_linear: tuple[float, float, float]) -> tuple[int, int, int]:
@@ -97,8 +305,7 @@ def rgb_linear_to_bytes(rgb_linear: tuple[float, float, float]) -> tuple[int, in
     Returns:
         tuple: (r, g, b) as integers in range [0, 255] (sRGB)
     """
-    rgb_srgb = rgb_linear_to_srgb(rgb_linear)
-    return tuple(round(c * 255) for c in rgb_srgb)
+    return tuple(bisect_right(_LINEAR_BYTE_THRESHOLDS_LIST, c) for c in rgb_linear[:3])
 
 
 def hex_to_linear(hex_str: str) -> tuple[float, float, float]:
@@ -136,13 +343,237 @@ def linear_to_hex(rgb_linear: tuple[float, float, float]) -> str:
     return "#{:02X}{:02X}{:02X}".format(*rgb_bytes)
 
 
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+_HEX_INVALID = '00000000'
+
+
+def _normalize_hex(value) -> str | None:
+    """Expand '#RGB' / '#RRGGBB' / '#RRGGBBAA' to 'RRGGBBAA', or None if invalid."""
+    if not isinstance(value, str):
+        return None
+    h = value.strip().lstrip('#')
+    n = len(h)
+    if n == 6:
+        h += 'FF'
+    elif n == 3:
+        h = h[0] * 2 + h[1] * 2 + h[2] * 2 + 'FF'
+    elif n != 8:
+        return None
+    if not _HEX_DIGITS.issuperset(h):
+        return None
+    return h
+
+
+def hex_array_to_linear(hex_strs, with_alpha: bool = False,
+                        dtype=UI_DTYPE) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert many hex color strings to scene linear RGB in one pass.
+
+    Accepts '#RGB', '#RRGGBB' and '#RRGGBBAA' (leading '#' optional). All
+    entries are decoded with a single bytes.fromhex and one table take().
+
+    Args:
+        hex_strs: Sequence of hex strings
+        with_alpha: Also return alpha (linear, not transfer-encoded) as a 4th column
+        dtype: Result dtype (UI data, so float64 by default)
+
+    Returns:
+        tuple: (colors, valid) — colors is (N, 3) or (N, 4) floats in scene
+               linear space; valid is an (N,) bool mask. Invalid entries are
+               zero in colors and False in valid rather than silently black.
+    """
+    normalized = [_normalize_hex(h) for h in hex_strs]
+    valid = np.fromiter((h is not None for h in normalized), dtype=bool, count=len(normalized))
+    joined = ''.join(h if h is not None else _HEX_INVALID for h in normalized)
+    raw = np.frombuffer(bytes.fromhex(joined), dtype=np.uint8).reshape(-1, 4)
+
+    colors = np.empty((len(raw), 4 if with_alpha else 3), dtype=dtype)
+    colors[:, :3] = bytes_to_linear_array(raw[:, :3], dtype)
+    if with_alpha:
+        colors[:, 3] = raw[:, 3] / 255.0
+    colors[~valid] = 0.0
+    return colors, valid
+
+
+def linear_array_to_hex(rgb_linear: np.ndarray) -> list[str]:
+    """
+    Convert many scene linear colors to hex strings in one pass.
+
+    Args:
+        rgb_linear: (..., 3) array → '#RRGGBB', or (..., 4) with linear alpha
+                    → '#RRGGBBAA'; a single (3,) / (4,) color gives one string
+
+    Returns:
+        list: Upper-case hex strings (empty for empty input)
+
+    Raises:
+        ValueError: If the last axis is not 3 or 4
+    """
+    colors = np.asarray(rgb_linear)
+    if not colors.size:
+        return []
+    channels = colors.shape[-1]
+    if channels not in (3, 4):
+        raise ValueError(f"Expected 3 or 4 channels in the last axis, got shape {colors.shape}")
+    colors = colors.reshape(-1, channels)
+    raw = np.empty((len(colors), 4 if channels >= 4 else 3), dtype=np.uint8)
+    raw[:, :3] = linear_to_bytes_array(colors[:, :3])
+    if channels >= 4:
+        raw[:, 3] = np.rint(np.clip(colors[:, 3], 0.0, 1.0) * 255.0)
+    width = raw.shape[1] * 2
+    text = raw.tobytes().hex().upper()
+    return ['#' + text[i:i + width] for i in range(0, len(text), width)]
+
+
+# ---------------------------------------------------------------------------
+# Blackbody (color temperature)
+# ---------------------------------------------------------------------------
+# Planck's law integrated against the Wyman–Sloan–Shirley analytic fit of the
+# CIE 1931 2° observer (380–780 nm, 5 nm steps), converted XYZ → Rec.709
+# linear, negatives clipped and normalized so the largest channel is 1.
+#
+# The table is evenly spaced in mired (1e6 / K) rather than Kelvin: color
+# changes roughly uniformly per mired, so 1000 K and 40000 K get the same
+# relative precision and a lookup is one multiply plus a lerp. Entries are
+# stored at unit luminance, which is smooth in temperature; the max-channel
+# normalization (which has a kink where red stops being the brightest
+# channel, near 6500 K) is applied after interpolation. With
+# BLACKBODY_LUT_SIZE entries the max error against the exact integral is
+# BLACKBODY_LUT_MAX_ERROR.
+
+BLACKBODY_MIN_K = 1000.0
+BLACKBODY_MAX_K = 40000.0
+BLACKBODY_LUT_SIZE = 512
+BLACKBODY_LUT_MAX_ERROR = 1.5e-4
+
+_XYZ_D65_TO_RGB = np.array([
+    [ 3.2409699419045226, -1.5373831775700935, -0.4986107602930034],
+    [-0.9692436362808796,  1.8759675015077204,  0.0415550574071756],
+    [ 0.0556300796969936, -0.2039769588889765,  1.0569715142428784],
+])
+
+
+def _cmf_lobe(wl, mu, sigma_lo, sigma_hi):
+    """Piecewise Gaussian used by the Wyman–Sloan–Shirley CMF fit."""
+    t = (wl - mu) / np.where(wl < mu, sigma_lo, sigma_hi)
+    return np.exp(-0.5 * t * t)
+
+
+_CMF_WAVELENGTHS = np.arange(380.0, 781.0, 5.0)
+_CMF = np.stack([
+    1.056 * _cmf_lobe(_CMF_WAVELENGTHS, 599.8, 37.9, 31.0)
+    + 0.362 * _cmf_lobe(_CMF_WAVELENGTHS, 442.0, 16.0, 26.7)
+    - 0.065 * _cmf_lobe(_CMF_WAVELENGTHS, 501.1, 20.4, 26.2),
+    0.821 * _cmf_lobe(_CMF_WAVELENGTHS, 568.8, 46.9, 40.5)
+    + 0.286 * _cmf_lobe(_CMF_WAVELENGTHS, 530.9, 16.3, 31.1),
+    1.217 * _cmf_lobe(_CMF_WAVELENGTHS, 437.0, 11.8, 36.0)
+    + 0.681 * _cmf_lobe(_CMF_WAVELENGTHS, 459.0, 26.0, 13.8),
+])
+
+
+def _planck_to_linear(kelvin: np.ndarray, normalize: bool = True) -> np.ndarray:
+    """
+    Exact (table-free) blackbody color, (N,) Kelvin → (N, 3) linear Rec.709.
+
+    normalize=True scales the brightest channel to 1, otherwise luminance is 1.
+    """
+    wl = _CMF_WAVELENGTHS * 1e-9
+    t = np.asarray(kelvin, dtype=np.float64).reshape(-1, 1)
+    # Spectral radiance up to a constant factor (cancelled by normalization)
+    radiance = 1.0 / (wl ** 5 * np.expm1(1.4387769e-2 / (wl * t)))
+    xyz = radiance @ _CMF.T
+    rgb = (xyz / xyz[:, 1:2]) @ _XYZ_D65_TO_RGB.T
+    np.maximum(rgb, 0.0, out=rgb)
+    if normalize:
+        rgb /= rgb.max(axis=1, keepdims=True)
+    return rgb
+
+
+_BLACKBODY_MIRED_MIN = 1e6 / BLACKBODY_MAX_K
+_BLACKBODY_MIRED_STEP = (1e6 / BLACKBODY_MIN_K - _BLACKBODY_MIRED_MIN) / (BLACKBODY_LUT_SIZE - 1)
+_BLACKBODY_LUT = _planck_to_linear(
+    1e6 / (_BLACKBODY_MIRED_MIN + _BLACKBODY_MIRED_STEP * np.arange(BLACKBODY_LUT_SIZE)),
+    normalize=False)
+_BLACKBODY_LUT_LIST = tuple(tuple(float(v) for v in row) for row in _BLACKBODY_LUT)
+_BLACKBODY_LUT_BY_DTYPE = _per_dtype(_BLACKBODY_LUT)
+
+
+def blackbody_to_linear(kelvin: float) -> tuple[float, float, float]:
+    """
+    Normalized scene linear color of a blackbody at the given temperature.
+
+    Args:
+        kelvin: Temperature, clamped to BLACKBODY_MIN_K..BLACKBODY_MAX_K
+
+    Returns:
+        tuple: (r, g, b) linear Rec.709, brightest channel = 1
+    """
+    kelvin = min(max(kelvin, BLACKBODY_MIN_K), BLACKBODY_MAX_K)
+    pos = (1e6 / kelvin - _BLACKBODY_MIRED_MIN) / _BLACKBODY_MIRED_STEP
+    i = min(int(pos), BLACKBODY_LUT_SIZE - 2)
+    f = pos - i
+    lo = _BLACKBODY_LUT_LIST[i]
+    hi = _BLACKBODY_LUT_LIST[i + 1]
+    r = lo[0] + (hi[0] - lo[0]) * f
+    g = lo[1] + (hi[1] - lo[1]) * f
+    b = lo[2] + (hi[2] - lo[2]) * f
+    peak = max(r, g, b)
+    return (r / peak, g / peak, b / peak)
+
+
+def blackbody_to_linear_array(kelvin: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Vectorized blackbody_to_linear.
+
+    Args:
+        kelvin: Array of temperatures (any shape)
+        dtype: Result dtype (see dtype policy)
+
+    Returns:
+        np.ndarray: Shape kelvin.shape + (3,)
+    """
+    kelvin = np.clip(as_float_array(kelvin, dtype), BLACKBODY_MIN_K, BLACKBODY_MAX_K)
+    pos = 1e6 / kelvin
+    pos -= _BLACKBODY_MIRED_MIN
+    pos /= _BLACKBODY_MIRED_STEP
+    i = np.minimum(pos.astype(np.intp), BLACKBODY_LUT_SIZE - 2)
+    pos -= i
+    lut = _BLACKBODY_LUT_BY_DTYPE[pos.dtype]
+    lo = lut[i]
+    rgb = lut[i + 1]
+    rgb -= lo
+    rgb *= pos[..., None]
+    rgb += lo
+    rgb /= rgb.max(axis=-1, keepdims=True)
+    return rgb
+
+
 __all__ = [
+    'IMAGE_DTYPE',
+    'UI_DTYPE',
+    'as_float_array',
     'srgb_to_linear',
     'linear_to_srgb',
     'rgb_srgb_to_linear',
     'rgb_linear_to_srgb',
+    'srgb_to_linear_array',
+    'linear_to_srgb_array',
+    'linear_to_srgb_lut',
+    'linear_to_srgb_lut_array',
+    'bytes_to_linear_array',
+    'linear_to_bytes_array',
+    'LINEAR_TO_SRGB_LUT_SIZE',
+    'LINEAR_TO_SRGB_LUT_MAX_ERROR',
     'rgb_bytes_to_linear',
     'rgb_linear_to_bytes',
     'hex_to_linear',
-    'linear_to_hex'
+    'linear_to_hex',
+    'hex_array_to_linear',
+    'linear_array_to_hex',
+    'blackbody_to_linear',
+    'blackbody_to_linear_array',
+    'BLACKBODY_MIN_K',
+    'BLACKBODY_MAX_K',
+    'BLACKBODY_LUT_SIZE',
+    'BLACKBODY_LUT_MAX_ERROR',
 ]
@@ -0,0 +1,239 @@
+"""
+Composable color-space conversion graph.
+
+Color spaces are nodes; conversions are edges that are either a 3×3 matrix
+or an array function. convert(src, dst, data) resolves the shortest path
+once, fuses every run of consecutive matrix edges into a single matrix, and
+caches the compiled ConversionPlan, so repeated conversions pay for neither
+the path search nor intermediate tuples.
+
+All edges operate on (..., 3) arrays; plans accept a single 3-tuple as well
+and hand a tuple back. Only the destination space is clamped — intermediate
+values pass through fused matrices unclamped.
+"""
+
+from collections import deque
+import numpy as np
+from .COLORAIDE_colorspace import (
+    srgb_to_linear_array,
+    linear_to_srgb_array,
+    bytes_to_linear_array,
+    linear_to_bytes_array,
+    as_float_array,
+)
+from .COLORAIDE_utils import (
+    _RGB_TO_XYZ_D50,
+    _XYZ_D50_TO_RGB,
+    _RGB_TO_OKLMS,
+    _OKLMS_TO_OKLAB,
+    _OKLAB_TO_OKLMS,
+    _OKLMS_TO_RGB,
+    xyz_to_lab_array,
+    lab_to_xyz_array,
+    rgb_to_hsv_array,
+    hsv_to_rgb_array,
+    rgb_to_hsl_array,
+    hsl_to_rgb_array,
+    oklab_to_oklch_array,
+    oklch_to_oklab_array,
+)
+
+# space name -> (lo, hi) clamp applied when the space is a plan's destination
+_SPACES: dict = {}
+# src -> {dst: ('matrix', ndarray) | ('func', callable)}
+_EDGES: dict = {}
+# (src, dst) -> ConversionPlan
+_PLANS: dict = {}
+
+
+def register_space(name, clamp=None):
+    """
+    Add a color space node.
+
+    Args:
+        name: Space identifier, e.g. 'linear' or 'lab'
+        clamp: Optional (lo, hi) range enforced on results converted *into*
+               this space (matches the clamping of the scalar API)
+    """
+    _SPACES[name] = clamp
+    _EDGES.setdefault(name, {})
+    _PLANS.clear()
+
+
+def register_edge(src, dst, matrix=None, func=None):
+    """
+    Add a one-way conversion. Exactly one of matrix (3×3) or func is given;
+    func maps a (..., 3) array to a (..., 3) array.
+    """
+    if (matrix is None) == (func is None):
+        raise ValueError("register_edge needs exactly one of matrix or func")
+    for name in (src, dst):
+        if name not in _SPACES:
+            raise KeyError(f"Unknown color space '{name}'")
+    if matrix is not None:
+        _EDGES[src][dst] = ('matrix', np.asarray(matrix, dtype=np.float64))
+    else:
+        _EDGES[src][dst] = ('func', func)
+    _PLANS.clear()
+
+
+class ConversionPlan:
+    """A compiled src → dst conversion: fused matrices and functions in order."""
+
+    def __init__(self, src, dst, path, steps, clamp):
+        self.src = src
+        self.dst = dst
+        self.path = path
+        self.steps = steps
+        self.clamp = clamp
+
+    def __repr__(self):
+        kinds = ' → '.join(kind for kind, _ in self.steps) or 'identity'
+        return f"<ConversionPlan {' → '.join(self.path)} [{kinds}]>"
+
+    def apply_array(self, data: np.ndarray) -> np.ndarray:
+        """Run the plan on a (..., 3) array (float32 stays float32, see dtype policy)."""
+        out = as_float_array(data)
+        for kind, op in self.steps:
+            out = out @ op.T.astype(out.dtype, copy=False) if kind == 'matrix' else op(out)
+        if self.clamp is not None:
+            out = np.clip(out, *self.clamp)
+        return out
+
+    def apply(self, color) -> tuple:
+        """Run the plan on a single 3-tuple; returns a tuple of Python numbers."""
+        return tuple(self.apply_array(np.asarray(color[:3])).tolist())
+
+    __call__ = apply_array
+
+
+def _find_path(src, dst):
+    """Fewest-edge path from src to dst (breadth-first)."""
+    previous = {src: None}
+    queue = deque([src])
+    while queue:
+        node = queue.popleft()
+        if node == dst:
+            break
+        for nxt in _EDGES.get(node, ()):
+            if nxt not in previous:
+                previous[nxt] = node
+                queue.append(nxt)
+    if dst not in previous:
+        raise ValueError(f"No conversion path from '{src}' to '{dst}'")
+    path = [dst]
+    while path[-1] != src:
+        path.append(previous[path[-1]])
+    return path[::-1]
+
+
+def _compile(src, dst):
+    path = _find_path(src, dst)
+    steps = []
+    for a, b in zip(path, path[1:]):
+        kind, op = _EDGES[a][b]
+        if kind == 'matrix' and steps and steps[-1][0] == 'matrix':
+            steps[-1] = ('matrix', op @ steps[-1][1])
+        else:
+            steps.append((kind, op))
+    return ConversionPlan(src, dst, path, steps, _SPACES[dst])
+
+
+def get_plan(src, dst) -> ConversionPlan:
+    """Return the cached compiled plan for src → dst, compiling on first use."""
+    key = (src, dst)
+    plan = _PLANS.get(key)
+    if plan is None:
+        for name in key:
+            if name not in _SPACES:
+                raise KeyError(f"Unknown color space '{name}'")
+        plan = _compile(src, dst)
+        _PLANS[key] = plan
+    return plan
+
+
+def convert(src, dst, data):
+    """
+    Convert color data between any two registered spaces.
+
+    Args:
+        src: Source space name
+        dst: Target space name
+        data: (..., 3) ndarray, or a single (c0, c1, c2) tuple/list
+
+    Returns:
+        ndarray for array input, tuple for tuple/list input
+    """
+    plan = get_plan(src, dst)
+    if isinstance(data, np.ndarray):
+        return plan.apply_array(data)
+    return plan.apply(data)
+
+
+def _bytes_to_linear(data):
+    return bytes_to_linear_array(np.clip(np.rint(data), 0, 255).astype(np.intp), data.dtype)
+
+
+def _cbrt(data):
+    return np.cbrt(data)
+
+
+def _cube(data):
+    return data * data * data
+
+
+# ---------------------------------------------------------------------------
+# Built-in spaces
+# ---------------------------------------------------------------------------
+#   linear     scene linear RGB [0, 1]
+#   srgb       sRGB-encoded RGB [0, 1]
+#   bytes      sRGB-encoded RGB [0, 255] (integers)
+#   hsv / hsl  each channel [0, 1], computed on linear RGB (as the sliders are)
+#   xyz_d50    CIE XYZ, D50 adapted (Bradford)
+#   lab        CIELAB (D50)
+#   oklms      Oklab's linear LMS
+#   oklms_cbrt cube-rooted LMS (intermediate)
+#   oklab      Oklab (L, a, b)
+#   oklch      OkLCh (L, C, h°)
+
+register_space('linear', clamp=(0.0, 1.0))
+register_space('srgb', clamp=(0.0, 1.0))
+register_space('bytes')
+register_space('hsv')
+register_space('hsl')
+register_space('xyz_d50')
+register_space('lab')
+register_space('oklms')
+register_space('oklms_cbrt')
+register_space('oklab')
+register_space('oklch')
+
+register_edge('linear', 'srgb', func=linear_to_srgb_array)
+register_edge('srgb', 'linear', func=srgb_to_linear_array)
+register_edge('linear', 'bytes', func=linear_to_bytes_array)
+register_edge('bytes', 'linear', func=_bytes_to_linear)
+register_edge('linear', 'hsv', func=rgb_to_hsv_array)
+register_edge('hsv', 'linear', func=hsv_to_rgb_array)
+register_edge('linear', 'hsl', func=rgb_to_hsl_array)
+register_edge('hsl', 'linear', func=hsl_to_rgb_array)
+register_edge('linear', 'xyz_d50', matrix=_RGB_TO_XYZ_D50)
+register_edge('xyz_d50', 'linear', matrix=_XYZ_D50_TO_RGB)
+register_edge('xyz_d50', 'lab', func=xyz_to_lab_array)
+register_edge('lab', 'xyz_d50', func=lab_to_xyz_array)
+register_edge('linear', 'oklms', matrix=_RGB_TO_OKLMS)
+register_edge('oklms', 'linear', matrix=_OKLMS_TO_RGB)
+register_edge('oklms', 'oklms_cbrt', func=_cbrt)
+register_edge('oklms_cbrt', 'oklms', func=_cube)
+register_edge('oklms_cbrt', 'oklab', matrix=_OKLMS_TO_OKLAB)
+register_edge('oklab', 'oklms_cbrt', matrix=_OKLAB_TO_OKLMS)
+register_edge('oklab', 'oklch', func=oklab_to_oklch_array)
+register_edge('oklch', 'oklab', func=oklch_to_oklab_array)
+
+
+__all__ = [
+    'ConversionPlan',
+    'register_space',
+    'register_edge',
+    'get_plan',
+    'convert',
+]
@@ -0,0 +1,232 @@
+"""
+OCIO-aware conversion engine for scenes that are not linear Rec.709.
+
+Coloraide's math (COLORAIDE_colorspace / COLORAIDE_utils) assumes scene linear
+means linear sRGB/Rec.709 primaries. For ACEScg or other working spaces that
+gives wrong hex/LAB values. This module reads the scene's color management
+through Blender's bundled PyOpenColorIO and bakes what it needs once:
+
+  - a 3×3 matrix  scene_linear → linear Rec.709 (and its inverse), probed from
+    the scene_linear → cie_xyz_d65_interchange processor;
+  - a 65³ 3D LUT  scene_linear → display/view, on an sRGB-shaped domain, used
+    for swatches drawn outside Blender's color management.
+
+Engines are cached per (config, display, view) in COLORAIDE_state. The
+config path is resolved once, and while the scene's display and view are
+unchanged get_active_engine() returns the active engine without a lookup.
+When PyOpenColorIO or the config is unavailable, or the scene is already
+linear Rec.709, no engine is active and callers keep using the plain sRGB
+math.
+"""
+
+import os
+import bpy
+import numpy as np
+from .COLORAIDE_colorspace import _XYZ_D65_TO_RGB, linear_to_srgb_array, srgb_to_linear_array
+from . import COLORAIDE_state as _state
+
+try:
+    import PyOpenColorIO as OCIO
+except ImportError:
+    OCIO = None
+
+# Edge length of the baked display/view LUT.
+DISPLAY_LUT_SIZE = 65
+
+# Matrices closer than this to identity are treated as identity.
+_IDENTITY_TOLERANCE = 1e-4
+
+
+def _apply_cpu(cpu, rgb):
+    """Run an (N, 3) array through an OCIO CPU processor."""
+    buf = np.ascontiguousarray(rgb, dtype=np.float32).copy()
+    out = cpu.applyRGB(buf)
+    if out is None:
+        return buf
+    return np.asarray(out, dtype=np.float32).reshape(buf.shape)
+
+
+def _trilinear(lut, coords):
+    """
+    Sample an (N, N, N, 3) LUT at (..., 3) coordinates in [0, 1].
+    """
+    n = lut.shape[0] - 1
+    x = np.clip(coords, 0.0, 1.0) * n
+    i0 = np.minimum(x.astype(np.intp), n - 1)
+    f = x - i0
+    r0, g0, b0 = i0[..., 0], i0[..., 1], i0[..., 2]
+    fr, fg, fb = f[..., 0:1], f[..., 1:2], f[..., 2:3]
+
+    c000 = lut[r0, g0, b0];         c100 = lut[r0 + 1, g0, b0]
+    c010 = lut[r0, g0 + 1, b0];     c110 = lut[r0 + 1, g0 + 1, b0]
+    c001 = lut[r0, g0, b0 + 1];     c101 = lut[r0 + 1, g0, b0 + 1]
+    c011 = lut[r0, g0 + 1, b0 + 1]; c111 = lut[r0 + 1, g0 + 1, b0 + 1]
+
+    c00 = c000 + (c100 - c000) * fr
+    c10 = c010 + (c110 - c010) * fr
+    c01 = c001 + (c101 - c001) * fr
+    c11 = c011 + (c111 - c011) * fr
+    c0 = c00 + (c10 - c00) * fg
+    c1 = c01 + (c11 - c01) * fg
+    return c0 + (c1 - c0) * fb
+
+
+class OCIOEngine:
+    """Baked transforms for one OCIO config + scene linear + display/view."""
+
+    def __init__(self, key, to_rec709, display_lut):
+        self.key = key
+        self.to_rec709 = to_rec709
+        self.from_rec709 = np.linalg.inv(to_rec709)
+        self.display_lut = display_lut
+        self.is_identity = bool(np.allclose(to_rec709, np.eye(3), atol=_IDENTITY_TOLERANCE))
+        self._to_rows = tuple(tuple(float(v) for v in row) for row in self.to_rec709)
+        self._from_rows = tuple(tuple(float(v) for v in row) for row in self.from_rec709)
+
+    @staticmethod
+    def _mul(rows, rgb):
+        r, g, b = rgb[:3]
+        return tuple(r * m0 + g * m1 + b * m2 for m0, m1, m2 in rows)
+
+    def scene_to_rec709(self, rgb):
+        """Scene linear (r, g, b) → linear Rec.709 (r, g, b)."""
+        return self._mul(self._to_rows, rgb)
+
+    def rec709_to_scene(self, rgb):
+        """Linear Rec.709 (r, g, b) → scene linear (r, g, b), clamped to [0, 1]."""
+        return tuple(max(0.0, min(1.0, c)) for c in self._mul(self._from_rows, rgb))
+
+    def scene_to_rec709_array(self, rgb: np.ndarray) -> np.ndarray:
+        """Scene linear (..., 3) → linear Rec.709 (..., 3)."""
+        return np.asarray(rgb) @ self.to_rec709.T
+
+    def rec709_to_scene_array(self, rgb: np.ndarray) -> np.ndarray:
+        """Linear Rec.709 (..., 3) → scene linear (..., 3), clamped to [0, 1]."""
+        return np.clip(np.asarray(rgb) @ self.from_rec709.T, 0.0, 1.0)
+
+    def to_display_array(self, rgb: np.ndarray) -> np.ndarray:
+        """Scene linear (..., 3) → display-encoded (..., 3) through the scene's view."""
+        return _trilinear(self.display_lut, linear_to_srgb_array(rgb))
+
+    def to_display(self, rgb):
+        """Scene linear (r, g, b) → display-encoded (r, g, b) through the scene's view."""
+        return tuple(float(c) for c in self.to_display_array(np.array(rgb[:3], dtype=np.float64)))
+
+
+# ---------------------------------------------------------------------------
+# Config discovery and baking
+# ---------------------------------------------------------------------------
+
+def is_ocio_available():
+    """True when Blender's bundled PyOpenColorIO can be imported."""
+    return OCIO is not None
+
+
+def _config_path():
+    """Config path, resolved once per session (file system lookups)."""
+    if _state.ocio_config_path is None:
+        _state.ocio_config_path = _find_config_path() or ''
+    return _state.ocio_config_path or None
+
+
+def _find_config_path():
+    path = os.environ.get('OCIO')
+    if path and os.path.isfile(path):
+        return path
+    try:
+        path = bpy.utils.system_resource('DATAFILES', path="colormanagement/config.ocio")
+    except Exception:
+        return None
+    return path if path and os.path.isfile(path) else None
+
+
+def _load_config(path):
+    config = _state.ocio_configs.get(path)
+    if config is None:
+        config = OCIO.Config.CreateFromFile(path)
+        _state.ocio_configs[path] = config
+    return config
+
+
+def _bake(config, key, scene_linear, display, view):
+    # scene_linear → XYZ D65 must be linear for the matrix to be exact;
+    # probe the basis vectors and check an off-axis point.
+    to_xyz = config.getProcessor(scene_linear, OCIO.ROLE_INTERCHANGE_DISPLAY).getDefaultCPUProcessor()
+    probe = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1], [0.25, 0.5, 0.75]], dtype=np.float32)
+    xyz = _apply_cpu(to_xyz, probe).astype(np.float64)
+    basis = xyz[:3].T
+    if not np.allclose(basis @ probe[3], xyz[3], atol=1e-4):
+        print(f"Coloraide: scene_linear '{scene_linear}' is not a linear space, OCIO engine disabled")
+        return None
+    to_rec709 = _XYZ_D65_TO_RGB @ basis
+
+    n = DISPLAY_LUT_SIZE
+    axis = srgb_to_linear_array(np.linspace(0.0, 1.0, n))
+    grid = np.stack(np.meshgrid(axis, axis, axis, indexing='ij'), axis=-1).reshape(-1, 3)
+    transform = OCIO.DisplayViewTransform(src=scene_linear, display=display, view=view)
+    display_cpu = config.getProcessor(transform).getDefaultCPUProcessor()
+    display_lut = _apply_cpu(display_cpu, grid).reshape(n, n, n, 3)
+
+    return OCIOEngine(key, to_rec709, display_lut)
+
+
+def get_active_engine(context):
+    """
+    Return the OCIOEngine for the scene's color management, or None.
+
+    None means "use the built-in sRGB math": PyOpenColorIO is missing, the
+    config can't be read, or scene linear is already linear Rec.709 (in which
+    case the baked matrix is identity and there is nothing to correct).
+    The color-record cache is cleared whenever the active engine changes.
+    """
+    if OCIO is None:
+        return None
+    scene = getattr(context, 'scene', None)
+    if scene is None:
+        return None
+    view_key = (scene.display_settings.display_device, scene.view_settings.view_transform)
+    if view_key == _state.ocio_view_key:
+        return _state.ocio_engine
+
+    path = _config_path()
+    if path is None:
+        return None
+    key = (path,) + view_key
+
+    if key not in _state.ocio_engines:
+        engine = None
+        try:
+            config = _load_config(key[0])
+            scene_linear = config.getColorSpace(OCIO.ROLE_SCENE_LINEAR).getName()
+            engine = _bake(config, key, scene_linear, key[1], key[2])
+        except Exception as e:
+            print(f"Coloraide: OCIO engine unavailable ({e}), using built-in sRGB math")
+        _state.ocio_engines[key] = engine
+
+    engine = _state.ocio_engines[key]
+    if engine is not None and engine.is_identity:
+        engine = None
+    _state.ocio_view_key = view_key
+    if engine is not _state.ocio_engine:
+        from .COLORAIDE_color_record import clear_color_records
+        _state.ocio_engine = engine
+        clear_color_records()
+    return engine
+
+
+def clear_ocio_cache():
+    """Forget loaded configs and baked engines (e.g. after a file load)."""
+    _state.ocio_configs.clear()
+    _state.ocio_engines.clear()
+    _state.ocio_engine = None
+    _state.ocio_config_path = None
+    _state.ocio_view_key = None
+
+
+__all__ = [
+    'OCIOEngine',
+    'is_ocio_available',
+    'get_active_engine',
+    'clear_ocio_cache',
+    'DISPLAY_LUT_SIZE',
+]
@@ -14,6 +14,7 @@ from .panels.CWHEEL_panel import draw_wheel_panel
 from .panels.RGB_panel import draw_rgb_panel
 from .panels.LAB_panel import draw_lab_panel
 from .panels.HSV_panel import draw_hsv_panel
+from .panels.OKLAB_panel import draw_oklab_panel
 from .panels.HEX_panel import draw_hex_panel
 from .panels.CHISTORY_panel import draw_history_panel
 from .panels.PALETTE_panel import draw_palette_panel
@@ -99,6 +100,7 @@ def draw_coloraide_panels(self, context):
             row.prop(wm.coloraide_display, "show_hsv_sliders", text="HSV", toggle=True)
             row.prop(wm.coloraide_display, "show_rgb_sliders", text="RGB", toggle=True)
             row.prop(wm.coloraide_display, "show_lab_sliders", text="LAB", toggle=True)
+            row.prop(wm.coloraide_display, "show_oklab_sliders", text="OkLCh", toggle=True)
             
             # Draw slider panels directly without their boxes
             col = box.column()
@@ -106,6 +108,8 @@ def draw_coloraide_panels(self, context):
                 draw_rgb_panel(col, context)
             if wm.coloraide_display.show_lab_sliders:
                 draw_lab_panel(col, context)
+            if wm.coloraide_display.show_oklab_sliders:
+                draw_oklab_panel(col, context)
             if wm.coloraide_display.show_hsv_sliders:
                 draw_hsv_panel(col, context)
     
@@ -9,6 +9,18 @@ from bpy.types import PropertyGroup
 
 class ColoraideDisplayProperties(PropertyGroup):
     """Controls visibility of all Coloraide panels and features"""
+
+    def update_show_stats(self, context):
+        """Fill picker statistics from the latest sample when shown."""
+        if self.show_stats:
+            from .operators.CPICKER_OT import refresh_picker_stats
+            refresh_picker_stats(context)
+
+    def update_show_scales(self, context):
+        """Fill the multi-scale means from the latest capture when shown."""
+        if self.show_scales:
+            from .operators.CPICKER_OT import refresh_picker_scales
+            refresh_picker_scales(context)
     
     # Core picker visibility
     show_picker: BoolProperty(
@@ -20,7 +32,16 @@ class ColoraideDisplayProperties(PropertyGroup):
     show_stats: BoolProperty(
         name="Show Color Statistics",
         description="Show color statistics in picker panel",
-        default=False
+        default=False,
+        update=update_show_stats
+    )
+
+    show_scales: BoolProperty(
+        name="Show Sample Scales",
+        description="Show the mean of several nested sample sizes side by side "
+                    "(captured once at the largest size)",
+        default=False,
+        update=update_show_scales
     )
     
     # Color space visibility
@@ -36,6 +57,12 @@ class ColoraideDisplayProperties(PropertyGroup):
         default=False
     )
     
+    show_oklab_sliders: BoolProperty(
+        name="Show Oklab Controls",
+        description="Show Oklab / OkLCh color controls",
+        default=False
+    )
+    
     show_hsv_sliders: BoolProperty(
         name="Show HSV Controls",
         description="Show HSV color controls",
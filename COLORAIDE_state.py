@@ -6,6 +6,8 @@ module and read/write its attributes directly.  Using a single module means
 there is one place to look when debugging race conditions or unexpected state.
 """
 
+from collections import OrderedDict
+
 # ---------------------------------------------------------------------------
 # Update-pipeline guards (prevent recursive sync loops)
 # ---------------------------------------------------------------------------
@@ -23,12 +25,47 @@ is_brush_updating: bool = False
 color_cache: dict = {}
 is_flush_scheduled: bool = False
 
+# ---------------------------------------------------------------------------
+# Color-record LRU (memoized conversions, see COLORAIDE_color_record)
+# ---------------------------------------------------------------------------
+
+color_record_cache: OrderedDict = OrderedDict()
+color_record_hits: int = 0
+color_record_misses: int = 0
+
+# ---------------------------------------------------------------------------
+# OCIO engine cache (see COLORAIDE_ocio)
+# ---------------------------------------------------------------------------
+
+ocio_configs: dict = {}
+ocio_engines: dict = {}
+ocio_engine = None
+# Resolved config path (None: not looked up yet, '' : no config found) and
+# the (display, view) the active engine was resolved for
+ocio_config_path = None
+ocio_view_key = None
+
+# ---------------------------------------------------------------------------
+# Screen picker (see operators/CPICKER_session)
+# ---------------------------------------------------------------------------
+
+# Most recent PickerSession; kept after the operator ends so picker
+# statistics can be filled in on demand from its last sample.
+picker_session = None
+# depsgraph_update_post count while a framebuffer picker runs (part of its capture key)
+depsgraph_updates: int = 0
+# Set by a picker sync; the depsgraph update its own writes cause is not counted
+picker_sync_unseen: bool = False
+
 
 def reset() -> None:
     """Reset all state — called on unregister or file load."""
     global is_updating, update_source, previous_color
     global is_live_sync_updating, is_brush_updating
     global is_flush_scheduled
+    global color_record_hits, color_record_misses
+    global ocio_engine, ocio_config_path, ocio_view_key
+    global picker_session, depsgraph_updates, picker_sync_unseen
 
     is_updating = False
     update_source = None
@@ -37,3 +74,14 @@ def reset() -> None:
     is_brush_updating = False
     color_cache.clear()
     is_flush_scheduled = False
+    color_record_cache.clear()
+    color_record_hits = 0
+    color_record_misses = 0
+    ocio_configs.clear()
+    ocio_engines.clear()
+    ocio_engine = None
+    ocio_config_path = None
+    ocio_view_key = None
+    picker_session = None
+    depsgraph_updates = 0
+    picker_sync_unseen = False
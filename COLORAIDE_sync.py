@@ -7,21 +7,22 @@ FIX: Added recursion guards for live sync updates.
 
 import bpy
 from contextlib import contextmanager
-from .COLORAIDE_utils import (
-    rgb_to_lab,
-    lab_to_rgb,
-    rgb_to_hsv,
-    hsv_to_rgb
-)
-from .COLORAIDE_colorspace import (
-    rgb_linear_to_bytes,
-    rgb_bytes_to_linear,
-    linear_to_hex,
-    hex_to_linear
-)
+from .COLORAIDE_colorspace import hex_to_linear, blackbody_to_linear
+from .COLORAIDE_convert import convert
+from .COLORAIDE_color_record import get_color_record
+from .COLORAIDE_ocio import get_active_engine
 from .COLORAIDE_mode_manager import ModeManager
 from . import COLORAIDE_state as _state
 
+# Slider sources whose values map 1:1 onto a COLORAIDE_convert space
+_SLIDER_SPACES = {
+    'rgb': 'bytes',
+    'lab': 'lab',
+    'oklab': 'oklab',
+    'oklch': 'oklch',
+}
+
+
 @contextmanager
 def update_lock(source=None):
     """Context manager to prevent recursive updates."""
@@ -70,7 +71,7 @@ def sync_all(context, source, color_value, mode='absolute'):
     Args:
         context: Blender context
         source: Source of the color change ('picker', 'wheel', 'rgb', 'hsv', 'lab', 'hex', 
-                'history', 'palette', 'brush', 'object_colors')
+                'history', 'palette', 'brush', 'object_colors', 'kelvin')
         color_value: Color data (format depends on source)
         mode: 'absolute' (default, replace color) or 'relative' (adjust by delta)
     
@@ -80,37 +81,48 @@ def sync_all(context, source, color_value, mode='absolute'):
         - hsv: (h, s, v) where h=0-360, s=0-100, v=0-100
         - lab: (L, a, b) where L=0-100, a=-128-127, b=-128-127
         - hex: "#RRGGBB" string
+        - oklab: (L, a, b) where L=0-1, a/b=-0.4-0.4
+        - oklch: (L, C, h) where L=0-1, C=0-0.4, h=0-360
+        - kelvin: color temperature in Kelvin (1000-40000)
     """
     with update_lock(source) as acquired:
         if not acquired:
             return
 
         wm = context.window_manager
+        engine = get_active_engine(context)
 
         # Convert input to scene linear RGB
         if source in ('picker', 'wheel', 'history', 'palette', 'brush', 'object_colors'):
             rgb_linear = tuple(color_value[:3])
-        elif source == 'rgb':
-            rgb_linear = rgb_bytes_to_linear(color_value)
         elif source == 'hsv':
             h_norm = color_value[0] / 360.0
             s_norm = color_value[1] / 100.0
             v_norm = color_value[2] / 100.0
-            rgb_linear = hsv_to_rgb((h_norm, s_norm, v_norm))
-        elif source == 'lab':
-            rgb_linear = lab_to_rgb(color_value)
+            rgb_linear = convert('hsv', 'linear', (h_norm, s_norm, v_norm))
+        elif source in _SLIDER_SPACES:
+            rgb_linear = convert(_SLIDER_SPACES[source], 'linear', color_value)
         elif source == 'hex':
             rgb_linear = hex_to_linear(color_value)
+        elif source == 'kelvin':
+            rgb_linear = blackbody_to_linear(color_value)
         else:
             print(f"Unknown source: {source}")
             return
 
+        # Slider/hex values use Rec.709 primaries; map back into scene linear
+        if engine is not None and source in ('rgb', 'hsv', 'lab', 'hex', 'oklab', 'oklch', 'kelvin'):
+            rgb_linear = engine.rec709_to_scene(rgb_linear)
+
         # Calculate delta for relative mode
         delta = None
         if mode == 'relative':
             delta = tuple(new - old for new, old in zip(rgb_linear, _state.previous_color))
 
         _state.previous_color = rgb_linear
+
+        # All derived representations come from one memoized record
+        record = get_color_record(rgb_linear)
         
         # Update picker (mean color)
         if source != 'picker':
@@ -126,7 +138,7 @@ def sync_all(context, source, color_value, mode='absolute'):
         
         # Update RGB sliders (convert to bytes)
         if source != 'rgb':
-            rgb_bytes = rgb_linear_to_bytes(rgb_linear)
+            rgb_bytes = record.bytes
             wm.coloraide_rgb.suppress_updates = True
             wm.coloraide_rgb.red = rgb_bytes[0]
             wm.coloraide_rgb.green = rgb_bytes[1]
@@ -139,7 +151,7 @@ def sync_all(context, source, color_value, mode='absolute'):
         
         # Update HSV sliders
         if source != 'hsv':
-            hsv = rgb_to_hsv(rgb_linear)
+            hsv = record.hsv
             wm.coloraide_hsv.suppress_updates = True
             wm.coloraide_hsv.hue = hsv[0] * 360.0
             wm.coloraide_hsv.saturation = hsv[1] * 100.0
@@ -148,16 +160,30 @@ def sync_all(context, source, color_value, mode='absolute'):
         
         # Update LAB sliders
         if source != 'lab':
-            lab = rgb_to_lab(rgb_linear)
+            lab = record.lab
             wm.coloraide_lab.suppress_updates = True
             wm.coloraide_lab.lightness = lab[0]
             wm.coloraide_lab.a = lab[1]
             wm.coloraide_lab.b = lab[2]
             wm.coloraide_lab.suppress_updates = False
         
+        # Update Oklab / OkLCh sliders (the pair not being dragged is kept in step)
+        if source != 'oklab':
+            wm.coloraide_oklab.suppress_updates = True
+            if source != 'oklch':
+                wm.coloraide_oklab.lightness = record.oklab[0]
+            wm.coloraide_oklab.a = record.oklab[1]
+            wm.coloraide_oklab.b = record.oklab[2]
+            wm.coloraide_oklab.suppress_updates = False
+        if source != 'oklch':
+            wm.coloraide_oklab.suppress_updates = True
+            wm.coloraide_oklab.chroma = record.oklch[1]
+            wm.coloraide_oklab.hue = record.oklch[2]
+            wm.coloraide_oklab.suppress_updates = False
+        
         # Update hex input
         if source != 'hex':
-            hex_value = linear_to_hex(rgb_linear)
+            hex_value = record.hex
             wm.coloraide_hex.suppress_updates = True
             wm.coloraide_hex.value = hex_value
             wm.coloraide_hex.prev_value = hex_value
@@ -4,9 +4,10 @@ All color conversion functions work with scene linear RGB as input/output.
 """
 
 import numpy as np
-from math import pow
+from math import pow, cbrt, hypot, atan2, degrees, radians, cos, sin
 from mathutils import Vector
 from .COLORAIDE_colorspace import *
+from .COLORAIDE_colorspace import _XYZ_D65_TO_RGB
 
 def rgb_to_hsv(rgb_linear: tuple[float, float, float]) -> tuple[float, float, float]:
     """
@@ -82,6 +83,198 @@ def hsv_to_rgb(hsv: tuple[float, float, float]) -> tuple[float, float, float]:
         return (v, p, q)
 
 
+def rgb_to_hsl(rgb_linear: tuple[float, float, float]) -> tuple[float, float, float]:
+    """
+    Convert scene linear RGB to HSL.
+
+    Args:
+        rgb_linear: Tuple of (r, g, b) in scene linear space [0.0, 1.0]
+
+    Returns:
+        tuple: (h, s, l) where h is [0.0, 1.0], s is [0.0, 1.0], l is [0.0, 1.0]
+    """
+    h, s_v, v = rgb_to_hsv(rgb_linear)
+    l = v * (1 - s_v / 2)
+    if l <= 0 or l >= 1:
+        return (h, 0.0, l)
+    return (h, (v - l) / min(l, 1 - l), l)
+
+
+def hsl_to_rgb(hsl: tuple[float, float, float]) -> tuple[float, float, float]:
+    """
+    Convert HSL to scene linear RGB.
+
+    Args:
+        hsl: Tuple of (h, s, l) where h is [0.0, 1.0], s is [0.0, 1.0], l is [0.0, 1.0]
+
+    Returns:
+        tuple: (r, g, b) in scene linear space [0.0, 1.0]
+    """
+    h, s_l, l = hsl
+    v = l + s_l * min(l, 1 - l)
+    s_v = 0.0 if v == 0 else 2 * (1 - l / v)
+    return hsv_to_rgb((h, s_v, v))
+
+
+def _hue_array(rgb: np.ndarray, max_val: np.ndarray, diff: np.ndarray) -> np.ndarray:
+    """Shared hue kernel for the HSV/HSL array conversions (h in [0, 1])."""
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    safe = np.where(diff == 0, 1, diff)
+    return np.select(
+        [diff == 0, max_val == r, max_val == g],
+        [0.0,
+         (60 * ((g - b) / safe) + 360) % 360 / 360,
+         (60 * ((b - r) / safe) + 120) / 360],
+        (60 * ((r - g) / safe) + 240) / 360,
+    )
+
+
+def rgb_to_hsv_array(rgb_linear: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of scene linear RGB colors to HSV.
+
+    Args:
+        rgb_linear: Array of shape (..., 3) in scene linear space [0.0, 1.0]
+        dtype: Result dtype (see the dtype policy in COLORAIDE_colorspace)
+
+    Returns:
+        np.ndarray: Array of shape (..., 3) with h, s, v each in [0.0, 1.0]
+    """
+    rgb = as_float_array(rgb_linear, dtype)
+    max_val = rgb.max(axis=-1)
+    diff = max_val - rgb.min(axis=-1)
+
+    hsv = np.empty(rgb.shape, dtype=rgb.dtype)
+    hsv[..., 0] = _hue_array(rgb, max_val, diff)
+    hsv[..., 1] = np.where(max_val == 0, 0, diff / np.where(max_val == 0, 1, max_val))
+    hsv[..., 2] = max_val
+    return hsv
+
+
+def hsv_to_rgb_array(hsv: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of HSV colors to scene linear RGB.
+
+    The six hue sectors are selected with masks rather than branches.
+
+    Args:
+        hsv: Array of shape (..., 3) with h, s, v each in [0.0, 1.0]
+        dtype: Result dtype (see the dtype policy in COLORAIDE_colorspace)
+
+    Returns:
+        np.ndarray: Array of shape (..., 3) in scene linear space [0.0, 1.0]
+    """
+    hsv = as_float_array(hsv, dtype)
+    h, s, v = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+
+    # Wrap 1.0 back to 0.0
+    h = np.where(h == 1.0, 0.0, h) * 6
+    i = np.trunc(h)
+    f = h - i
+    p = v * (1 - s)
+    q = v * (1 - s * f)
+    t = v * (1 - s * (1 - f))
+
+    sectors = [i == 0, i == 1, i == 2, i == 3, i == 4]
+    rgb = np.empty(np.broadcast(hsv, f[..., None]).shape, dtype=hsv.dtype)
+    rgb[..., 0] = np.select(sectors, [v, q, p, p, t], v)
+    rgb[..., 1] = np.select(sectors, [t, v, v, q, p], p)
+    rgb[..., 2] = np.select(sectors, [p, p, t, v, v], q)
+    return rgb
+
+
+def rgb_to_hsl_array(rgb_linear: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of scene linear RGB colors to HSL.
+
+    Args:
+        rgb_linear: Array of shape (..., 3) in scene linear space [0.0, 1.0]
+        dtype: Result dtype (see the dtype policy in COLORAIDE_colorspace)
+
+    Returns:
+        np.ndarray: Array of shape (..., 3) with h, s, l each in [0.0, 1.0]
+    """
+    hsl = rgb_to_hsv_array(rgb_linear, dtype)
+    s_v, v = hsl[..., 1], hsl[..., 2]
+    l = v * (1 - s_v / 2)
+    edge = (l <= 0) | (l >= 1)
+    hsl[..., 1] = np.where(edge, 0, (v - l) / np.where(edge, 1, np.minimum(l, 1 - l)))
+    hsl[..., 2] = l
+    return hsl
+
+
+def hsl_to_rgb_array(hsl: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of HSL colors to scene linear RGB.
+
+    Args:
+        hsl: Array of shape (..., 3) with h, s, l each in [0.0, 1.0]
+        dtype: Result dtype (see the dtype policy in COLORAIDE_colorspace)
+
+    Returns:
+        np.ndarray: Array of shape (..., 3) in scene linear space [0.0, 1.0]
+    """
+    hsl = as_float_array(hsl, dtype)
+    h, s_l, l = hsl[..., 0], hsl[..., 1], hsl[..., 2]
+    v = l + s_l * np.minimum(l, 1 - l)
+
+    hsv = np.empty(hsl.shape, dtype=hsl.dtype)
+    hsv[..., 0] = h
+    hsv[..., 1] = np.where(v == 0, 0, 2 * (1 - l / np.where(v == 0, 1, v)))
+    hsv[..., 2] = v
+    return hsv_to_rgb_array(hsv)
+
+
+# ---------------------------------------------------------------------------
+# XYZ / LAB constants
+# ---------------------------------------------------------------------------
+# The RGB→XYZ(D65) matrix and the Bradford D65→D50 adaptation are fused into
+# one 3×3 at import, so each conversion is a single matrix product.
+
+_RGB_TO_XYZ_D65 = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+_BRADFORD_D65_TO_D50 = np.array([
+    [ 1.0478112, 0.0228866, -0.0501270],
+    [ 0.0295424, 0.9904844, -0.0170491],
+    [-0.0092345, 0.0150436,  0.7521316],
+])
+_BRADFORD_D50_TO_D65 = np.array([
+    [ 0.9555766, -0.0230393, 0.0631636],
+    [-0.0282895,  1.0099416, 0.0210077],
+    [ 0.0122982, -0.0204830, 1.3299098],
+])
+
+_RGB_TO_XYZ_D50 = _BRADFORD_D65_TO_D50 @ _RGB_TO_XYZ_D65
+_XYZ_D50_TO_RGB = _XYZ_D65_TO_RGB @ _BRADFORD_D50_TO_D65
+_RGB_TO_XYZ_D50_ROWS = tuple(tuple(float(v) for v in row) for row in _RGB_TO_XYZ_D50)
+_XYZ_D50_TO_RGB_ROWS = tuple(tuple(float(v) for v in row) for row in _XYZ_D50_TO_RGB)
+
+# D50 reference white
+_D50_WHITE = (0.96422, 1.00000, 0.82521)
+_D50_WHITE_ARRAY = np.array(_D50_WHITE)
+
+# ICC constants
+_LAB_EPSILON = 216.0 / 24389.0
+_LAB_KAPPA = 24389.0 / 27.0
+
+
+def _lab_f(t: float) -> float:
+    """ICC standard XYZ → LAB companding function."""
+    if t > _LAB_EPSILON:
+        return pow(t, 1.0/3.0)
+    return (_LAB_KAPPA * t + 16) / 116
+
+
+def _lab_f_inv(t: float) -> float:
+    """Inverse of ``_lab_f``."""
+    if t > 6.0/29.0:
+        return t * t * t
+    return (116.0 * t - 16.0) / _LAB_KAPPA
+
+
 def rgb_to_xyz(rgb_linear: tuple[float, float, float]) -> tuple[float, float, float]:
     """
     Convert scene linear RGB to XYZ color space (D50).
@@ -93,18 +286,10 @@ def rgb_to_xyz(rgb_linear: tuple[float, float, float]) -> tuple[float, float, fl
         tuple: (x, y, z) in XYZ D50 color space
     """
     r, g, b = rgb_linear
-    
-    # Convert to XYZ
-    x = r * 0.4124564 + g * 0.3575761 + b * 0.1804375
-    y = r * 0.2126729 + g * 0.7151522 + b * 0.0721750
-    z = r * 0.0193339 + g * 0.1191920 + b * 0.9503041
-    
-    # Bradford transformation D65 -> D50
-    x_d50 = x * 1.0478112 + y * 0.0228866 + z * -0.0501270
-    y_d50 = x * 0.0295424 + y * 0.9904844 + z * -0.0170491
-    z_d50 = x * -0.0092345 + y * 0.0150436 + z * 0.7521316
-    
-    return (x_d50, y_d50, z_d50)
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = _RGB_TO_XYZ_D50_ROWS
+    return (r * m00 + g * m01 + b * m02,
+            r * m10 + g * m11 + b * m12,
+            r * m20 + g * m21 + b * m22)
 
 
 def xyz_to_lab(xyz: tuple[float, float, float]) -> tuple[float, float, float]:
@@ -118,30 +303,11 @@ def xyz_to_lab(xyz: tuple[float, float, float]) -> tuple[float, float, float]:
         tuple: (L, a, b) where L is [0, 100], a is [-128, 127], b is [-128, 127]
     """
     x, y, z = xyz
+    ref_x, ref_y, ref_z = _D50_WHITE
     
-    # D50 reference white
-    ref_x = 0.96422
-    ref_y = 1.00000
-    ref_z = 0.82521
-    
-    # Constants
-    epsilon = 216.0 / 24389.0
-    kappa = 24389.0 / 27.0
-    
-    # Scale by white point
-    xr = x / ref_x
-    yr = y / ref_y
-    zr = z / ref_z
-    
-    # ICC standard conversion function
-    def f(t):
-        if t > epsilon:
-            return pow(t, 1.0/3.0)
-        return (kappa * t + 16) / 116
-    
-    fx = f(xr)
-    fy = f(yr)
-    fz = f(zr)
+    fx = _lab_f(x / ref_x)
+    fy = _lab_f(y / ref_y)
+    fz = _lab_f(z / ref_z)
     
     L = 116 * fy - 16
     a = 500 * (fx - fy)
@@ -166,15 +332,7 @@ def lab_to_xyz(lab: tuple[float, float, float]) -> tuple[float, float, float]:
         tuple: (x, y, z) in XYZ D50 color space
     """
     L, a, b = lab
-    
-    # ICC constants
-    epsilon = 216.0 / 24389.0
-    kappa = 24389.0 / 27.0
-    
-    # D50 reference white
-    ref_x = 0.96422
-    ref_y = 1.00000
-    ref_z = 0.82521
+    ref_x, ref_y, ref_z = _D50_WHITE
     
     # Special handling for L=0
     if L < 0.01:
@@ -185,16 +343,9 @@ def lab_to_xyz(lab: tuple[float, float, float]) -> tuple[float, float, float]:
     fx = fy + (a / 500.0)
     fz = fy - (b / 200.0)
     
-    # Modified f_inv function
-    def f_inv(t):
-        t3 = t * t * t
-        if t > 6.0/29.0:
-            return t3
-        return (116.0 * t - 16.0) / kappa
-    
-    x = ref_x * f_inv(fx)
-    y = ref_y * f_inv(fy)
-    z = ref_z * f_inv(fz)
+    x = ref_x * _lab_f_inv(fx)
+    y = ref_y * _lab_f_inv(fy)
+    z = ref_z * _lab_f_inv(fz)
     
     # Clamp to valid range
     x = max(0, x)
@@ -215,16 +366,10 @@ def xyz_to_rgb(xyz: tuple[float, float, float]) -> tuple[float, float, float]:
         tuple: (r, g, b) in scene linear space [0.0, 1.0]
     """
     x, y, z = xyz
-    
-    # Bradford matrix D50 -> D65
-    x_d65 = x * 0.9555766 + y * -0.0230393 + z * 0.0631636
-    y_d65 = x * -0.0282895 + y * 1.0099416 + z * 0.0210077
-    z_d65 = x * 0.0122982 + y * -0.0204830 + z * 1.3299098
-    
-    # RGB D65 matrix
-    r = x_d65 *  3.2409699419045226 - y_d65 * 1.5373831775700935 - z_d65 * 0.4986107602930034
-    g = x_d65 * -0.9692436362808796 + y_d65 * 1.8759675015077204 + z_d65 * 0.0415550574071756
-    b = x_d65 *  0.0556300796969936 - y_d65 * 0.2039769588889765 + z_d65 * 1.0569715142428784
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = _XYZ_D50_TO_RGB_ROWS
+    r = x * m00 + y * m01 + z * m02
+    g = x * m10 + y * m11 + z * m12
+    b = x * m20 + y * m21 + z * m22
     
     # Clamp to valid range (already linear, no conversion needed)
     r = max(0.0, min(1.0, r))
@@ -234,6 +379,113 @@ def xyz_to_rgb(xyz: tuple[float, float, float]) -> tuple[float, float, float]:
     return (r, g, b)
 
 
+def rgb_to_xyz_array(rgb_linear: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of scene linear RGB colors to XYZ D50.
+
+    Args:
+        rgb_linear: Array of shape (..., 3) in scene linear space
+        dtype: Result dtype (see the dtype policy in COLORAIDE_colorspace)
+
+    Returns:
+        np.ndarray: Array of shape (..., 3) in XYZ D50 color space
+    """
+    rgb = as_float_array(rgb_linear, dtype)
+    return rgb @ _RGB_TO_XYZ_D50.T.astype(rgb.dtype, copy=False)
+
+
+def xyz_to_rgb_array(xyz: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of XYZ D50 colors to scene linear RGB, clamped to [0, 1].
+
+    Args:
+        xyz: Array of shape (..., 3) in XYZ D50 color space
+        dtype: Result dtype (see the dtype policy in COLORAIDE_colorspace)
+
+    Returns:
+        np.ndarray: Array of shape (..., 3) in scene linear space [0.0, 1.0]
+    """
+    xyz = as_float_array(xyz, dtype)
+    rgb = xyz @ _XYZ_D50_TO_RGB.T.astype(xyz.dtype, copy=False)
+    return np.clip(rgb, 0.0, 1.0, out=rgb)
+
+
+def xyz_to_lab_array(xyz: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of XYZ D50 colors to LAB.
+
+    Args:
+        xyz: Array of shape (..., 3) in XYZ D50 color space
+        dtype: Result dtype (see the dtype policy in COLORAIDE_colorspace)
+
+    Returns:
+        np.ndarray: Array of shape (..., 3) with L in [0, 100], a/b in [-128, 127]
+    """
+    xyz = as_float_array(xyz, dtype)
+    t = xyz / _D50_WHITE_ARRAY.astype(xyz.dtype)
+    f = np.where(t > _LAB_EPSILON, np.cbrt(t), (_LAB_KAPPA * t + 16) / 116)
+    fx, fy, fz = f[..., 0], f[..., 1], f[..., 2]
+
+    lab = np.empty(f.shape, dtype=f.dtype)
+    lab[..., 0] = np.clip(116 * fy - 16, 0, 100)
+    lab[..., 1] = np.clip(500 * (fx - fy), -128, 127)
+    lab[..., 2] = np.clip(200 * (fy - fz), -128, 127)
+    return lab
+
+
+def lab_to_xyz_array(lab: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of LAB colors to XYZ D50.
+
+    Args:
+        lab: Array of shape (..., 3) with L in [0, 100], a/b in [-128, 127]
+        dtype: Result dtype (see the dtype policy in COLORAIDE_colorspace)
+
+    Returns:
+        np.ndarray: Array of shape (..., 3) in XYZ D50 color space
+    """
+    lab = as_float_array(lab, dtype)
+    L = lab[..., 0]
+    fy = np.where(L < 0.01, 16.0 / 116.0, (L + 16.0) / 116.0)
+
+    f = np.empty(lab.shape, dtype=fy.dtype)
+    f[..., 0] = fy + lab[..., 1] / 500.0
+    f[..., 1] = fy
+    f[..., 2] = fy - lab[..., 2] / 200.0
+
+    xyz = np.where(f > 6.0/29.0, f * f * f, (116.0 * f - 16.0) / _LAB_KAPPA)
+    xyz *= _D50_WHITE_ARRAY.astype(xyz.dtype)
+    return np.maximum(xyz, 0.0, out=xyz)
+
+
+def rgb_to_lab_array(rgb_linear: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of scene linear RGB colors to LAB.
+
+    Args:
+        rgb_linear: Array of shape (..., 3), e.g. (N, 3), in scene linear space
+        dtype: Result dtype (see the dtype policy in COLORAIDE_colorspace)
+
+    Returns:
+        np.ndarray: Array of shape (..., 3) with L in [0, 100], a/b in [-128, 127]
+    """
+    return xyz_to_lab_array(rgb_to_xyz_array(rgb_linear, dtype))
+
+
+def lab_to_rgb_array(lab: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of LAB colors to scene linear RGB.
+
+    Args:
+        lab: Array of shape (..., 3) with L in [0, 100], a/b in [-128, 127]
+        dtype: Result dtype (see the dtype policy in COLORAIDE_colorspace)
+
+    Returns:
+        np.ndarray: Array of shape (..., 3) in scene linear space [0.0, 1.0]
+    """
+    return xyz_to_rgb_array(lab_to_xyz_array(lab, dtype))
+
+
 def rgb_to_lab(rgb_linear: tuple[float, float, float]) -> tuple[float, float, float]:
     """
     Convert scene linear RGB to LAB.
@@ -244,8 +496,7 @@ def rgb_to_lab(rgb_linear: tuple[float, float, float]) -> tuple[float, float, fl
     Returns:
         tuple: (L, a, b) where L is [0, 100], a is [-128, 127], b is [-128, 127]
     """
-    xyz = rgb_to_xyz(rgb_linear)
-    return xyz_to_lab(xyz)
+    return xyz_to_lab(rgb_to_xyz(rgb_linear[:3]))
 
 
 def lab_to_rgb(lab: tuple[float, float, float]) -> tuple[float, float, float]:
@@ -258,8 +509,148 @@ def lab_to_rgb(lab: tuple[float, float, float]) -> tuple[float, float, float]:
     Returns:
         tuple: (r, g, b) in scene linear space [0.0, 1.0]
     """
-    xyz = lab_to_xyz(lab)
-    return xyz_to_rgb(xyz)
+    return xyz_to_rgb(lab_to_xyz(lab[:3]))
+
+
+# ---------------------------------------------------------------------------
+# Oklab / OkLCh
+# ---------------------------------------------------------------------------
+# Björn Ottosson's Oklab, defined directly on linear sRGB: one matrix, an
+# unconditional cube root, one matrix. No white-point adaptation needed.
+
+_RGB_TO_OKLMS = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+_OKLMS_TO_OKLAB = np.array([
+    [0.2104542553,  0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050,  0.4505937099],
+    [0.0259040371,  0.7827717662, -0.8086757660],
+])
+# Inverses derived rather than copied so round trips are exact to float precision
+_OKLAB_TO_OKLMS = np.linalg.inv(_OKLMS_TO_OKLAB)
+_OKLMS_TO_RGB = np.linalg.inv(_RGB_TO_OKLMS)
+_RGB_TO_OKLMS_ROWS = tuple(tuple(float(v) for v in row) for row in _RGB_TO_OKLMS)
+_OKLMS_TO_OKLAB_ROWS = tuple(tuple(float(v) for v in row) for row in _OKLMS_TO_OKLAB)
+_OKLAB_TO_OKLMS_ROWS = tuple(tuple(float(v) for v in row) for row in _OKLAB_TO_OKLMS)
+_OKLMS_TO_RGB_ROWS = tuple(tuple(float(v) for v in row) for row in _OKLMS_TO_RGB)
+
+
+def _mat3_mul(rows, v):
+    x, y, z = v
+    return tuple(x * m0 + y * m1 + z * m2 for m0, m1, m2 in rows)
+
+
+def rgb_to_oklab(rgb_linear: tuple[float, float, float]) -> tuple[float, float, float]:
+    """
+    Convert scene linear RGB to Oklab.
+
+    Args:
+        rgb_linear: Tuple of (r, g, b) in scene linear space [0.0, 1.0]
+
+    Returns:
+        tuple: (L, a, b) where L is [0.0, 1.0], a and b are roughly [-0.4, 0.4]
+    """
+    lms = _mat3_mul(_RGB_TO_OKLMS_ROWS, rgb_linear[:3])
+    return _mat3_mul(_OKLMS_TO_OKLAB_ROWS, tuple(cbrt(c) for c in lms))
+
+
+def oklab_to_rgb(oklab: tuple[float, float, float]) -> tuple[float, float, float]:
+    """
+    Convert Oklab to scene linear RGB, clamped to [0, 1].
+
+    Args:
+        oklab: Tuple of (L, a, b) where L is [0.0, 1.0]
+
+    Returns:
+        tuple: (r, g, b) in scene linear space [0.0, 1.0]
+    """
+    lms_ = _mat3_mul(_OKLAB_TO_OKLMS_ROWS, oklab[:3])
+    rgb = _mat3_mul(_OKLMS_TO_RGB_ROWS, tuple(c * c * c for c in lms_))
+    return tuple(max(0.0, min(1.0, c)) for c in rgb)
+
+
+def oklab_to_oklch(oklab: tuple[float, float, float]) -> tuple[float, float, float]:
+    """
+    Convert Oklab to OkLCh.
+
+    Returns:
+        tuple: (L, C, h) where h is in degrees [0, 360)
+    """
+    L, a, b = oklab
+    return (L, hypot(a, b), degrees(atan2(b, a)) % 360.0)
+
+
+def oklch_to_oklab(oklch: tuple[float, float, float]) -> tuple[float, float, float]:
+    """
+    Convert OkLCh (h in degrees) to Oklab.
+    """
+    L, C, h = oklch
+    h = radians(h)
+    return (L, C * cos(h), C * sin(h))
+
+
+def rgb_to_oklch(rgb_linear: tuple[float, float, float]) -> tuple[float, float, float]:
+    """Convert scene linear RGB to OkLCh (h in degrees)."""
+    return oklab_to_oklch(rgb_to_oklab(rgb_linear))
+
+
+def oklch_to_rgb(oklch: tuple[float, float, float]) -> tuple[float, float, float]:
+    """Convert OkLCh (h in degrees) to scene linear RGB, clamped to [0, 1]."""
+    return oklab_to_rgb(oklch_to_oklab(oklch))
+
+
+def rgb_to_oklab_array(rgb_linear: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of scene linear RGB colors to Oklab.
+
+    Args:
+        rgb_linear: Array of shape (..., 3) in scene linear space
+        dtype: Result dtype (see the dtype policy in COLORAIDE_colorspace)
+
+    Returns:
+        np.ndarray: Array of shape (..., 3) of (L, a, b)
+    """
+    rgb = as_float_array(rgb_linear, dtype)
+    lms_ = np.cbrt(rgb @ _RGB_TO_OKLMS.T.astype(rgb.dtype, copy=False))
+    return lms_ @ _OKLMS_TO_OKLAB.T.astype(rgb.dtype, copy=False)
+
+
+def oklab_to_rgb_array(oklab: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of Oklab colors to scene linear RGB, clamped to [0, 1].
+    """
+    oklab = as_float_array(oklab, dtype)
+    lms = oklab @ _OKLAB_TO_OKLMS.T.astype(oklab.dtype, copy=False)
+    lms *= lms * lms
+    rgb = lms @ _OKLMS_TO_RGB.T.astype(oklab.dtype, copy=False)
+    return np.clip(rgb, 0.0, 1.0, out=rgb)
+
+
+def oklab_to_oklch_array(oklab: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of Oklab colors to OkLCh (h in degrees [0, 360)).
+    """
+    oklab = as_float_array(oklab, dtype)
+    lch = np.empty(oklab.shape, dtype=oklab.dtype)
+    lch[..., 0] = oklab[..., 0]
+    lch[..., 1] = np.hypot(oklab[..., 1], oklab[..., 2])
+    lch[..., 2] = np.degrees(np.arctan2(oklab[..., 2], oklab[..., 1])) % 360.0
+    return lch
+
+
+def oklch_to_oklab_array(oklch: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Convert an array of OkLCh colors (h in degrees) to Oklab.
+    """
+    oklch = as_float_array(oklch, dtype)
+    h = np.radians(oklch[..., 2])
+    lab = np.empty(oklch.shape, dtype=oklch.dtype)
+    lab[..., 0] = oklch[..., 0]
+    lab[..., 1] = oklch[..., 1] * np.cos(h)
+    lab[..., 2] = oklch[..., 1] * np.sin(h)
+    return lab
 
 
 def get_barycentric_weights(p: Vector, a: Vector, b: Vector, c: Vector) -> tuple[float, float, float]:
@@ -307,15 +698,182 @@ def color_statistics(colors: np.ndarray) -> dict | None:
     return stats
 
 
+def histogram_percentile_bins(histogram: np.ndarray, count: int, qs) -> np.ndarray:
+    """
+    Percentile bins of a per-channel histogram in O(bins), nearest-rank method.
+
+    Args:
+        histogram: (channels, bins) integer counts, each row summing to count
+        count: Number of samples in the histogram
+        qs: Sequence of percentiles in [0, 100]
+
+    Returns:
+        np.ndarray: (len(qs), channels) bin indices
+    """
+    qs = np.asarray(qs, dtype=np.float64).reshape(-1)
+    cumulative = np.cumsum(histogram, axis=1)
+    # First bin whose cumulative count reaches the rank
+    ranks = np.maximum(np.ceil(qs / 100.0 * count), 1)
+    out = np.empty((len(qs), len(histogram)), dtype=np.intp)
+    for c in range(len(histogram)):
+        out[:, c] = np.searchsorted(cumulative[c], ranks)
+    return out
+
+
+class ColorStatsAccumulator:
+    """
+    Running color statistics over sample batches, without keeping the samples.
+
+    Mean and variance use Welford's algorithm with Chan's batch merge, min/max
+    are tracked per channel, and a fixed-bin histogram per channel gives
+    approximate percentiles (error ≤ half a bin width). Each update() is
+    O(batch); memory is O(channels × bins) regardless of how many samples
+    have been seen. Per-batch scratch is kept and grown as needed, so
+    repeated updates of similar size do not allocate.
+
+    Args:
+        bins: Histogram bins per channel
+        value_range: (lo, hi) histogram domain; values outside are clamped
+        channels: Number of channels per color
+    """
+
+    def __init__(self, bins: int = 1024, value_range: tuple = (0.0, 1.0), channels: int = 3):
+        self.bins = bins
+        self.value_range = value_range
+        self.channels = channels
+        self.histogram = np.zeros((channels, bins), dtype=np.int64)
+        self._offsets = np.arange(channels) * bins
+        self._deviation = np.empty((0, channels))
+        self._index = np.empty((0, channels), dtype=np.intp)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything (start of a new picking session)."""
+        self.count = 0
+        self.mean = np.zeros(self.channels)
+        self._m2 = np.zeros(self.channels)
+        self.min = np.full(self.channels, np.inf)
+        self.max = np.full(self.channels, -np.inf)
+        self.histogram.fill(0)
+
+    def update(self, colors: np.ndarray) -> None:
+        """
+        Merge a batch of colors.
+
+        Args:
+            colors: Array of shape (N, channels) (or anything reshapeable to it)
+        """
+        batch = np.asarray(colors).reshape(-1, self.channels)
+        n = len(batch)
+        if not n:
+            return
+
+        if len(self._index) < n or self._deviation.dtype != batch.dtype:
+            self._deviation = np.empty((max(n, len(self._index)), self.channels), dtype=batch.dtype)
+            self._index = np.empty((len(self._deviation), self.channels), dtype=np.intp)
+        deviation = self._deviation[:n]
+        index = self._index[:n]
+
+        batch_mean = batch.mean(axis=0)
+        np.subtract(batch, batch_mean, out=deviation, casting='unsafe')
+        np.square(deviation, out=deviation)
+        batch_m2 = deviation.sum(axis=0)
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean += delta * (n / total)
+        self._m2 += batch_m2 + delta * delta * (self.count * n / total)
+        self.count = total
+
+        np.minimum(self.min, batch.min(axis=0), out=self.min)
+        np.maximum(self.max, batch.max(axis=0), out=self.max)
+
+        lo, hi = self.value_range
+        np.subtract(batch, lo, out=deviation, casting='unsafe')
+        deviation *= self.bins / (hi - lo)
+        np.copyto(index, deviation, casting='unsafe')
+        np.clip(index, 0, self.bins - 1, out=index)
+        index += self._offsets
+        # bincount rather than np.add.at: add.at is several times slower on
+        # the NumPy releases bundled with Blender
+        self.histogram += np.bincount(
+            index.reshape(-1), minlength=self.histogram.size).reshape(self.histogram.shape)
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Population variance per channel."""
+        return self._m2 / self.count if self.count else np.zeros(self.channels)
+
+    @property
+    def std(self) -> np.ndarray:
+        """Population standard deviation per channel."""
+        return np.sqrt(self.variance)
+
+    def percentiles(self, qs) -> np.ndarray:
+        """
+        Approximate percentiles from the histogram.
+
+        Args:
+            qs: Sequence of percentiles in [0, 100]
+
+        Returns:
+            np.ndarray: (len(qs), channels) values at bin centers
+        """
+        if not self.count:
+            return np.zeros((np.size(qs), self.channels))
+        lo, hi = self.value_range
+        bins = histogram_percentile_bins(self.histogram, self.count, qs)
+        return lo + (bins + 0.5) * ((hi - lo) / self.bins)
+
+    def percentile(self, q: float) -> np.ndarray:
+        """Approximate q-th percentile per channel."""
+        return self.percentiles((q,))[0]
+
+    def statistics(self) -> dict | None:
+        """Same keys as color_statistics() (median is histogram-approximate), plus std."""
+        if not self.count:
+            return None
+        return {
+            'mean': self.mean.copy(),
+            'median': self.percentile(50.0),
+            'min': self.min.copy(),
+            'max': self.max.copy(),
+            'std': self.std,
+        }
+
+
 __all__ = [
     'rgb_to_hsv',
     'hsv_to_rgb',
+    'rgb_to_hsl',
+    'hsl_to_rgb',
+    'rgb_to_hsv_array',
+    'hsv_to_rgb_array',
+    'rgb_to_hsl_array',
+    'hsl_to_rgb_array',
     'rgb_to_lab',
     'lab_to_rgb',
     'rgb_to_xyz',
     'xyz_to_rgb',
     'xyz_to_lab',
     'lab_to_xyz',
+    'rgb_to_xyz_array',
+    'xyz_to_rgb_array',
+    'xyz_to_lab_array',
+    'lab_to_xyz_array',
+    'rgb_to_lab_array',
+    'lab_to_rgb_array',
+    'rgb_to_oklab',
+    'oklab_to_rgb',
+    'oklab_to_oklch',
+    'oklch_to_oklab',
+    'rgb_to_oklch',
+    'oklch_to_rgb',
+    'rgb_to_oklab_array',
+    'oklab_to_rgb_array',
+    'oklab_to_oklch_array',
+    'oklch_to_oklab_array',
     'color_statistics',
+    'ColorStatsAccumulator',
+    'histogram_percentile_bins',
     'get_barycentric_weights',
 ]
@@ -20,6 +20,8 @@ from .COLORAIDE_brush_sync import (sync_coloraide_from_brush, update_brush_color
                                    is_brush_updating)
 from .COLORAIDE_cache import flush_color_cache, clear_cache
 from .COLORAIDE_object_colors import clear_object_cache
+from .COLORAIDE_ocio import clear_ocio_cache
+from .operators.CPICKER_screen import close_native_capture, capture_backend_items
 
 # Import all properties
 from .properties.PALETTE_properties import ColoraidePaletteProperties
@@ -29,6 +31,7 @@ from .properties.CWHEEL_properties import ColoraideWheelProperties
 from .properties.HEX_properties import ColoraideHexProperties
 from .properties.RGB_properties import ColoraideRGBProperties
 from .properties.LAB_properties import ColoraideLABProperties
+from .properties.OKLAB_properties import ColoraideOklabProperties
 from .properties.HSV_properties import ColoraideHSVProperties
 from .properties.CHISTORY_properties import ColoraideHistoryProperties, ColorHistoryItemProperties
 from .COLORAIDE_properties import ColoraideDisplayProperties
@@ -53,6 +56,7 @@ from .panels.CWHEEL_panel import draw_wheel_panel
 from .panels.HEX_panel import draw_hex_panel
 from .panels.RGB_panel import draw_rgb_panel
 from .panels.LAB_panel import draw_lab_panel
+from .panels.OKLAB_panel import draw_oklab_panel
 from .panels.HSV_panel import draw_hsv_panel
 from .panels.CHISTORY_panel import draw_history_panel
 from .panels.PALETTE_panel import draw_palette_panel
@@ -62,7 +66,7 @@ from .COLORAIDE_panel import IMAGE_PT_coloraide, VIEW3D_PT_coloraide, CLIP_PT_co
 from .properties.OBJECT_COLORS_properties import ColorPropertyItem, ColoraideObjectColorsProperties
 from .operators.OBJECT_COLORS_OT import (OBJECT_COLORS_OT_refresh, OBJECT_COLORS_OT_pull, 
                                           OBJECT_COLORS_OT_push, OBJECT_COLORS_OT_update_group_color,
-                                          OBJECT_COLORS_OT_show_tooltip)
+                                          OBJECT_COLORS_OT_show_tooltip, OBJECT_COLORS_OT_set_light_temperature)
 from .panels.OBJECT_COLORS_panel import draw_object_colors_panel
 
 bl_info = {
@@ -172,6 +176,13 @@ class ColoraideAddonPreferences(AddonPreferences):
         default='BATCHED_TIMER'
     )
 
+    capture_backend: EnumProperty(
+        name="Screen Capture",
+        description="How the color picker reads screen pixels",
+        items=capture_backend_items(),
+        default='AUTO'
+    )
+
     def draw(self, context):
         layout = self.layout
 
@@ -214,6 +225,13 @@ class ColoraideAddonPreferences(AddonPreferences):
         
         layout.separator()
 
+        # Color Picker capture backend
+        box = layout.box()
+        box.label(text="Color Picker", icon='EYEDROPPER')
+        box.prop(self, "capture_backend")
+
+        layout.separator()
+
         # Platform / Color Picker notice
         import sys
         if sys.platform == 'darwin':
@@ -273,6 +291,7 @@ classes = [
     ColoraideHexProperties,
     ColoraideRGBProperties,
     ColoraideLABProperties,
+    ColoraideOklabProperties,
     ColoraideHSVProperties,
     ColorHistoryItemProperties,
     ColoraideHistoryProperties,
@@ -283,6 +302,7 @@ classes = [
     OBJECT_COLORS_OT_push,
     OBJECT_COLORS_OT_update_group_color,
     OBJECT_COLORS_OT_show_tooltip,
+    OBJECT_COLORS_OT_set_light_temperature,
     NORMAL_OT_color_picker,
     IMAGE_OT_screen_picker_quick,
     IMAGE_OT_quickpick,
@@ -429,6 +449,7 @@ def cleanup_cache_on_load(dummy):
     """Clear all caches when file loads"""
     clear_cache()
     clear_object_cache()
+    clear_ocio_cache()
 
 
 def register():
@@ -449,6 +470,7 @@ def register():
     bpy.types.WindowManager.coloraide_hex = bpy.props.PointerProperty(type=ColoraideHexProperties)
     bpy.types.WindowManager.coloraide_rgb = bpy.props.PointerProperty(type=ColoraideRGBProperties)
     bpy.types.WindowManager.coloraide_lab = bpy.props.PointerProperty(type=ColoraideLABProperties)
+    bpy.types.WindowManager.coloraide_oklab = bpy.props.PointerProperty(type=ColoraideOklabProperties)
     bpy.types.WindowManager.coloraide_hsv = bpy.props.PointerProperty(type=ColoraideHSVProperties)
     bpy.types.WindowManager.coloraide_history = bpy.props.PointerProperty(type=ColoraideHistoryProperties)
     
@@ -475,6 +497,8 @@ def unregister():
     # Clear all caches before unregistering
     clear_cache()
     clear_object_cache()
+    clear_ocio_cache()
+    close_native_capture()
     
     # Unsubscribe from msgbus
     unsubscribe_from_selection_changes()
@@ -504,6 +528,7 @@ def unregister():
     del bpy.types.WindowManager.coloraide_history
     del bpy.types.WindowManager.coloraide_hsv
     del bpy.types.WindowManager.coloraide_lab
+    del bpy.types.WindowManager.coloraide_oklab
     del bpy.types.WindowManager.coloraide_rgb
     del bpy.types.WindowManager.coloraide_hex
     del bpy.types.WindowManager.coloraide_wheel
@@ -6,8 +6,13 @@ Platform strategy
 macOS  (Metal)  : CGWindowListCreateImage via CoreGraphics ctypes.
                   Requires Screen Recording permission in System Settings.
 Windows (OpenGL/Vulkan) : GDI32 BitBlt via ctypes. No extra permissions.
-Linux           : gpu.state.active_framebuffer_get() in a POST_VIEW draw
+Linux (X11)     : XShmGetImage into a persistent MIT-SHM segment via ctypes.
+Linux (Wayland) : gpu.state.active_framebuffer_get() in a POST_VIEW draw
                   callback (GPU framebuffer is accessible on OpenGL/Vulkan).
+                  The callback only copies pixels; statistics and sync run
+                  from the operator's modal TIMER event. Reads are skipped
+                  while the capture key (cursor, region, view, sample size,
+                  depsgraph updates) is unchanged.
 """
 
 import sys
@@ -18,8 +23,24 @@ from bpy.types import Operator
 from gpu_extras.batch import batch_for_shader
 from ..COLORAIDE_sync import sync_all
 from ..COLORAIDE_sync import is_updating
-from ..COLORAIDE_colorspace import rgb_linear_to_srgb, rgb_srgb_to_linear
-from .CPICKER_screen import sample_at_cursor, is_native_capture_available
+from ..COLORAIDE_colorspace import rgb_srgb_to_linear, IMAGE_DTYPE
+from ..COLORAIDE_color_record import get_color_record
+from ..COLORAIDE_color_distance import delta_e_76
+from .. import COLORAIDE_state as _state
+from .CPICKER_screen import (
+    sample_at_cursor,
+    is_native_capture_available,
+    select_backend,
+    capture_throttle,
+    AUTO_BACKEND,
+)
+from .CPICKER_session import PickerSession, SCALE_SIZES
+
+# Add-on package (preferences key); this module lives in <package>.operators
+_ADDON_PACKAGE = __package__.rpartition('.')[0]
+
+# Modal tick that dispatches samples captured by the framebuffer draw callback
+_DISPATCH_INTERVAL = 1.0 / 60.0
 
 # Vertex data for color preview rectangles
 vertices = ((0, 0), (100, 0), (0, -100), (100, -100))
@@ -36,28 +57,155 @@ except Exception as e:
 # Shared helpers
 # ---------------------------------------------------------------------------
 
-def _apply_sample(context, channels_srgb, mean_srgb, curr_srgb):
-    """Convert sampled sRGB values to scene-linear and push through sync."""
+def _capture_size(context, op):
+    """Capture window size: the sample size, or the largest scale if scales are shown."""
+    if context.window_manager.coloraide_display.show_scales:
+        return max(op.sqrt_length, SCALE_SIZES[-1])
+    return op.sqrt_length
+
+
+def _apply_sample(context, channels_linear, mean_srgb, curr_srgb, session, sample_size=0,
+                  final=False):
+    """
+    Convert sampled sRGB mean/current to scene-linear and push through sync.
+
+    The sample becomes the PickerSession's current sample (merged into the
+    session stats while long-press averaging is on); per-sample
+    max/min/percentiles are only computed and written while the stats are
+    shown.
+
+    With smoothing on, the picked mean is the session smoother's output,
+    except for the final sample, which is committed as sampled.
+    A mean within the picker's sync tolerance of the last synced color only
+    updates the swatches; _commit_pick pushes it on release.
+
+    With scales shown the capture is larger than the sample; the picked
+    sample is then its nested sample_size window.
+
+    The final sample of a pick (release / click) is never synced here;
+    _commit_pick syncs the committed color once.
+    """
     if mean_srgb is None:
         return
+    wm = context.window_manager
+    if wm.coloraide_display.show_scales and sample_size:
+        nested = session.nested_sample(sample_size)
+        if nested is not None:
+            channels_linear, nested_mean = nested
+            mean_srgb = nested_mean or mean_srgb
+        refresh_picker_scales(context, session)
+
+    picker = wm.coloraide_picker
     mean_linear = rgb_srgb_to_linear(tuple(mean_srgb))
     curr_linear = rgb_srgb_to_linear(tuple(curr_srgb))
+    if picker.smoothing != 'NONE' and not final:
+        mean_linear = session.smoother.add(mean_linear, picker.smoothing, picker.smoothing_window)
 
-    wm = context.window_manager
-    if channels_srgb is not None and len(channels_srgb) > 0:
-        channels_linear = np.array([rgb_srgb_to_linear(tuple(c)) for c in channels_srgb])
-        dot = np.sum(channels_linear, axis=1)
-        wm.coloraide_picker.max    = tuple(channels_linear[np.argmax(dot)])
-        wm.coloraide_picker.min    = tuple(channels_linear[np.argmin(dot)])
-        wm.coloraide_picker.median = tuple(np.median(channels_linear, axis=0))
+    if channels_linear is not None and len(channels_linear) > 0:
+        # Session stats only feed the release average
+        session.add_sample(channels_linear, accumulate=picker.use_session_average)
+        if wm.coloraide_display.show_stats:
+            refresh_picker_stats(context, session)
 
     # sync_all skips picker.mean when source='picker' (anti-recursion guard),
     # so we must set mean explicitly here alongside current.
-    wm.coloraide_picker.suppress_updates = True
-    wm.coloraide_picker.mean    = tuple(mean_linear)
-    wm.coloraide_picker.current = tuple(curr_linear)
-    wm.coloraide_picker.suppress_updates = False
-    sync_all(context, 'picker', tuple(mean_linear))
+    picker.suppress_updates = True
+    picker.mean    = tuple(mean_linear)
+    picker.current = tuple(curr_linear)
+    picker.suppress_updates = False
+
+    if final:
+        session.sync_pending = True
+        return
+    if _within_sync_tolerance(picker, mean_linear, session.synced_color):
+        session.sync_pending = True
+        session.syncs_skipped += 1
+        return
+    _sync_picker(context, session, tuple(mean_linear))
+
+
+def _within_sync_tolerance(picker, rgb_linear, synced) -> bool:
+    """True if rgb_linear is too close to the last synced color to sync again."""
+    if synced is None:
+        return False
+    if picker.sync_metric == 'DELTA_E':
+        # Records are cached; the synced one is always a hit, and a
+        # candidate that does get synced is a hit in sync_all
+        delta_e = delta_e_76(get_color_record(rgb_linear).lab, get_color_record(synced).lab)
+        return delta_e < picker.sync_delta_e
+    return max(abs(a - b) for a, b in zip(rgb_linear, synced)) < picker.sync_tolerance
+
+
+def _sync_picker(context, session, rgb_linear):
+    sync_all(context, 'picker', rgb_linear)
+    # The depsgraph evaluates these writes after the modal handler returns
+    _state.picker_sync_unseen = True
+    session.synced_color = rgb_linear
+    session.sync_pending = False
+    session.syncs += 1
+
+
+def _commit_pick(context, session):
+    """
+    On release, decide the committed color and sync it once: the average of
+    every sample taken while held (if enabled), otherwise the last picked
+    mean if it has not been synced yet.
+    """
+    picker = context.window_manager.coloraide_picker
+    session_mean = session.session_mean() if picker.use_session_average else None
+    if session_mean is not None:
+        mean_linear = tuple(min(max(c, 0.0), 1.0) for c in session_mean)
+        picker.suppress_updates = True
+        picker.mean = mean_linear
+        picker.suppress_updates = False
+        _sync_picker(context, session, mean_linear)
+    elif session.sync_pending:
+        _sync_picker(context, session, tuple(picker.mean))
+
+
+def refresh_picker_stats(context, session=None):
+    """
+    Write max/min and p5/median/p95 of the session's current sample to the picker.
+
+    Defaults to the most recent session, so turning the stats display on
+    fills them in from the last sample without capturing again.
+    """
+    session = session or _state.picker_session
+    if session is None:
+        return
+    stats = session.sample_stats()
+    if not stats:
+        return
+    picker = context.window_manager.coloraide_picker
+    picker.max    = stats['max']
+    picker.min    = stats['min']
+    picker.p5     = stats['p5']
+    picker.median = stats['median']
+    picker.p95    = stats['p95']
+
+
+def refresh_picker_scales(context, session=None):
+    """
+    Write the mean of each SCALE_SIZES window of the session's latest
+    capture to the picker (O(1) per size from its summed-area table).
+    """
+    session = session or _state.picker_session
+    if session is None or not session.capture_id:
+        return
+    means = [session.window_mean(size) for size in SCALE_SIZES]
+    if None in means:
+        return
+    picker = context.window_manager.coloraide_picker
+    for size, mean_srgb in zip(SCALE_SIZES, means):
+        setattr(picker, f'mean_{size}', rgb_srgb_to_linear(mean_srgb))
+
+
+def _swatch_color(rgb_linear):
+    """Display-encoded color for a POST_PIXEL swatch (not color managed by Blender)."""
+    engine = _state.ocio_engine
+    if engine is not None:
+        return engine.to_display(tuple(rgb_linear))
+    return get_color_record(rgb_linear).srgb
 
 
 def draw_preview_boxes(op):
@@ -67,45 +215,61 @@ def draw_preview_boxes(op):
     length = op.sqrt_length + 5
     wm = bpy.context.window_manager
 
-    mean_srgb = rgb_linear_to_srgb(tuple(wm.coloraide_picker.mean))
+    mean_srgb = _swatch_color(wm.coloraide_picker.mean)
     fill_shader.uniform_float("color", tuple(list(mean_srgb) + [1.0]))
     verts = tuple((m_x + x + length, m_y + y - length) for x, y in vertices)
     batch_for_shader(fill_shader, 'TRIS', {"pos": verts}, indices=indices).draw(fill_shader)
 
-    curr_srgb = rgb_linear_to_srgb(tuple(wm.coloraide_picker.current))
+    curr_srgb = _swatch_color(wm.coloraide_picker.current)
     fill_shader.uniform_float("color", tuple(list(curr_srgb) + [1.0]))
     verts2 = tuple((m_x + x + length + 100, m_y + y - length) for x, y in vertices)
     batch_for_shader(fill_shader, 'TRIS', {"pos": verts2}, indices=indices).draw(fill_shader)
 
 
 # ---------------------------------------------------------------------------
-# Linux GPU framebuffer path (POST_VIEW draw callback)
+# GPU framebuffer path (POST_VIEW draw callback, Linux without X11 capture)
 # ---------------------------------------------------------------------------
 
 def _gpu_read_colors(op):
     """
-    POST_VIEW draw callback used on Linux.
+    POST_VIEW draw callback used on Linux when X11 capture is unavailable.
     At this point the GPU framebuffer contains the rendered scene (OpenGL/Vulkan).
-    Reads pixel data and pushes to picker state.
+    Only copies the sample window into the operator's preallocated buffer and
+    flags it; _dispatch_gpu_sample does the statistics and sync outside drawing.
+    Redraws that cannot change the sampled pixels (swatch refreshes, events
+    without movement, same frame and scene state) reuse the previous sample
+    instead of reading.
     """
     context = bpy.context
     region  = context.region
-    if region.as_pointer() != op.invoke_region_ptr:
+    region_ptr = region.as_pointer()
+    if region_ptr != op.invoke_region_ptr:
         return
-    if is_updating('picker'):
+    session = op._session
+    key = (
+        op.mouse_region_x, op.mouse_region_y, region_ptr,
+        region.width, region.height, _capture_size(context, op),
+        _state.depsgraph_updates,
+        # Playback can change image/movie/sequencer pixels without a depsgraph update
+        context.scene.frame_current,
+        gpu.matrix.get_model_view_matrix(),
+        gpu.matrix.get_projection_matrix(),
+    )
+    if session.same_capture(key):
         return
 
     fb   = gpu.state.active_framebuffer_get()
     fw   = region.width
     fh   = region.height
-    dist = op.sqrt_length // 2
+    size = _capture_size(context, op)
+    dist = size // 2
     mx   = op.mouse_region_x
     my   = op.mouse_region_y
 
-    sx = max(0, min(mx - dist, fw - op.sqrt_length))
-    sy = max(0, min(my - dist, fh - op.sqrt_length))
-    sw = min(op.sqrt_length, fw - sx)
-    sh = min(op.sqrt_length, fh - sy)
+    sx = max(0, min(mx - dist, fw - size))
+    sy = max(0, min(my - dist, fh - size))
+    sw = min(size, fw - sx)
+    sh = min(size, fh - sy)
     if sw <= 0 or sh <= 0:
         return
 
@@ -114,31 +278,56 @@ def _gpu_read_colors(op):
     except ValueError:
         return
 
-    channels_raw = np.array(area_buf.to_list()).reshape((sw * sh, 3))
-    mean_raw     = np.mean(channels_raw, axis=0)
-    mean_linear  = rgb_srgb_to_linear(tuple(mean_raw))
+    # Pixel under the cursor is inside the area window; no second read_color
+    ix = max(0, min(mx - sx, sw - 1))
+    iy = max(0, min(my - sy, sh - 1))
 
-    px = max(0, min(mx, fw - 1))
-    py = max(0, min(my, fh - 1))
-    try:
-        px_buf = fb.read_color(px, py, 1, 1, 3, 0, 'FLOAT')
-    except ValueError:
+    # View the buffer through the buffer protocol and copy it into the session
+    session.store_float(np.asarray(area_buf, dtype=IMAGE_DTYPE), iy * sw + ix, sw)
+
+
+def _sample_native(context, op, force=False):
+    """macOS/Windows: capture at the cursor and sync, if the throttle allows."""
+    size = _capture_size(context, op)
+    cursor = (op.mouse_region_x, op.mouse_region_y)
+    channels, mean_s, curr_s = sample_at_cursor(size, op._session, cursor=cursor, force=force)
+    if mean_s is None:
         return
-    curr_raw    = np.array(px_buf.to_list()).reshape(-1)
-    curr_linear = rgb_srgb_to_linear(tuple(curr_raw))
+    op._session.move_to(cursor, size)
+    _apply_sample(context, channels, mean_s, curr_s, op._session, op.sqrt_length,
+                  final=force)
+    capture_throttle.end()
 
-    wm = context.window_manager
-    channels_linear = np.array([rgb_srgb_to_linear(tuple(c)) for c in channels_raw])
-    dot = np.sum(channels_linear, axis=1)
-    wm.coloraide_picker.max    = tuple(channels_linear[np.argmax(dot)])
-    wm.coloraide_picker.min    = tuple(channels_linear[np.argmin(dot)])
-    wm.coloraide_picker.median = tuple(np.median(channels_linear, axis=0))
 
-    wm.coloraide_picker.suppress_updates = True
-    wm.coloraide_picker.mean    = tuple(mean_linear)
-    wm.coloraide_picker.current = tuple(curr_linear)
-    wm.coloraide_picker.suppress_updates = False
-    sync_all(context, 'picker', tuple(mean_linear))
+def _dispatch_gpu_sample(context, op, final=False):
+    """Process the latest sample copied by _gpu_read_colors (modal TIMER)."""
+    session = op._session
+    channels_linear, mean_srgb, curr_srgb = session.take_float_sample()
+    session.move_to((op.mouse_region_x, op.mouse_region_y), _capture_size(context, op))
+    _apply_sample(context, channels_linear, mean_srgb, curr_srgb, session, op.sqrt_length,
+                  final=final)
+
+
+def _count_depsgraph_update(scene, depsgraph):
+    """
+    depsgraph_update_post handler: scene changes invalidate the capture key.
+    The picker's own live-sync writes are not counted, otherwise every sync
+    would force a fresh read of an unchanged region. While the modal picker
+    holds input only playback (keyed by frame) can change the scene alongside.
+    """
+    if _state.is_updating or _state.is_live_sync_updating:
+        return
+    if _state.picker_sync_unseen:
+        _state.picker_sync_unseen = False
+        return
+    _state.depsgraph_updates += 1
+
+
+def _use_preferred_backend(context):
+    """Select the capture backend chosen in the add-on preferences."""
+    addon = context.preferences.addons.get(_ADDON_PACKAGE)
+    select_backend(getattr(addon.preferences, 'capture_backend', AUTO_BACKEND)
+                   if addon else AUTO_BACKEND)
 
 
 # ---------------------------------------------------------------------------
@@ -146,12 +335,50 @@ def _gpu_read_colors(op):
 # ---------------------------------------------------------------------------
 
 class _PickerHandlerMixin:
-    """Shared draw-handler teardown for screen picker operators."""
+    """Shared draw-handler/timer teardown and session state for screen picker operators."""
     _draw_handler = None
     _read_handler = None
+    _timer = None
+    _session = None
+
+    def _start_session(self, context):
+        """Fresh buffers and statistics for this press of the picker."""
+        _use_preferred_backend(context)
+        self._session = PickerSession(_capture_size(context, self))
+        _state.picker_session = self._session
+        capture_throttle.reset_counters()
+
+    def _add_read_handler(self, context, space):
+        """No native capture: framebuffer read callback plus the modal tick that dispatches it."""
+        if is_native_capture_available():
+            return
+        self._read_handler = space.draw_handler_add(
+            _gpu_read_colors, (self,), 'WINDOW', 'POST_VIEW')
+        _state.picker_sync_unseen = False
+        if _count_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(_count_depsgraph_update)
+        self._timer = context.window_manager.event_timer_add(
+            _DISPATCH_INTERVAL, window=context.window)
+
+    def _dispatch_pending(self, context, force=False):
+        """
+        Run stats + sync for a sample captured since the last tick, if the
+        throttle allows; a refused sample stays pending for the next tick.
+        """
+        if not self._session.new_sample or is_updating('picker'):
+            return
+        if not capture_throttle.begin((self.mouse_region_x, self.mouse_region_y), force):
+            return
+        _dispatch_gpu_sample(context, self, final=force)
+        capture_throttle.end()
+        # Swatch redraw; the unchanged capture key skips the re-read
+        context.area.tag_redraw()
 
     def _cleanup_handlers(self, context):
         context.window.cursor_modal_restore()
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
         space = getattr(bpy.types, self._handler_space_type, None)
         if space:
             if self._draw_handler:
@@ -160,6 +387,8 @@ class _PickerHandlerMixin:
             if self._read_handler:
                 space.draw_handler_remove(self._read_handler, 'WINDOW')
                 self._read_handler = None
+        if _count_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(_count_depsgraph_update)
 
 
 # ---------------------------------------------------------------------------
@@ -185,6 +414,10 @@ class IMAGE_OT_screen_picker_quick(_PickerHandlerMixin, Operator):
         self._cleanup_handlers(context)
 
     def modal(self, context, event):
+        if event.type == 'TIMER':
+            self._dispatch_pending(context)
+            return {'PASS_THROUGH'}
+
         context.area.tag_redraw()
 
         if event.type in {'MOUSEMOVE', 'LEFTMOUSE'}:
@@ -193,10 +426,12 @@ class IMAGE_OT_screen_picker_quick(_PickerHandlerMixin, Operator):
             self.mouse_region_x = event.mouse_region_x
             self.mouse_region_y = event.mouse_region_y
             if is_native_capture_available() and not is_updating('picker'):
-                channels, mean_s, curr_s = sample_at_cursor(self.sqrt_length)
-                _apply_sample(context, channels, mean_s, curr_s)
+                # The click always samples where it lands
+                _sample_native(context, self, force=event.type == 'LEFTMOUSE')
 
         if event.type == 'LEFTMOUSE':
+            self._dispatch_pending(context, force=True)
+            _commit_pick(context, self._session)
             self.cleanup(context)
             if hasattr(context.window_manager, 'coloraide_history'):
                 context.window_manager.coloraide_history.add_color(
@@ -215,6 +450,7 @@ class IMAGE_OT_screen_picker_quick(_PickerHandlerMixin, Operator):
         self.mouse_region_x = event.mouse_region_x
         self.mouse_region_y = event.mouse_region_y
         self.invoke_region_ptr = context.region.as_pointer()
+        self._start_session(context)
         context.window_manager.modal_handler_add(self)
         context.window.cursor_modal_set('EYEDROPPER')
 
@@ -222,9 +458,7 @@ class IMAGE_OT_screen_picker_quick(_PickerHandlerMixin, Operator):
         space = getattr(bpy.types, self._handler_space_type)
         self._draw_handler = space.draw_handler_add(
             draw_preview_boxes, (self,), 'WINDOW', 'POST_PIXEL')
-        if not is_native_capture_available():
-            self._read_handler = space.draw_handler_add(
-                _gpu_read_colors, (self,), 'WINDOW', 'POST_VIEW')
+        self._add_read_handler(context, space)
         return {'RUNNING_MODAL'}
 
 
@@ -253,9 +487,20 @@ class IMAGE_OT_quickpick(_PickerHandlerMixin, Operator):
                 tuple(context.window_manager.coloraide_picker.mean))
 
     def modal(self, context, event):
+        if event.type == 'TIMER':
+            self._dispatch_pending(context)
+            return {'PASS_THROUGH'}
+
         context.area.tag_redraw()
 
         if event.type == self._key_pressed and event.value == 'RELEASE':
+            # Sample where the key was released, whatever the throttle says
+            if is_native_capture_available() and not is_updating('picker'):
+                self.mouse_region_x = event.mouse_region_x
+                self.mouse_region_y = event.mouse_region_y
+                _sample_native(context, self, force=True)
+            self._dispatch_pending(context, force=True)
+            _commit_pick(context, self._session)
             self.cleanup(context, add_to_history=True)
             return {'FINISHED'}
 
@@ -263,14 +508,14 @@ class IMAGE_OT_quickpick(_PickerHandlerMixin, Operator):
             if is_updating('picker'):
                 return {'PASS_THROUGH'}
             self.sqrt_length   = context.window_manager.coloraide_picker.custom_size
+            self._session.ensure_capacity(_capture_size(context, self))
             self.x             = event.mouse_region_x
             self.y             = event.mouse_region_y
             self.mouse_region_x = event.mouse_region_x
             self.mouse_region_y = event.mouse_region_y
             if is_native_capture_available():
-                channels, mean_s, curr_s = sample_at_cursor(self.sqrt_length)
-                _apply_sample(context, channels, mean_s, curr_s)
-            # Linux: sampling happens in _gpu_read_colors draw callback
+                _sample_native(context, self)
+            # Otherwise sampling happens in the _gpu_read_colors draw callback
 
         elif event.type in {'RIGHTMOUSE', 'ESC'}:
             self.cleanup(context, add_to_history=False)
@@ -286,6 +531,7 @@ class IMAGE_OT_quickpick(_PickerHandlerMixin, Operator):
         self.mouse_region_x = event.mouse_region_x
         self.mouse_region_y = event.mouse_region_y
         self.invoke_region_ptr = context.region.as_pointer()
+        self._start_session(context)
         context.window_manager.modal_handler_add(self)
         context.window.cursor_modal_set('EYEDROPPER')
 
@@ -293,9 +539,7 @@ class IMAGE_OT_quickpick(_PickerHandlerMixin, Operator):
         space = getattr(bpy.types, self._handler_space_type)
         self._draw_handler = space.draw_handler_add(
             draw_preview_boxes, (self,), 'WINDOW', 'POST_PIXEL')
-        if not is_native_capture_available():
-            self._read_handler = space.draw_handler_add(
-                _gpu_read_colors, (self,), 'WINDOW', 'POST_VIEW')
+        self._add_read_handler(context, space)
         return {'RUNNING_MODAL'}
 
 
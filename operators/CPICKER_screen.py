@@ -7,19 +7,152 @@ Strategy per platform:
             Requires Screen Recording permission (System Settings → Privacy & Security).
   Windows — GDI32 BitBlt via ctypes.
             Reads the composited GDI display buffer. No special permissions needed.
-  Linux  — Returns None; caller falls back to GPU framebuffer in a draw callback.
+  Linux  — X11: XShmGetImage via ctypes into a persistent MIT-SHM segment.
+            Reads the composited root window; no redraw needed.
+            Wayland / no MIT-SHM: returns None; caller falls back to the GPU
+            framebuffer in a draw callback.
+
+Each strategy is a CaptureBackend in a registry; select_backend() picks one
+(automatically or from the add-on preferences) and a synthetic backend
+serves generated images so the pixel path runs without a display.
 """
 
+import abc
 import sys
 import time
 import ctypes
 import numpy as np
+from ..COLORAIDE_colorspace import bytes_to_linear_array
+
+# ---------------------------------------------------------------------------
+# Adaptive capture throttle
+# ---------------------------------------------------------------------------
+
+# CGWindowListCreateImage / BitBlt each take ~10-30 ms and the sync after
+# them is not free either; sampling on every MOUSEMOVE queues events up and
+# makes the picker feel laggy. The throttle keeps capture + sync inside a
+# share of the frame budget instead of using a fixed rate.
+FRAME_BUDGET = 1.0 / 60.0
+# Share of each frame the picker may spend capturing and syncing
+BUDGET_SHARE = 0.5
+# Never sample slower than this while the cursor moves
+MAX_INTERVAL = 0.25
+# Still cursor: the interval doubles per repeated sample up to this
+IDLE_MAX_INTERVAL = 1.0
+# Weight of the newest latency in the moving average
+LATENCY_SMOOTHING = 0.25
+
+
+class CaptureThrottle:
+    """
+    Decides when the picker takes its next sample.
+
+    begin() is asked before each capture and end() is called once the
+    sample has been synced, so the measured latency covers capture + sync.
+    The interval is the latency average divided by BUDGET_SHARE, clamped to
+    [FRAME_BUDGET, MAX_INTERVAL]; with the cursor still it backs off
+    towards IDLE_MAX_INTERVAL. force=True (button release) always samples.
+
+    Counters (reset by reset_counters() at the start of each pick):
+        requests  begin() calls
+        samples   captures allowed
+        forced    of which forced
+        throttled refused because the interval had not elapsed
+        idle      of which refused because the cursor was still
+    """
+
+    def __init__(self):
+        self.latency = 0.0
+        self.interval = FRAME_BUDGET
+        self._idle_interval = FRAME_BUDGET
+        self._last_cursor = None
+        self._last_time = float('-inf')
+        self._start = None
+        self.reset_counters()
+
+    def reset_counters(self) -> None:
+        self.requests = 0
+        self.samples = 0
+        self.forced = 0
+        self.throttled = 0
+        self.idle = 0
+        self._first_time = time.perf_counter()
+
+    def begin(self, cursor=None, force: bool = False) -> bool:
+        """
+        True if a sample should be taken now.
+
+        Args:
+            cursor: Cursor position, compared with the last sample's to
+                    detect a still cursor (None disables the back-off)
+            force: Sample regardless of the interval (e.g. on release)
+        """
+        now = time.perf_counter()
+        self.requests += 1
+        still = cursor is not None and cursor == self._last_cursor
+        interval = self._idle_interval if still else self.interval
+        if not force and now - self._last_time < interval:
+            self.throttled += 1
+            if still:
+                self.idle += 1
+            return False
+
+        if still:
+            self._idle_interval = min(self._idle_interval * 2.0, IDLE_MAX_INTERVAL)
+        else:
+            self._idle_interval = self.interval
+        self.samples += 1
+        self.forced += force
+        self._last_cursor = cursor
+        self._last_time = now
+        self._start = now
+        return True
+
+    def end(self) -> None:
+        """Record the latency of the sample started by the last begin()."""
+        if self._start is None:
+            return
+        latency = time.perf_counter() - self._start
+        self._start = None
+        if self.latency:
+            self.latency += LATENCY_SMOOTHING * (latency - self.latency)
+        else:
+            self.latency = latency
+        self.interval = min(max(self.latency / BUDGET_SHARE, FRAME_BUDGET), MAX_INTERVAL)
+
+    @property
+    def effective_rate(self) -> float:
+        """Samples per second since reset_counters()."""
+        elapsed = time.perf_counter() - self._first_time
+        return self.samples / elapsed if elapsed > 0.0 else 0.0
+
+
+capture_throttle = CaptureThrottle()
+
+# ---------------------------------------------------------------------------
+# Shared post-processing
+# ---------------------------------------------------------------------------
+
+def _bgra_to_samples(pixels, session=None):
+    """
+    Convert an (H, W, 4) uint8 BGR(A) capture into picker samples.
+
+    Returns (channels_linear, mean_srgb, curr_srgb). Channels are converted
+    with the 256-entry byte table in one take() — into the PickerSession's
+    linear buffer when a session is given; mean and current stay in
+    sRGB [0,1] so the caller's conversion matches the single-pixel path.
+    """
+    rgb = pixels[:, :, 2::-1]
+    if session is not None:
+        channels = session.linearize_bytes(rgb)
+    else:
+        channels = bytes_to_linear_array(rgb).reshape(-1, 3)
+    count = rgb.shape[0] * rgb.shape[1]
+    mean_srgb = tuple(rgb.sum(axis=(0, 1), dtype=np.uint32) / (255.0 * count))
+    c = rgb[rgb.shape[0] // 2, rgb.shape[1] // 2]
+    curr_srgb = (c[0] / 255.0, c[1] / 255.0, c[2] / 255.0)
+    return channels, mean_srgb, curr_srgb
 
-# Minimum seconds between screen-capture samples (~60 fps cap).
-# CGWindowListCreateImage / BitBlt each take ~10-30 ms; without this cap
-# high-frequency MOUSEMOVE events queue up and make the picker feel laggy.
-_SAMPLE_INTERVAL = 1.0 / 60.0
-_last_sample_time: float = 0.0
 
 # ---------------------------------------------------------------------------
 # macOS — CoreGraphics
@@ -94,9 +227,13 @@ def _cursor_macos():
     return (pos.x, pos.y)
 
 
-def _sample_macos(sqrt_size):
+def _sample_macos(sqrt_size, session=None):
     if not _load_macos():
         return None, None, None
+    if session is not None:
+        # Grow before capturing (HiDPI images can still be larger; see
+        # PickerSession.linearize_bytes)
+        session.ensure_capacity(sqrt_size)
     pos = _cursor_macos()
     if pos is None:
         return None, None, None
@@ -127,28 +264,21 @@ def _sample_macos(sqrt_size):
             _cg.CGImageRelease(img)
             return None, None, None
 
-        length = _cf.CFDataGetLength(data_ref)
-        ptr    = _cf.CFDataGetBytePtr(data_ref)
-        raw    = (ctypes.c_uint8 * length).from_address(ptr)
-        buf    = np.frombuffer(bytes(raw), dtype=np.uint8).copy()
-        _cf.CFRelease(data_ref)
-        _cg.CGImageRelease(img)
-
-        rows = min(img_h, length // bpr)
-        pixels = buf[:rows * bpr].reshape(rows, bpr)[:, :img_w * bpp].reshape(rows, img_w, bpp)
-
-        # CoreGraphics BGRA → RGB
-        r_ch = pixels[:, :, 2].astype(np.float32) / 255.0
-        g_ch = pixels[:, :, 1].astype(np.float32) / 255.0
-        b_ch = pixels[:, :, 0].astype(np.float32) / 255.0
-        channels = np.stack([r_ch, g_ch, b_ch], axis=2).reshape(-1, 3)
-
-        mean_srgb = tuple(np.mean(channels, axis=0))
-        cy_i = rows // 2
-        cx_i = img_w // 2
-        c = pixels[cy_i, cx_i]
-        curr_srgb = (c[2] / 255.0, c[1] / 255.0, c[0] / 255.0)
-        return channels, mean_srgb, curr_srgb
+        try:
+            length = _cf.CFDataGetLength(data_ref)
+            ptr    = _cf.CFDataGetBytePtr(data_ref)
+            # View CoreFoundation's bytes directly; converted before release
+            raw    = (ctypes.c_uint8 * length).from_address(ptr)
+            buf    = np.frombuffer(raw, dtype=np.uint8)
+
+            rows = min(img_h, length // bpr)
+            pixels = buf[:rows * bpr].reshape(rows, bpr)[:, :img_w * bpp].reshape(rows, img_w, bpp)
+
+            # CoreGraphics BGRA → RGB
+            return _bgra_to_samples(pixels, session)
+        finally:
+            _cf.CFRelease(data_ref)
+            _cg.CGImageRelease(img)
 
     except Exception as e:
         print(f"[CPICKER screen/macOS] sample failed: {e}")
@@ -163,7 +293,28 @@ def _sample_macos(sqrt_size):
 _win_dbg_counter = 0
 _WIN_DBG_EVERY = 15
 
-def _sample_windows(sqrt_size):
+
+class _POINT(ctypes.Structure):
+    _fields_ = [('x', ctypes.c_long), ('y', ctypes.c_long)]
+
+
+class _BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ('biSize',          ctypes.c_uint32),
+        ('biWidth',         ctypes.c_int32),
+        ('biHeight',        ctypes.c_int32),
+        ('biPlanes',        ctypes.c_uint16),
+        ('biBitCount',      ctypes.c_uint16),
+        ('biCompression',   ctypes.c_uint32),
+        ('biSizeImage',     ctypes.c_uint32),
+        ('biXPelsPerMeter', ctypes.c_int32),
+        ('biYPelsPerMeter', ctypes.c_int32),
+        ('biClrUsed',       ctypes.c_uint32),
+        ('biClrImportant',  ctypes.c_uint32),
+    ]
+
+
+def _sample_windows(sqrt_size, session=None):
     global _win_dbg_counter
     _win_dbg_counter += 1
     dbg = (_win_dbg_counter % _WIN_DBG_EVERY == 1)
@@ -173,9 +324,7 @@ def _sample_windows(sqrt_size):
         gdi32  = ctypes.windll.gdi32
 
         # Cursor position
-        class POINT(ctypes.Structure):
-            _fields_ = [('x', ctypes.c_long), ('y', ctypes.c_long)]
-        pt = POINT()
+        pt = _POINT()
         user32.GetCursorPos(ctypes.byref(pt))
         cx, cy = pt.x, pt.y
 
@@ -194,28 +343,18 @@ def _sample_windows(sqrt_size):
         gdi32.BitBlt(hdc_mem, 0, 0, sqrt_size, sqrt_size, hdc_screen, x, y, SRCCOPY)
 
         # Read pixels with GetDIBits (BGRA, top-down)
-        class BITMAPINFOHEADER(ctypes.Structure):
-            _fields_ = [
-                ('biSize',          ctypes.c_uint32),
-                ('biWidth',         ctypes.c_int32),
-                ('biHeight',        ctypes.c_int32),
-                ('biPlanes',        ctypes.c_uint16),
-                ('biBitCount',      ctypes.c_uint16),
-                ('biCompression',   ctypes.c_uint32),
-                ('biSizeImage',     ctypes.c_uint32),
-                ('biXPelsPerMeter', ctypes.c_int32),
-                ('biYPelsPerMeter', ctypes.c_int32),
-                ('biClrUsed',       ctypes.c_uint32),
-                ('biClrImportant',  ctypes.c_uint32),
-            ]
-        bmi            = BITMAPINFOHEADER()
-        bmi.biSize     = ctypes.sizeof(BITMAPINFOHEADER)
+        bmi            = _BITMAPINFOHEADER()
+        bmi.biSize     = ctypes.sizeof(_BITMAPINFOHEADER)
         bmi.biWidth    = sqrt_size
         bmi.biHeight   = -sqrt_size   # negative = top-down
         bmi.biPlanes   = 1
         bmi.biBitCount = 32
         buf_size = sqrt_size * sqrt_size * 4
-        buf = (ctypes.c_uint8 * buf_size)()
+        # Session buffer is reused across samples; GetDIBits writes straight
+        # into it, so it must hold the whole window
+        if session is not None:
+            session.ensure_capacity(sqrt_size)
+        buf = session.bgra if session is not None else (ctypes.c_uint8 * buf_size)()
         DIB_RGB_COLORS = 0
         gdi32.GetDIBits(hdc_mem, hbmp, 0, sqrt_size, buf,
                         ctypes.byref(bmi), DIB_RGB_COLORS)
@@ -224,7 +363,10 @@ def _sample_windows(sqrt_size):
         gdi32.DeleteDC(hdc_mem)
         gdi32.DeleteObject(hbmp)
 
-        pixels = np.frombuffer(buf, dtype=np.uint8).copy().reshape(sqrt_size, sqrt_size, 4)
+        if session is not None:
+            pixels = session.bgra_view(sqrt_size, sqrt_size)
+        else:
+            pixels = np.frombuffer(buf, dtype=np.uint8).reshape(sqrt_size, sqrt_size, 4)
 
         mid = sqrt_size // 2
         c_raw = pixels[mid, mid]   # centre pixel raw bytes
@@ -246,13 +388,7 @@ def _sample_windows(sqrt_size):
                       f"as_RGB=({px[2]/255:.3f},{px[1]/255:.3f},{px[0]/255:.3f})")
 
         # GDI GetDIBits with BI_RGB returns BGR(X) — channel 0=B, 1=G, 2=R, 3=padding
-        r_ch = pixels[:, :, 2].astype(np.float32) / 255.0
-        g_ch = pixels[:, :, 1].astype(np.float32) / 255.0
-        b_ch = pixels[:, :, 0].astype(np.float32) / 255.0
-        channels = np.stack([r_ch, g_ch, b_ch], axis=2).reshape(-1, 3)
-
-        mean_srgb = tuple(np.mean(channels, axis=0))
-        curr_srgb = (c_raw[2] / 255.0, c_raw[1] / 255.0, c_raw[0] / 255.0)
+        channels, mean_srgb, curr_srgb = _bgra_to_samples(pixels, session)
 
         if dbg:
             spread = max(mean_srgb) - min(mean_srgb)
@@ -274,30 +410,561 @@ def _sample_windows(sqrt_size):
         return None, None, None
 
 
+# ---------------------------------------------------------------------------
+# Linux — X11 MIT-SHM
+# ---------------------------------------------------------------------------
+# XShmGetImage copies the root window straight into a shared-memory segment
+# that stays attached for the life of the add-on, so a sample is one X round
+# trip and no redraw. The segment grows with the sample size and is released
+# by close_native_capture(). Under Wayland (WAYLAND_DISPLAY set) the root
+# window does not show native clients, so the GPU framebuffer path is kept.
+
+_x11 = None
+_xext = None
+_libc = None
+_x11_ok = None
+_x11_display = None
+_x11_root = 0
+_x11_image = None       # POINTER(_XImage) over the shared segment
+_x11_shm = None         # _XShmSegmentInfo
+_x11_capacity = 0       # pixels the segment holds
+
+_ZPIXMAP = 2
+_ALL_PLANES = ctypes.c_ulong(-1).value
+_IPC_PRIVATE = 0
+_IPC_CREAT = 0o1000
+_IPC_RMID = 0
+
+
+class _XImage(ctypes.Structure):
+    _fields_ = [
+        ('width',            ctypes.c_int),
+        ('height',           ctypes.c_int),
+        ('xoffset',          ctypes.c_int),
+        ('format',           ctypes.c_int),
+        ('data',             ctypes.c_void_p),
+        ('byte_order',       ctypes.c_int),
+        ('bitmap_unit',      ctypes.c_int),
+        ('bitmap_bit_order', ctypes.c_int),
+        ('bitmap_pad',       ctypes.c_int),
+        ('depth',            ctypes.c_int),
+        ('bytes_per_line',   ctypes.c_int),
+        ('bits_per_pixel',   ctypes.c_int),
+        ('red_mask',         ctypes.c_ulong),
+        ('green_mask',       ctypes.c_ulong),
+        ('blue_mask',        ctypes.c_ulong),
+        ('obdata',           ctypes.c_void_p),
+        ('f',                ctypes.c_void_p * 6),   # function table, unused
+    ]
+
+
+class _XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [
+        ('shmseg',   ctypes.c_ulong),
+        ('shmid',    ctypes.c_int),
+        ('shmaddr',  ctypes.c_void_p),
+        ('readOnly', ctypes.c_int),
+    ]
+
+
+def _load_x11():
+    global _x11, _xext, _libc, _x11_ok, _x11_display, _x11_root
+    if _x11_ok is not None:
+        return _x11_ok
+    _x11_ok = False
+    if not sys.platform.startswith('linux'):
+        return False
+    import os
+    if not os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'):
+        return False
+    try:
+        _x11 = ctypes.CDLL('libX11.so.6')
+        _xext = ctypes.CDLL('libXext.so.6')
+        _libc = ctypes.CDLL(None, use_errno=True)
+
+        # Configure function signatures once so the hot path doesn't repeat this work.
+        vp, c_int, c_uint, c_ulong = ctypes.c_void_p, ctypes.c_int, ctypes.c_uint, ctypes.c_ulong
+        _x11.XOpenDisplay.restype = vp
+        _x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        _x11.XCloseDisplay.argtypes = [vp]
+        _x11.XDefaultScreen.argtypes = [vp]
+        _x11.XRootWindow.restype = c_ulong
+        _x11.XRootWindow.argtypes = [vp, c_int]
+        _x11.XDefaultVisual.restype = vp
+        _x11.XDefaultVisual.argtypes = [vp, c_int]
+        _x11.XDefaultDepth.argtypes = [vp, c_int]
+        _x11.XDisplayWidth.argtypes = [vp, c_int]
+        _x11.XDisplayHeight.argtypes = [vp, c_int]
+        _x11.XSync.argtypes = [vp, c_int]
+        _x11.XDestroyImage.argtypes = [ctypes.POINTER(_XImage)]
+        _x11.XQueryPointer.argtypes = [
+            vp, c_ulong, ctypes.POINTER(c_ulong), ctypes.POINTER(c_ulong),
+            ctypes.POINTER(c_int), ctypes.POINTER(c_int),
+            ctypes.POINTER(c_int), ctypes.POINTER(c_int), ctypes.POINTER(c_uint)]
+        _xext.XShmQueryExtension.argtypes = [vp]
+        _xext.XShmCreateImage.restype = ctypes.POINTER(_XImage)
+        _xext.XShmCreateImage.argtypes = [
+            vp, vp, c_uint, c_int, ctypes.c_char_p,
+            ctypes.POINTER(_XShmSegmentInfo), c_uint, c_uint]
+        _xext.XShmAttach.argtypes = [vp, ctypes.POINTER(_XShmSegmentInfo)]
+        _xext.XShmDetach.argtypes = [vp, ctypes.POINTER(_XShmSegmentInfo)]
+        _xext.XShmGetImage.argtypes = [vp, c_ulong, ctypes.POINTER(_XImage), c_int, c_int, c_ulong]
+        _libc.shmget.argtypes = [c_int, ctypes.c_size_t, c_int]
+        _libc.shmat.restype = vp
+        _libc.shmat.argtypes = [c_int, vp, c_int]
+        _libc.shmdt.argtypes = [vp]
+        _libc.shmctl.argtypes = [c_int, c_int, vp]
+
+        display = _x11.XOpenDisplay(None)
+        if not display:
+            return False
+        if not _xext.XShmQueryExtension(display):
+            print("[CPICKER screen/X11] MIT-SHM extension not available")
+            _x11.XCloseDisplay(display)
+            return False
+        _x11_display = display
+        _x11_root = _x11.XRootWindow(display, _x11.XDefaultScreen(display))
+        _x11_ok = True
+    except Exception as e:
+        print(f"[CPICKER screen/X11] Xlib load failed: {e}")
+    return _x11_ok
+
+
+def _x11_release_image():
+    global _x11_image, _x11_shm, _x11_capacity
+    if _x11_image is None:
+        return
+    _xext.XShmDetach(_x11_display, ctypes.byref(_x11_shm))
+    _x11.XSync(_x11_display, 0)
+    # XDestroyImage would free() the shared memory as if it were malloc'd
+    _x11_image.contents.data = None
+    _x11.XDestroyImage(_x11_image)
+    _libc.shmdt(_x11_shm.shmaddr)
+    _x11_image = None
+    _x11_shm = None
+    _x11_capacity = 0
+
+
+def _x11_ensure_image(sqrt_size):
+    """Grow the persistent shared-memory XImage to hold sqrt_size² pixels."""
+    global _x11_image, _x11_shm, _x11_capacity
+    if sqrt_size * sqrt_size <= _x11_capacity:
+        return True
+    _x11_release_image()
+    screen = _x11.XDefaultScreen(_x11_display)
+    shm = _XShmSegmentInfo()
+    image = _xext.XShmCreateImage(
+        _x11_display, _x11.XDefaultVisual(_x11_display, screen),
+        _x11.XDefaultDepth(_x11_display, screen), _ZPIXMAP, None,
+        ctypes.byref(shm), sqrt_size, sqrt_size)
+    if not image:
+        return False
+    if image.contents.bits_per_pixel != 32:
+        print(f"[CPICKER screen/X11] unsupported {image.contents.bits_per_pixel}-bit visual")
+        _x11.XDestroyImage(image)
+        return False
+    size = image.contents.bytes_per_line * sqrt_size
+    shm.shmid = _libc.shmget(_IPC_PRIVATE, size, _IPC_CREAT | 0o600)
+    if shm.shmid < 0:
+        _x11.XDestroyImage(image)
+        return False
+    shm.shmaddr = _libc.shmat(shm.shmid, None, 0)
+    if shm.shmaddr in (None, ctypes.c_void_p(-1).value):
+        _libc.shmctl(shm.shmid, _IPC_RMID, None)
+        _x11.XDestroyImage(image)
+        return False
+    shm.readOnly = 0
+    image.contents.data = shm.shmaddr
+    _xext.XShmAttach(_x11_display, ctypes.byref(shm))
+    _x11.XSync(_x11_display, 0)
+    # Both sides are attached; the segment goes away once they detach
+    _libc.shmctl(shm.shmid, _IPC_RMID, None)
+    _x11_image, _x11_shm, _x11_capacity = image, shm, sqrt_size * sqrt_size
+    return True
+
+
+def _cursor_x11():
+    if not _load_x11():
+        return None
+    root_ret, child_ret = ctypes.c_ulong(), ctypes.c_ulong()
+    root_x, root_y, win_x, win_y = (ctypes.c_int() for _ in range(4))
+    mask = ctypes.c_uint()
+    if not _x11.XQueryPointer(
+            _x11_display, _x11_root, ctypes.byref(root_ret), ctypes.byref(child_ret),
+            ctypes.byref(root_x), ctypes.byref(root_y),
+            ctypes.byref(win_x), ctypes.byref(win_y), ctypes.byref(mask)):
+        return None
+    return (root_x.value, root_y.value)
+
+
+def _sample_x11(sqrt_size, session=None):
+    pos = _cursor_x11()
+    if pos is None:
+        return None, None, None
+    try:
+        screen = _x11.XDefaultScreen(_x11_display)
+        screen_w = _x11.XDisplayWidth(_x11_display, screen)
+        screen_h = _x11.XDisplayHeight(_x11_display, screen)
+        size = min(sqrt_size, screen_w, screen_h)
+        if not _x11_ensure_image(size):
+            return None, None, None
+        if session is not None:
+            session.ensure_capacity(size)
+
+        # XShmGetImage reads image.width × image.height, which must lie on
+        # screen; shrink the persistent image's header to this window
+        image = _x11_image.contents
+        image.width = image.height = size
+        image.bytes_per_line = size * 4
+        x = max(0, min(pos[0] - size // 2, screen_w - size))
+        y = max(0, min(pos[1] - size // 2, screen_h - size))
+        if not _xext.XShmGetImage(_x11_display, _x11_root, _x11_image, x, y, _ALL_PLANES):
+            return None, None, None
+
+        # 32-bit ZPixmap on little-endian is BGRX, the same layout as GDI
+        raw = (ctypes.c_uint8 * (size * size * 4)).from_address(image.data)
+        pixels = np.frombuffer(raw, dtype=np.uint8).reshape(size, size, 4)
+        return _bgra_to_samples(pixels, session)
+
+    except Exception as e:
+        print(f"[CPICKER screen/X11] sample failed: {e}")
+        import traceback; traceback.print_exc()
+        return None, None, None
+
+
+def _close_x11():
+    global _x11_ok, _x11_display
+    if _x11_display:
+        _x11_release_image()
+        _x11.XCloseDisplay(_x11_display)
+    _x11_display = None
+    _x11_ok = None
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+# Capability flags
+CAP_FULL_SCREEN = 'FULL_SCREEN'            # reads anywhere on screen, not just the invoking region
+CAP_NO_REDRAW = 'NO_REDRAW'                # sampling does not need a viewport redraw
+CAP_NEEDS_PERMISSION = 'NEEDS_PERMISSION'  # OS permission required (macOS Screen Recording)
+CAP_DETERMINISTIC = 'DETERMINISTIC'        # generated pixels; never picked automatically
+
+# Backend id meaning "no screen capture": the operators read the GPU
+# framebuffer in a draw callback instead
+FRAMEBUFFER_BACKEND = 'FRAMEBUFFER'
+AUTO_BACKEND = 'AUTO'
+
+
+class CaptureBackend(abc.ABC):
+    """
+    Screen capture backend interface.
+
+    sample() returns (channels_linear, mean_srgb, curr_srgb) like
+    sample_at_cursor, or (None, None, None) on failure; pixel_format is the
+    layout the backend captures in before the shared post-processing.
+    """
+    name = ''
+    label = ''
+    description = ''
+    pixel_format = 'BGRA8'
+    capabilities = frozenset()
+
+    def available(self) -> bool:
+        """True if the backend can work on this system (cheap after the first call)."""
+        return False
+
+    def open(self) -> bool:
+        """Acquire resources; True if the backend is ready to sample."""
+        return self.available()
+
+    @abc.abstractmethod
+    def sample(self, sqrt_size, session=None):
+        """Capture a sqrt_size square around the cursor (into session's buffers if given)."""
+
+    def close(self) -> None:
+        """Release resources acquired by open() or sample()."""
+
+
+class CoreGraphicsBackend(CaptureBackend):
+    name = 'COREGRAPHICS'
+    label = "CoreGraphics"
+    description = "macOS CGWindowListCreateImage (needs Screen Recording permission)"
+    capabilities = frozenset({CAP_FULL_SCREEN, CAP_NO_REDRAW, CAP_NEEDS_PERMISSION})
+
+    def available(self):
+        return sys.platform == 'darwin' and _load_macos()
+
+    def sample(self, sqrt_size, session=None):
+        return _sample_macos(sqrt_size, session)
+
+
+class GDIBackend(CaptureBackend):
+    name = 'GDI'
+    label = "GDI"
+    description = "Windows BitBlt from the screen device context"
+    capabilities = frozenset({CAP_FULL_SCREEN, CAP_NO_REDRAW})
+
+    def available(self):
+        return sys.platform == 'win32'
+
+    def sample(self, sqrt_size, session=None):
+        return _sample_windows(sqrt_size, session)
+
+
+class X11ShmBackend(CaptureBackend):
+    name = 'X11_SHM'
+    label = "X11 (MIT-SHM)"
+    description = "XShmGetImage into a persistent shared-memory segment"
+    capabilities = frozenset({CAP_FULL_SCREEN, CAP_NO_REDRAW})
+
+    def available(self):
+        return _load_x11()
+
+    def sample(self, sqrt_size, session=None):
+        return _sample_x11(sqrt_size, session)
+
+    def close(self):
+        _close_x11()
+
+
+class SyntheticBackend(CaptureBackend):
+    """
+    Serves a generated screen so the pixel path can run without a display.
+
+    The screen is a fixed-seed image (gradients plus noise); each sample
+    moves the cursor one step along a fixed Lissajous path unless cursor is
+    set. Identical construction → identical samples.
+    """
+    name = 'SYNTHETIC'
+    label = "Synthetic"
+    description = "Deterministic generated image, for testing and benchmarks"
+    capabilities = frozenset({CAP_FULL_SCREEN, CAP_NO_REDRAW, CAP_DETERMINISTIC})
+
+    def __init__(self, width=1024, height=768, seed=0):
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.cursor = None
+        self.frame = 0
+        self._screen = None
+
+    def available(self):
+        return True
+
+    def open(self):
+        if self._screen is None:
+            rng = np.random.default_rng(self.seed)
+            y, x = np.mgrid[0:self.height, 0:self.width]
+            screen = np.empty((self.height, self.width, 4), dtype=np.uint8)
+            screen[..., 0] = (x * 255) // max(self.width - 1, 1)            # B
+            screen[..., 1] = (y * 255) // max(self.height - 1, 1)           # G
+            screen[..., 2] = rng.integers(0, 256, (self.height, self.width))  # R
+            screen[..., 3] = 255
+            self._screen = screen
+        return True
+
+    def _next_cursor(self):
+        if self.cursor is not None:
+            return self.cursor
+        t = self.frame * 0.05
+        self.frame += 1
+        return (int((np.sin(t * 3.0) * 0.5 + 0.5) * (self.width - 1)),
+                int((np.sin(t * 2.0) * 0.5 + 0.5) * (self.height - 1)))
+
+    def sample(self, sqrt_size, session=None):
+        self.open()
+        cx, cy = self._next_cursor()
+        size = min(sqrt_size, self.width, self.height)
+        x = max(0, min(cx - size // 2, self.width - size))
+        y = max(0, min(cy - size // 2, self.height - size))
+        window = self._screen[y:y + size, x:x + size]
+        if session is not None:
+            # Go through the session's capture buffer like the native backends
+            session.ensure_capacity(size)
+            pixels = session.bgra_view(size, size)
+            np.copyto(pixels, window)
+            window = pixels
+        return _bgra_to_samples(window, session)
+
+    def close(self):
+        self._screen = None
+
+
+# name -> CaptureBackend, in automatic-selection order
+_BACKENDS: dict = {}
+_active_backend = None
+_selected_name = None
+
+
+def register_backend(backend):
+    """Add a backend to the registry (replacing one with the same name)."""
+    if backend.name in (AUTO_BACKEND, FRAMEBUFFER_BACKEND):
+        raise ValueError(f"Backend name '{backend.name}' is reserved")
+    _BACKENDS[backend.name] = backend
+
+
+def get_backend(name):
+    """Registered backend by name (KeyError if unknown)."""
+    return _BACKENDS[name]
+
+
+def capture_backend_items():
+    """
+    EnumProperty items for choosing a backend: Auto, every screen backend,
+    Framebuffer. Deterministic (generated) backends are for tests and
+    benchmarks only and are not offered.
+    """
+    items = [(AUTO_BACKEND, "Automatic", "First available screen capture backend")]
+    items += [(b.name, b.label, b.description) for b in _BACKENDS.values()
+              if CAP_DETERMINISTIC not in b.capabilities]
+    items.append((FRAMEBUFFER_BACKEND, "GPU Framebuffer",
+                  "Read the region's framebuffer in a draw callback (no screen capture)"))
+    return items
+
+
+def select_backend(name=AUTO_BACKEND):
+    """
+    Make a backend the one sample_at_cursor uses.
+
+    AUTO picks the first available non-synthetic backend; FRAMEBUFFER, an
+    unknown name or an unavailable backend leave no backend (framebuffer
+    fallback). A replaced backend is closed; selecting the current choice
+    again does nothing.
+
+    Returns:
+        CaptureBackend or None
+    """
+    global _active_backend, _selected_name
+    if name == _selected_name:
+        return _active_backend
+    if name == AUTO_BACKEND:
+        backend = next((b for b in _BACKENDS.values()
+                        if CAP_DETERMINISTIC not in b.capabilities and b.available()), None)
+    else:
+        backend = _BACKENDS.get(name)
+    if backend is not None and not backend.open():
+        backend = None
+    if _active_backend is not None and _active_backend is not backend:
+        _active_backend.close()
+    _active_backend = backend
+    _selected_name = name
+    return backend
+
+
+def active_backend():
+    """Backend in use, selecting automatically on first use."""
+    if _selected_name is None:
+        select_backend(AUTO_BACKEND)
+    return _active_backend
+
+
+register_backend(CoreGraphicsBackend())
+register_backend(GDIBackend())
+register_backend(X11ShmBackend())
+register_backend(SyntheticBackend())
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 def is_native_capture_available():
-    """True on macOS and Windows where OS-level screen capture is used."""
-    return sys.platform in ('darwin', 'win32')
+    """True if a screen capture backend is in use (see select_backend)."""
+    return active_backend() is not None
+
 
+def close_native_capture():
+    """Release persistent capture resources of every backend."""
+    global _active_backend, _selected_name
+    for backend in _BACKENDS.values():
+        backend.close()
+    _active_backend = None
+    _selected_name = None
 
-def sample_at_cursor(sqrt_size):
+
+def sample_at_cursor(sqrt_size, session=None, cursor=None, force=False):
     """
     Capture sqrt_size×sqrt_size pixels centred on the current cursor.
-    Returns (channels_srgb, mean_srgb, curr_srgb) — floats in [0,1] sRGB —
+    Returns (channels_linear, mean_srgb, curr_srgb) — channels as an (N, 3)
+    scene-linear array, mean/current as sRGB floats in [0,1] —
     or (None, None, None) if unavailable or throttled.
+
+    With a PickerSession (sized for sqrt_size) the capture and conversion
+    reuse its buffers; channels_linear is then a view into the session.
+
+    cursor / force go to capture_throttle.begin(); the caller calls
+    capture_throttle.end() once the sample has been synced.
     """
-    global _last_sample_time
-    now = time.monotonic()
-    if now - _last_sample_time < _SAMPLE_INTERVAL:
+    backend = active_backend()
+    if backend is None:
+        return None, None, None   # GPU framebuffer fallback in CPICKER_OT
+    if not capture_throttle.begin(cursor, force):
         return None, None, None
-    _last_sample_time = now
+    return backend.sample(sqrt_size, session)
 
-    if sys.platform == 'darwin':
-        return _sample_macos(sqrt_size)
-    elif sys.platform == 'win32':
-        return _sample_windows(sqrt_size)
-    else:
-        return None, None, None   # Linux: GPU framebuffer fallback in CPICKER_OT
+
+def benchmark_backends(names=None, sizes=(1, 5, 10, 25, 50, 100), samples=50, sync=None):
+    """
+    Time sample → stats → sync per backend and sample size (no throttle).
+
+    Run from Blender's Python console, e.g.::
+
+        from coloraide.operators import CPICKER_screen as s
+        from coloraide.COLORAIDE_sync import sync_all
+        s.benchmark_backends(sync=lambda c: sync_all(C, 'picker', c))
+
+    Args:
+        names: Backend names (default: every available backend)
+        sizes: Sample sizes (sqrt of the pixel count)
+        samples: Samples per backend and size
+        sync: Optional callable taking the mean scene linear color, timed as
+              the sync stage
+
+    Returns:
+        list[dict]: backend, size, samples and mean capture_ms / stats_ms /
+        sync_ms / total_ms per sample
+    """
+    from .CPICKER_session import PickerSession, STAT_NAMES
+    from ..COLORAIDE_colorspace import rgb_srgb_to_linear
+
+    if names is None:
+        names = [name for name, b in _BACKENDS.items() if b.available()]
+    results = []
+    for name in names:
+        backend = _BACKENDS[name]
+        if not backend.open():
+            continue
+        for size in sizes:
+            session = PickerSession(size)
+            capture = stats = synced = 0.0
+            taken = 0
+            for _ in range(samples):
+                t0 = time.perf_counter()
+                channels, mean_srgb, _curr = backend.sample(size, session)
+                t1 = time.perf_counter()
+                if mean_srgb is None:
+                    continue
+                session.add_sample(channels)
+                session.sample_stats(STAT_NAMES)
+                t2 = time.perf_counter()
+                if sync is not None:
+                    sync(rgb_srgb_to_linear(tuple(mean_srgb)))
+                t3 = time.perf_counter()
+                capture += t1 - t0
+                stats += t2 - t1
+                synced += t3 - t2
+                taken += 1
+            if not taken:
+                continue
+            results.append({
+                'backend': name,
+                'size': size,
+                'samples': taken,
+                'capture_ms': capture * 1e3 / taken,
+                'stats_ms': stats * 1e3 / taken,
+                'sync_ms': synced * 1e3 / taken,
+                'total_ms': (capture + stats + synced) * 1e3 / taken,
+            })
+    return results
@@ -0,0 +1,478 @@
+"""
+Per-invoke state for the screen picker operators.
+
+A PickerSession is created in invoke() and lives until the operator
+finishes. It owns every scratch buffer the sampling path needs, sized from
+the sample size, so MOUSEMOVE / draw-callback samples convert and reduce
+in place instead of allocating fresh arrays each time. Buffers only grow
+(quickpick re-reads custom_size while held); they are never shrunk.
+
+Per-sample statistics (brightest/darkest, p5/median/p95) are demand-driven:
+each new sample gets a sample_id, and sample_stats() computes only the
+requested stats, caching them for that id. The latest session stays in
+COLORAIDE_state.picker_session so the UI can ask for stats after the fact.
+
+Each capture also keeps its window shape and center so nested, centered
+windows can be read from it: window_mean(size) uses a summed-area table
+(built once per sample, on first use) for the O(1) mean of any nested size,
+and nested_sample(size) narrows the current sample to such a window. The
+picker captures once at the largest size shown and derives the rest.
+
+The picked mean can be smoothed over time (TemporalSmoother): an EMA or the
+mean of the last N sample means, kept in a fixed ring buffer.
+
+Percentiles come from a per-channel histogram in O(n + bins), never a sort.
+Byte captures are binned on their 256 code values, so their percentiles are
+exact; float captures are binned on FLOAT_HISTOGRAM_BINS steps of the sRGB
+(LUT) domain, i.e. within half a 1/4096 step of sRGB.
+"""
+
+import ctypes
+import numpy as np
+from ..COLORAIDE_colorspace import (
+    IMAGE_DTYPE,
+    bytes_to_linear_array,
+    srgb_to_linear_array,
+    linear_to_srgb_lut_array,
+)
+from ..COLORAIDE_utils import ColorStatsAccumulator, histogram_percentile_bins
+
+STAT_NAMES = ('max', 'min', 'p5', 'median', 'p95')
+# Nested window sizes the picker can show side by side
+SCALE_SIZES = (1, 5, 25)
+# Percentile stats and the percentile each one reads
+PERCENTILE_STATS = {'p5': 5.0, 'median': 50.0, 'p95': 95.0}
+
+BYTE_HISTOGRAM_BINS = 256
+FLOAT_HISTOGRAM_BINS = 4096
+
+# Linear value represented by each histogram bin
+_BYTE_BIN_VALUES = bytes_to_linear_array(np.arange(BYTE_HISTOGRAM_BINS), np.float64)
+_FLOAT_BIN_VALUES = srgb_to_linear_array(
+    (np.arange(FLOAT_HISTOGRAM_BINS) + 0.5) / FLOAT_HISTOGRAM_BINS)
+_CHANNEL_OFFSETS = np.arange(3)
+
+# Largest smoothing window (ring buffer length)
+MAX_SMOOTHING_WINDOW = 64
+
+
+class TemporalSmoother:
+    """
+    Smooths a stream of colors with an EMA or a windowed mean.
+
+    The ring buffer and running state are preallocated; add() does no array
+    allocation. Changing mode or window restarts from the next color.
+    """
+
+    def __init__(self):
+        self.ring = np.zeros((MAX_SMOOTHING_WINDOW, 3), dtype=np.float64)
+        self.total = np.zeros(3, dtype=np.float64)   # window: sum of the ring
+        self.value = np.zeros(3, dtype=np.float64)   # smoothed color
+        self.count = 0
+        self.head = 0
+        self.mode = None
+        self.window = 0
+
+    def reset(self) -> None:
+        self.count = 0
+        self.head = 0
+        self.total.fill(0.0)
+
+    def add(self, color, mode: str, window: int) -> tuple:
+        """
+        Add a color and return the smoothed color.
+
+        Args:
+            color: (r, g, b)
+            mode: 'EMA' (alpha = 2 / (window + 1)) or 'WINDOW' (mean of the
+                  last window colors); anything else returns color unchanged
+            window: Window length, clamped to [1, MAX_SMOOTHING_WINDOW]
+        """
+        if mode not in ('EMA', 'WINDOW'):
+            return tuple(color)
+        window = max(1, min(window, MAX_SMOOTHING_WINDOW))
+        if mode != self.mode or window != self.window:
+            self.mode, self.window = mode, window
+            self.reset()
+
+        if mode == 'EMA':
+            if self.count:
+                # value += alpha * (color - value), through the first ring slot
+                step = self.ring[0]
+                step[:] = color[:3]
+                step -= self.value
+                step *= 2.0 / (window + 1.0)
+                self.value += step
+            else:
+                self.value[:] = color[:3]
+                self.count = 1
+            return tuple(self.value.tolist())
+
+        slot = self.ring[self.head]
+        if self.count == window:
+            self.total -= slot
+        else:
+            self.count += 1
+        slot[:] = color[:3]
+        self.total += slot
+        self.head = (self.head + 1) % window
+        if self.head == 0:
+            # Re-sum once per lap so the running total cannot drift
+            self.ring[:self.count].sum(axis=0, out=self.total)
+        np.divide(self.total, self.count, out=self.value)
+        return tuple(self.value.tolist())
+
+
+class PickerSession:
+    """Scratch buffers and running statistics for one picking session."""
+
+    def __init__(self, sqrt_size: int):
+        # Running stats of every sample taken with accumulate=True (reset
+        # with each session); see session_mean() / session_statistics()
+        self.stats = ColorStatsAccumulator()
+        self.smoother = TemporalSmoother()
+        self.position = None            # cursor of the last sample (see move_to)
+        self.capacity = 0
+
+        # Linux GPU path: sample handed from the draw callback to the modal tick
+        self.sample_count = 0
+        self.sample_width = 0
+        self.center_index = 0
+        self.new_sample = False
+        # What the last framebuffer read saw (see same_capture)
+        self.capture_key = None
+        self.reads = 0
+        self.reads_skipped = 0
+
+        # Picker mean last pushed through sync_all, and whether the shown
+        # mean has moved on from it (see CPICKER_OT._apply_sample)
+        self.synced_color = None
+        self.sync_pending = False
+        self.syncs = 0
+        self.syncs_skipped = 0
+
+        # Latest linear sample and its lazily computed stats
+        self.sample_id = 0
+        self.channels = None
+        # Byte codes (bytes captures only) of the latest capture, of what
+        # the next add_sample() receives, and of the current sample
+        self._capture_codes = None
+        self._pending_codes = None
+        self._byte_codes = None
+        # Latest capture: (height, width), center (row, col), and its
+        # summed-area table for window_mean()
+        self.capture_id = 0
+        self.window_shape = (0, 0)
+        self.window_center = (0, 0)
+        self.sat = np.zeros(0, dtype=np.float64)
+        self._sat_id = -1
+        self._srgb_id = -1              # capture the srgb buffer still holds
+        self._stats_id = -1
+        self._stats_cache = {}
+
+        self.ensure_capacity(sqrt_size)
+
+    def ensure_capacity(self, sqrt_size: int) -> None:
+        """
+        Grow the buffers to hold a sqrt_size × sqrt_size window.
+
+        Growing drops the pending float sample and the latest capture (their
+        pixels were in the old buffers); the current sample, a view into the
+        old buffers, stays valid for its stats.
+        """
+        capacity = sqrt_size * sqrt_size
+        if capacity <= self.capacity:
+            return
+        self.capacity = capacity
+        self.new_sample = False
+        self.sample_count = 0
+        self.capture_key = None
+        self._capture_codes = self._pending_codes = None
+        self.capture_id += 1
+        self.window_shape = (0, 0)
+        self.window_center = (0, 0)
+        self._srgb_id = -1
+        # Native capture target (BGRA bytes), shared with ctypes without copies
+        self.bgra = (ctypes.c_uint8 * (capacity * 4))()
+        self.bgra_array = np.frombuffer(self.bgra, dtype=np.uint8)
+        # Float sRGB from the GPU framebuffer, converted to linear in place
+        self.srgb = np.empty((capacity, 3), dtype=IMAGE_DTYPE)
+        # Byte captures: table indices (take() needs intp); they double as
+        # histogram bin codes. Float captures bin into bin_index.
+        self.byte_index = np.empty((capacity, 3), dtype=np.intp)
+        self.bin_index = np.empty((capacity, 3), dtype=np.intp)
+        self.encoded = np.empty((capacity, 3), dtype=IMAGE_DTYPE)
+        # Linear channels of the latest sample (both paths)
+        self.linear = np.empty((capacity, 3), dtype=IMAGE_DTYPE)
+        # Brightest/darkest reduction
+        self.channel_sum = np.empty(capacity, dtype=IMAGE_DTYPE)
+        # Nested windows cut out of a larger capture
+        self.nested_linear = np.empty((capacity, 3), dtype=IMAGE_DTYPE)
+        self.nested_codes = np.empty((capacity, 3), dtype=np.intp)
+
+    def move_to(self, position, jump: int) -> None:
+        """
+        Note the cursor position of the next sample; moving more than jump
+        pixels (the capture size) from the last one restarts the smoother,
+        so a new target is not blended with the old one.
+        """
+        last, self.position = self.position, position
+        if last is not None and max(abs(position[0] - last[0]),
+                                    abs(position[1] - last[1])) > jump:
+            self.smoother.reset()
+
+    # -- capture ------------------------------------------------------------
+
+    def bgra_view(self, height: int, width: int) -> np.ndarray:
+        """(height, width, 4) view of the native capture buffer."""
+        return self.bgra_array[:height * width * 4].reshape(height, width, 4)
+
+    def linearize_bytes(self, rgb_bytes: np.ndarray) -> np.ndarray:
+        """Byte table take() of an (H, W, 3) uint8 view into the linear buffer → (N, 3)."""
+        h, w = rgb_bytes.shape[:2]
+        if h * w > self.capacity:
+            # HiDPI captures can come back larger than the requested window
+            self.ensure_capacity(max(h, w))
+        index = self.byte_index[:h * w].reshape(h, w, 3)
+        np.copyto(index, rgb_bytes)
+        out = self.linear[:h * w]
+        bytes_to_linear_array(index, out=out.reshape(h, w, 3))
+        self._capture_codes = self._pending_codes = self.byte_index[:h * w]
+        self.capture_id += 1
+        self.window_shape = (h, w)
+        self.window_center = (h // 2, w // 2)
+        return out
+
+    def same_capture(self, key) -> bool:
+        """
+        True if a framebuffer read with this capture key would return the
+        pixels of the previous read, which then stays the current sample.
+        Otherwise the key is remembered for the read about to happen.
+        """
+        if key == self.capture_key:
+            self.reads_skipped += 1
+            return True
+        self.capture_key = key
+        self.reads += 1
+        return False
+
+    def store_float(self, pixels: np.ndarray, center_index: int, width: int = 0) -> None:
+        """
+        Copy a float sRGB window (any shape, N*3 values) and flag it as new.
+        width is the window's row length (default: a single row).
+        """
+        count = pixels.size // 3
+        self.srgb[:count] = pixels.reshape(count, 3)
+        self.sample_count = count
+        self.center_index = center_index
+        self.sample_width = width or count
+        self.new_sample = True
+        self._srgb_id = -1
+
+    def take_float_sample(self) -> tuple:
+        """
+        Consume the stored float window.
+
+        Returns (channels_linear, mean_srgb, curr_srgb). Linear channels go
+        to the linear buffer, so the next store_float cannot clobber the
+        sample that stats may still be asked about.
+        """
+        self.new_sample = False
+        self._capture_codes = self._pending_codes = None
+        self.capture_id += 1
+        self._srgb_id = self.capture_id
+        width = self.sample_width
+        self.window_shape = (self.sample_count // width, width)
+        self.window_center = divmod(self.center_index, width)
+        srgb = self.srgb[:self.sample_count]
+        mean_srgb = tuple(srgb.mean(axis=0))
+        curr_srgb = tuple(srgb[self.center_index])
+        return srgb_to_linear_array(srgb, out=self.linear[:self.sample_count]), mean_srgb, curr_srgb
+
+    # -- statistics ---------------------------------------------------------
+
+    def add_sample(self, channels_linear: np.ndarray, accumulate: bool = False) -> int:
+        """
+        Make channels_linear the current sample; with accumulate, also merge
+        it into the session stats. Per-sample stats are not computed here.
+
+        channels_linear is expected to be the result of the latest
+        linearize_bytes() / take_float_sample() / nested_sample() (a view
+        into this session).
+
+        Returns:
+            int: The new sample_id
+        """
+        if accumulate:
+            self.stats.update(channels_linear)
+        self.channels = channels_linear
+        codes = self._pending_codes
+        self._byte_codes = codes[:len(channels_linear)] if codes is not None else None
+        self.sample_id += 1
+        return self.sample_id
+
+    def session_mean(self):
+        """Mean linear color of every accumulated pixel this session, or None."""
+        if not self.stats.count:
+            return None
+        return tuple(self.stats.mean.tolist())
+
+    def session_statistics(self) -> dict | None:
+        """
+        Mean, median, min, max and std of every accumulated pixel this
+        session, computed from the running stats when asked; None if empty.
+        """
+        return self.stats.statistics()
+
+    # -- nested windows -----------------------------------------------------
+
+    def _nested_bounds(self, size: int) -> tuple:
+        """(y0, y1, x0, x1) of the size×size window centered like the capture."""
+        (h, w), (cy, cx) = self.window_shape, self.window_center
+        sh, sw = min(size, h), min(size, w)
+        y0 = max(0, min(cy - sh // 2, h - sh))
+        x0 = max(0, min(cx - sw // 2, w - sw))
+        return y0, y0 + sh, x0, x0 + sw
+
+    def nested_sample(self, size: int):
+        """
+        Narrow the latest capture to its centered size×size window.
+
+        Returns:
+            (channels_linear, mean_srgb) for the window, channels in a
+            session buffer ready for add_sample(); None if the capture is
+            not larger than size
+        """
+        h, w = self.window_shape
+        if size >= h and size >= w:
+            return None
+        y0, y1, x0, x1 = self._nested_bounds(size)
+        count = (y1 - y0) * (x1 - x0)
+        linear = self.linear[:h * w].reshape(h, w, 3)[y0:y1, x0:x1]
+        channels = self.nested_linear[:count]
+        np.copyto(channels.reshape(linear.shape), linear)
+        if self._capture_codes is not None:
+            codes = self._capture_codes.reshape(h, w, 3)[y0:y1, x0:x1]
+            np.copyto(self.nested_codes[:count].reshape(codes.shape), codes)
+            self._pending_codes = self.nested_codes[:count]
+        return channels, self.window_mean(size)
+
+    def window_mean(self, size: int):
+        """
+        Mean sRGB of the latest capture's centered size×size window, in O(1)
+        once the capture's summed-area table exists.
+
+        Returns None if the table was never built and the float window it
+        needs has already been overwritten by a newer read.
+        """
+        sat = self._window_sums()
+        if sat is None:
+            return None
+        y0, y1, x0, x1 = self._nested_bounds(size)
+        total = sat[y1, x1] - sat[y0, x1] - sat[y1, x0] + sat[y0, x0]
+        return tuple((total / ((y1 - y0) * (x1 - x0))).tolist())
+
+    def _window_sums(self):
+        """Summed-area table of the latest capture in sRGB [0, 1], (h+1, w+1, 3)."""
+        h, w = self.window_shape
+        if (self._sat_id != self.capture_id and self._capture_codes is None
+                and self._srgb_id != self.capture_id):
+            return None
+        needed = (h + 1) * (w + 1) * 3
+        if self.sat.size < needed:
+            self.sat = np.zeros(needed, dtype=np.float64)
+            self._sat_id = -1
+        sat = self.sat[:needed].reshape(h + 1, w + 1, 3)
+        if self._sat_id != self.capture_id:
+            self._sat_id = self.capture_id
+            sat[0] = 0.0
+            sat[:, 0] = 0.0
+            if self._capture_codes is not None:
+                source, scale = self._capture_codes.reshape(h, w, 3), 1.0 / 255.0
+            else:
+                source, scale = self.srgb[:h * w].reshape(h, w, 3), 1.0
+            inner = sat[1:, 1:]
+            np.cumsum(source, axis=0, dtype=np.float64, out=inner)
+            np.cumsum(inner, axis=1, out=inner)
+            if scale != 1.0:
+                inner *= scale
+        return sat
+
+    def sample_stats(self, names=STAT_NAMES) -> dict:
+        """
+        Per-sample stats of the current sample, computed on first request
+        and cached until the next add_sample().
+
+        Args:
+            names: Any of STAT_NAMES
+
+        Returns:
+            dict: name -> (r, g, b) linear color; empty if there is no sample
+        """
+        if self.channels is None or not len(self.channels):
+            return {}
+        if self._stats_id != self.sample_id:
+            self._stats_id = self.sample_id
+            self._stats_cache.clear()
+        cache = self._stats_cache
+        missing = [name for name in names if name not in cache]
+        if 'max' in missing or 'min' in missing:
+            cache.update(self._extremes())
+        wanted = [name for name in missing if name in PERCENTILE_STATS]
+        if wanted:
+            cache.update(self._percentiles(wanted))
+        return {name: cache[name] for name in names}
+
+    def percentiles(self, qs) -> np.ndarray:
+        """
+        Arbitrary per-channel percentiles of the current sample (not cached).
+
+        Args:
+            qs: Sequence of percentiles in [0, 100]
+
+        Returns:
+            np.ndarray: (len(qs), 3) linear values
+        """
+        bins, values = self._build_histogram()
+        return values[histogram_percentile_bins(bins, len(self.channels), qs)]
+
+    def _extremes(self) -> dict:
+        """Brightest and darkest pixel (by channel sum), reduced in scratch."""
+        channels = self.channels
+        total = np.sum(channels, axis=1, out=self.channel_sum[:len(channels)])
+        return {
+            'max': tuple(channels[total.argmax()].tolist()),
+            'min': tuple(channels[total.argmin()].tolist()),
+        }
+
+    def _percentiles(self, names) -> dict:
+        """Named percentile stats from one histogram pass."""
+        values = self.percentiles([PERCENTILE_STATS[name] for name in names])
+        return {name: tuple(row.tolist()) for name, row in zip(names, values)}
+
+    def _build_histogram(self) -> tuple:
+        """
+        Per-channel histogram of the current sample.
+
+        Returns:
+            tuple: ((3, bins) histogram, bin → linear value table)
+        """
+        channels = self.channels
+        count = len(channels)
+        index = self.bin_index[:count]
+        if self._byte_codes is not None:
+            bins, values = BYTE_HISTOGRAM_BINS, _BYTE_BIN_VALUES
+            np.copyto(index, self._byte_codes)
+        else:
+            bins, values = FLOAT_HISTOGRAM_BINS, _FLOAT_BIN_VALUES
+            encoded = linear_to_srgb_lut_array(channels, out=self.encoded[:count])
+            encoded *= bins
+            np.copyto(index, encoded, casting='unsafe')
+            np.clip(index, 0, bins - 1, out=index)
+        index += _CHANNEL_OFFSETS * bins
+
+        histogram = np.bincount(index.reshape(-1), minlength=3 * bins)
+        return histogram.reshape(3, bins), values
+
+
+__all__ = ['PickerSession', 'TemporalSmoother']
@@ -1,7 +1,7 @@
 # LAB_OT.py 
 import bpy
 from bpy.types import Operator
-from ..COLORAIDE_utils import rgb_to_lab
+from ..COLORAIDE_color_record import get_color_record
 from ..COLORAIDE_sync import sync_all, is_updating
 
 class COLOR_OT_sync_lab(Operator):
@@ -13,6 +13,6 @@ class COLOR_OT_sync_lab(Operator):
         if is_updating():
             return {'FINISHED'}
         current_color = tuple(context.window_manager.coloraide_picker.mean)
-        lab_values = rgb_to_lab(current_color)
+        lab_values = get_color_record(current_color).lab
         sync_all(context, 'lab', lab_values)
         return {'FINISHED'}
\ No newline at end of file
@@ -5,8 +5,10 @@ CLEAN REWRITE: Simplified with auto-refresh on mode switch.
 
 import bpy
 from bpy.types import Operator
-from bpy.props import IntProperty, StringProperty
+from bpy.props import IntProperty, FloatProperty, StringProperty
 from ..COLORAIDE_object_colors import scan_all_colors, get_color_value, set_color_value
+from ..COLORAIDE_colorspace import blackbody_to_linear, BLACKBODY_MIN_K, BLACKBODY_MAX_K
+from ..COLORAIDE_ocio import get_active_engine
 from ..COLORAIDE_color_grouping import group_colors_by_value, build_grouped_properties
 from ..COLORAIDE_sync import sync_all, is_updating, is_updating_live_sync
 
@@ -84,7 +86,12 @@ class OBJECT_COLORS_OT_refresh(Operator):
         
         else:  # GROUPED MODE
             # Group colors
-            groups_data = build_grouped_properties(context, detected, obj_colors.tolerance)
+            if obj_colors.grouping_metric == 'DELTA_E':
+                tolerance = obj_colors.grouping_delta_e
+            else:
+                tolerance = obj_colors.tolerance
+            groups_data = build_grouped_properties(
+                context, detected, tolerance, obj_colors.grouping_metric)
             
             for group_data in groups_data:
                 item = obj_colors.items.add()
@@ -300,6 +307,40 @@ class OBJECT_COLORS_OT_show_tooltip(Operator):
         return {'FINISHED'}
 
 
+class OBJECT_COLORS_OT_set_light_temperature(Operator):
+    """Set the color of all selected lights from a blackbody temperature"""
+    bl_idname = "object_colors.set_light_temperature"
+    bl_label = "Set Light Temperature"
+    bl_description = "Set the color of all selected lights to the picker's color temperature"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    kelvin: FloatProperty(
+        name="Temperature",
+        default=6500.0,
+        min=BLACKBODY_MIN_K, max=BLACKBODY_MAX_K
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return any(obj.type == 'LIGHT' for obj in context.selected_objects)
+
+    def execute(self, context):
+        # One table lookup shared by every light
+        color = blackbody_to_linear(self.kelvin)
+        engine = get_active_engine(context)
+        if engine is not None:
+            color = engine.rec709_to_scene(color)
+
+        count = 0
+        for obj in context.selected_objects:
+            if obj.type == 'LIGHT' and obj.data:
+                obj.data.color = color
+                count += 1
+
+        self.report({'INFO'}, f"Set {count} light(s) to {self.kelvin:.0f}K")
+        return {'FINISHED'}
+
+
 def update_live_synced_properties(context, color, mode='absolute', delta=None):
     """Update all properties with live sync enabled (uses cache)"""
     from ..COLORAIDE_cache import update_live_synced_properties_cached
@@ -312,5 +353,6 @@ __all__ = [
     'OBJECT_COLORS_OT_push',
     'OBJECT_COLORS_OT_update_group_color',
     'OBJECT_COLORS_OT_show_tooltip',
+    'OBJECT_COLORS_OT_set_light_temperature',
     'update_live_synced_properties'
 ]
\ No newline at end of file
@@ -35,6 +35,55 @@ def draw_picker_panel(layout, context):
             icon='EYEDROPPER'
         ).sqrt_length = wm.coloraide_picker.custom_size
 
+        # Samples within the tolerance skip the full sync while picking
+        row = col.row(align=True)
+        row.prop(wm.coloraide_picker, 'sync_metric', text='')
+        if wm.coloraide_picker.sync_metric == 'DELTA_E':
+            row.prop(wm.coloraide_picker, 'sync_delta_e', text='Tolerance')
+        else:
+            row.prop(wm.coloraide_picker, 'sync_tolerance', text='Tolerance')
+
+        # Temporal smoothing of the picked color
+        row = col.row(align=True)
+        row.prop(wm.coloraide_picker, 'smoothing', text='')
+        if wm.coloraide_picker.smoothing != 'NONE':
+            row.prop(wm.coloraide_picker, 'smoothing_window', text='Samples')
+
+        row = col.row(align=True)
+        row.prop(wm.coloraide_picker, 'use_session_average', toggle=True)
+        row.prop(wm.coloraide_display, 'show_stats', text='Stats', toggle=True)
+        row.prop(wm.coloraide_display, 'show_scales', text='Scales', toggle=True)
+
+        # Nested sample sizes from one capture
+        if wm.coloraide_display.show_scales:
+            row = col.row(align=True)
+            for size in (1, 5, 25):
+                row.label(text=f"{size} px")
+            row = col.row(align=True)
+            for size in (1, 5, 25):
+                row.prop(wm.coloraide_picker, f'mean_{size}', text='')
+
+        # Statistics of the last sample (only computed while shown)
+        if wm.coloraide_display.show_stats:
+            row = col.row(align=True)
+            row.label(text="Min")
+            row.label(text="P5")
+            row.label(text="Median")
+            row.label(text="P95")
+            row.label(text="Max")
+            row = col.row(align=True)
+            for name in ('min', 'p5', 'median', 'p95', 'max'):
+                row.prop(wm.coloraide_picker, name, text='')
+
+        # Color temperature
+        row = col.row(align=True)
+        split = row.split(factor=0.75, align=True)
+        split.prop(wm.coloraide_picker, 'temperature', text='Kelvin', slider=True)
+        split.operator('object_colors.set_light_temperature',
+            text='',
+            icon='LIGHT'
+        ).kelvin = wm.coloraide_picker.temperature
+
         # Normal picker
         row = col.row(align=True)
         row.operator("normal.color_picker", 
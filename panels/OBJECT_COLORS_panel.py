@@ -102,6 +102,12 @@ def draw_object_mode(layout, context, obj_colors):
 def draw_grouped_mode(layout, context, obj_colors):
     """Draw Grouped Mode UI (Figma-style color groups)"""
     
+    # How colors are matched into groups
+    row = layout.row(align=True)
+    row.prop(obj_colors, "grouping_metric", text="")
+    if obj_colors.grouping_metric == 'DELTA_E':
+        row.prop(obj_colors, "grouping_delta_e", text="Tolerance")
+    
     if not obj_colors.items:
         layout.label(text="No colors detected", icon='INFO')
         layout.label(text="Click 'Rescan' to detect colors")
@@ -0,0 +1,23 @@
+"""Oklab / OkLCh slider panel UI implementation."""
+
+import bpy
+
+def draw_oklab_panel(layout, context):
+    wm = context.window_manager
+    col = layout.column(align=True)
+    
+    split = col.split(factor=0.15)
+    split.label(text="L:")
+    split.prop(wm.coloraide_oklab, "lightness", text="", slider=True)
+    
+    split = col.split(factor=0.15)
+    split.label(text="C:")
+    split.prop(wm.coloraide_oklab, "chroma", text="", slider=True)
+    
+    split = col.split(factor=0.15)
+    split.label(text="h:")
+    split.prop(wm.coloraide_oklab, "hue", text="", slider=True)
+
+    row = col.row(align=True)
+    row.prop(wm.coloraide_oklab, "a", text="a", slider=True)
+    row.prop(wm.coloraide_oklab, "b", text="b", slider=True)
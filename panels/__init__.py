@@ -5,6 +5,7 @@ __all__ = [
     'draw_hex_panel',
     'draw_rgb_panel',
     'draw_lab_panel',
+    'draw_oklab_panel',
     'draw_hsv_panel',
     'draw_history_panel',
     'draw_palette_panel',
@@ -1,8 +1,10 @@
 """Color picker properties - Blender 5.0+ (scene linear color space)"""
 
 import bpy
-from bpy.props import IntProperty, FloatVectorProperty
+from bpy.props import IntProperty, FloatProperty, FloatVectorProperty, BoolProperty, EnumProperty
 from ..COLORAIDE_sync import sync_all, is_updating
+from ..COLORAIDE_colorspace import BLACKBODY_MIN_K, BLACKBODY_MAX_K
+from ..operators.CPICKER_session import MAX_SMOOTHING_WINDOW
 from .base import SuppressUpdatesMixin
 
 class ColoraidePickerProperties(SuppressUpdatesMixin):
@@ -15,6 +17,12 @@ class ColoraidePickerProperties(SuppressUpdatesMixin):
         # Color is already in scene linear space from picker
         sync_all(context, 'picker', self.mean)
 
+    def update_temperature(self, context):
+        """Set the current color from a blackbody temperature."""
+        if is_updating() or self.suppress_updates:
+            return
+        sync_all(context, 'kelvin', self.temperature)
+
     def update_current_color(self, context):
         """Current color is display-only, no sync needed."""
         if is_updating() or self.suppress_updates:
@@ -30,6 +38,72 @@ class ColoraidePickerProperties(SuppressUpdatesMixin):
         soft_max=100,
         soft_min=5
     )
+
+    temperature: FloatProperty(
+        name="Temperature",
+        description="Blackbody color temperature in Kelvin",
+        default=6500.0,
+        min=BLACKBODY_MIN_K, max=BLACKBODY_MAX_K,
+        soft_min=1000.0, soft_max=12000.0,
+        step=10000,
+        precision=0,
+        update=update_temperature
+    )
+
+    sync_metric: EnumProperty(
+        name="Sync Metric",
+        description="How a new sample is compared with the last synced color",
+        items=[
+            ('LINEAR', "Linear", "Largest per-channel difference in scene linear", 0),
+            ('DELTA_E', "ΔE", "CIE76 color difference (CIELAB)", 1),
+        ],
+        default='LINEAR'
+    )
+
+    sync_tolerance: FloatProperty(
+        name="Sync Tolerance",
+        description="Samples closer than this to the last synced color only update "
+                    "the picker swatches (Linear metric)",
+        default=1.0 / 1024.0,
+        min=0.0, soft_max=0.05,
+        step=0.01,
+        precision=4
+    )
+
+    sync_delta_e: FloatProperty(
+        name="Sync Tolerance",
+        description="Samples closer than this to the last synced color only update "
+                    "the picker swatches (ΔE metric)",
+        default=0.1,
+        min=0.0, soft_max=5.0,
+        step=1,
+        precision=2
+    )
+
+    smoothing: EnumProperty(
+        name="Smoothing",
+        description="Smooth the picked color over recent samples (noisy renders, moving footage)",
+        items=[
+            ('NONE', "No Smoothing", "Use each sample as is", 0),
+            ('EMA', "Exponential", "Exponential moving average over about the window length", 1),
+            ('WINDOW', "Window", "Mean of the last samples in the window", 2),
+        ],
+        default='NONE'
+    )
+
+    smoothing_window: IntProperty(
+        name="Smoothing Window",
+        description="Number of recent samples the smoothing covers",
+        default=8,
+        min=2,
+        max=MAX_SMOOTHING_WINDOW
+    )
+
+    use_session_average: BoolProperty(
+        name="Average While Held",
+        description="On release, pick the average of every sample taken while the picker was held",
+        default=False
+    )
    
     mean: FloatVectorProperty(
         name="Mean Color",
@@ -50,6 +124,33 @@ class ColoraidePickerProperties(SuppressUpdatesMixin):
         default=(1.0, 1.0, 1.0),
     )
 
+    mean_1: FloatVectorProperty(
+        name="1×1 Mean",
+        description="Color of the pixel under the cursor (scene linear)",
+        subtype='COLOR',
+        size=3,
+        min=0.0, max=1.0,
+        default=(0.5, 0.5, 0.5)
+    )
+
+    mean_5: FloatVectorProperty(
+        name="5×5 Mean",
+        description="Average color of the 5×5 window under the cursor (scene linear)",
+        subtype='COLOR',
+        size=3,
+        min=0.0, max=1.0,
+        default=(0.5, 0.5, 0.5)
+    )
+
+    mean_25: FloatVectorProperty(
+        name="25×25 Mean",
+        description="Average color of the 25×25 window under the cursor (scene linear)",
+        subtype='COLOR',
+        size=3,
+        min=0.0, max=1.0,
+        default=(0.5, 0.5, 0.5)
+    )
+
     max: FloatVectorProperty(
         name="Maximum",
         description="Brightest color in sampled area (scene linear)",
@@ -76,3 +177,21 @@ class ColoraidePickerProperties(SuppressUpdatesMixin):
         min=0.0, max=1.0,
         default=(0.5, 0.5, 0.5)
     )
+
+    p5: FloatVectorProperty(
+        name="5th Percentile",
+        description="Per-channel 5th percentile of sampled area (scene linear)",
+        subtype='COLOR',
+        size=3,
+        min=0.0, max=1.0,
+        default=(0.0, 0.0, 0.0)
+    )
+
+    p95: FloatVectorProperty(
+        name="95th Percentile",
+        description="Per-channel 95th percentile of sampled area (scene linear)",
+        subtype='COLOR',
+        size=3,
+        min=0.0, max=1.0,
+        default=(1.0, 1.0, 1.0)
+    )
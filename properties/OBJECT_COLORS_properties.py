@@ -139,6 +139,15 @@ class ColoraideObjectColorsProperties(PropertyGroup):
         except:
             pass
 
+    def update_grouping(self, context):
+        """Auto-refresh when the grouping metric or its tolerance changes"""
+        if self.display_mode != 'GROUPED':
+            return
+        try:
+            bpy.ops.object_colors.refresh()
+        except:
+            pass
+
     show_filters: BoolProperty(
         name="Show Filters",
         description="Show/hide filter options",
@@ -212,6 +221,28 @@ class ColoraideObjectColorsProperties(PropertyGroup):
         precision=4,
         options={'HIDDEN', 'SKIP_SAVE'}
     )
+
+    grouping_metric: EnumProperty(
+        name="Grouping Metric",
+        description="How colors are compared when grouping",
+        items=[
+            ('LINEAR', "Linear", "Largest per-channel difference in scene linear", 0),
+            ('DELTA_E', "ΔE 2000", "CIEDE2000 color difference (perceptual)", 1),
+        ],
+        default='LINEAR',
+        update=update_grouping
+    )
+
+    grouping_delta_e: bpy.props.FloatProperty(
+        name="ΔE Tolerance",
+        description="Colors closer than this ΔE 2000 are grouped (about 1.0 is a just noticeable difference)",
+        default=1.0,
+        min=0.0,
+        soft_max=10.0,
+        step=10,
+        precision=2,
+        update=update_grouping
+    )
     
     last_active_object: StringProperty(
         name="Last Active Object",
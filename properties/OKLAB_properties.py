@@ -0,0 +1,72 @@
+"""Oklab / OkLCh Properties with relative adjustment mode"""
+
+import bpy
+from bpy.props import FloatProperty
+from ..import COLORAIDE_sync
+from .base import SuppressUpdatesMixin
+
+class ColoraideOklabProperties(SuppressUpdatesMixin):
+    
+    def update_oklab_values(self, context):
+        if COLORAIDE_sync.is_updating() or self.suppress_updates:
+            return
+        oklab_values = (self.lightness, self.a, self.b)
+        # Use RELATIVE mode for slider adjustments
+        COLORAIDE_sync.sync_all(context, 'oklab', oklab_values, mode='relative')
+
+    def update_oklch_values(self, context):
+        if COLORAIDE_sync.is_updating() or self.suppress_updates:
+            return
+        oklch_values = (self.lightness, self.chroma, self.hue)
+        # Use RELATIVE mode for slider adjustments
+        COLORAIDE_sync.sync_all(context, 'oklch', oklch_values, mode='relative')
+
+    lightness: FloatProperty(
+        name="L",
+        min=0.0,
+        max=1.0,
+        default=0.5,
+        precision=3,
+        step=1,
+        update=update_oklch_values
+    )
+    
+    a: FloatProperty(
+        name="a",
+        min=-0.4,
+        max=0.4,
+        default=0.0,
+        precision=3,
+        step=1,
+        update=update_oklab_values
+    )
+    
+    b: FloatProperty(
+        name="b",
+        min=-0.4,
+        max=0.4,
+        default=0.0,
+        precision=3,
+        step=1,
+        update=update_oklab_values
+    )
+
+    chroma: FloatProperty(
+        name="C",
+        min=0.0,
+        max=0.4,
+        default=0.0,
+        precision=3,
+        step=1,
+        update=update_oklch_values
+    )
+
+    hue: FloatProperty(
+        name="h",
+        min=0.0,
+        max=360.0,
+        default=0.0,
+        precision=0,
+        step=100,
+        update=update_oklch_values
+    )
@@ -1,6 +1,7 @@
 from .CHISTORY_properties import ColoraideHistoryProperties, ColorHistoryItemProperties
 from .RGB_properties import ColoraideRGBProperties
 from .LAB_properties import ColoraideLABProperties
+from .OKLAB_properties import ColoraideOklabProperties
 from .HSV_properties import ColoraideHSVProperties
 from .HEX_properties import ColoraideHexProperties
 from .CPICKER_properties import ColoraidePickerProperties
@@ -13,6 +14,7 @@ __all__ = [
     'ColoraideHistoryProperties',
     'ColoraideRGBProperties',
     'ColoraideLABProperties', 
+    'ColoraideOklabProperties',
     'ColoraideHSVProperties',
     'ColoraideHexProperties',
     'ColoraidePickerProperties',
@@ -0,0 +1,34 @@
+"""
+Test setup: load the add-on's pure NumPy modules outside Blender.
+
+The add-on root and its operators directory are registered as the
+``coloraide`` / ``coloraide.operators`` packages without running their
+__init__ (which import Blender classes), and ``bpy`` / ``mathutils`` get
+minimal stand-ins when the real modules are unavailable. Only modules that
+need no Blender API at import time (colorspace, utils, the picker session
+and capture backends, ...) are testable this way.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+try:
+    import bpy  # noqa: F401
+except ImportError:
+    sys.modules['bpy'] = types.ModuleType('bpy')
+
+try:
+    import mathutils  # noqa: F401
+except ImportError:
+    mathutils = types.ModuleType('mathutils')
+    mathutils.Vector = tuple
+    sys.modules['mathutils'] = mathutils
+
+for name, path in (('coloraide', ROOT), ('coloraide.operators', ROOT / 'operators')):
+    if name not in sys.modules:
+        package = types.ModuleType(name)
+        package.__path__ = [str(path)]
+        sys.modules[name] = package
@@ -0,0 +1,32 @@
+"""Blackbody lookup table in COLORAIDE_colorspace against the exact integral."""
+
+import numpy as np
+
+from coloraide import COLORAIDE_colorspace as cs
+
+
+def _full_range():
+    # Dense in Kelvin at both ends plus every table node and midpoint in mired
+    mired = np.linspace(1e6 / cs.BLACKBODY_MAX_K, 1e6 / cs.BLACKBODY_MIN_K,
+                        2 * cs.BLACKBODY_LUT_SIZE - 1)
+    return np.unique(np.concatenate([
+        np.linspace(cs.BLACKBODY_MIN_K, cs.BLACKBODY_MAX_K, 100_000), 1e6 / mired]))
+
+
+def test_array_within_documented_error():
+    kelvin = _full_range()
+    error = np.abs(cs.blackbody_to_linear_array(kelvin) - cs._planck_to_linear(kelvin)).max()
+    assert error <= cs.BLACKBODY_LUT_MAX_ERROR
+
+
+def test_scalar_matches_array():
+    kelvin = np.random.default_rng(0).uniform(cs.BLACKBODY_MIN_K, cs.BLACKBODY_MAX_K, 2000)
+    scalar = [cs.blackbody_to_linear(k) for k in kelvin]
+    assert np.allclose(scalar, cs.blackbody_to_linear_array(kelvin), atol=1e-12)
+
+
+def test_clamps_out_of_range():
+    rgb = cs.blackbody_to_linear_array([0.0, 500.0, 1e6])
+    ends = cs._planck_to_linear([cs.BLACKBODY_MIN_K, cs.BLACKBODY_MAX_K])
+    assert np.allclose(rgb, ends[[0, 0, 1]], atol=cs.BLACKBODY_LUT_MAX_ERROR)
+    assert np.allclose(rgb.max(axis=-1), 1.0)
@@ -0,0 +1,39 @@
+"""Capture backends (operators/CPICKER_screen) driven without a real screen."""
+
+import numpy as np
+import pytest
+
+from coloraide.operators.CPICKER_screen import (
+    AUTO_BACKEND, FRAMEBUFFER_BACKEND, CaptureBackend, SyntheticBackend,
+    capture_backend_items,
+)
+from coloraide.operators.CPICKER_session import PickerSession
+
+
+def test_sample_grows_a_smaller_session():
+    backend = SyntheticBackend(width=64, height=48)
+    backend.cursor = (30, 20)
+    session = PickerSession(3)
+    channels, mean_srgb, curr_srgb = backend.sample(25, session)
+    assert session.capacity >= 25 * 25
+    assert channels.shape == (25 * 25, 3)
+    window = backend._screen[8:33, 18:43, 2::-1]
+    assert np.allclose(mean_srgb, window.reshape(-1, 3).mean(axis=0) / 255.0)
+    assert np.allclose(curr_srgb, window[12, 12] / 255.0)
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        CaptureBackend()
+
+    class Incomplete(CaptureBackend):
+        name = 'INCOMPLETE'
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_synthetic_backend_not_offered_in_preferences():
+    names = [item[0] for item in capture_backend_items()]
+    assert 'SYNTHETIC' not in names
+    assert names[0] == AUTO_BACKEND and names[-1] == FRAMEBUFFER_BACKEND
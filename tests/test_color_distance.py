@@ -0,0 +1,84 @@
+"""ΔE kernels in COLORAIDE_color_distance."""
+
+import numpy as np
+import pytest
+
+from coloraide import COLORAIDE_color_distance as distance
+
+# Sharma, Wu & Dalal (2005) CIEDE2000 test data: (Lab 1, Lab 2, ΔE00)
+SHARMA_PAIRS = [
+    ((50.0, 2.6772, -79.7751), (50.0, 0.0, -82.7485), 2.0425),
+    ((50.0, 3.1571, -77.2803), (50.0, 0.0, -82.7485), 2.8615),
+    ((50.0, 2.8361, -74.0200), (50.0, 0.0, -82.7485), 3.4412),
+    ((50.0, -1.3802, -84.2814), (50.0, 0.0, -82.7485), 1.0000),
+    ((50.0, -1.1848, -84.8006), (50.0, 0.0, -82.7485), 1.0000),
+    ((50.0, -0.9009, -85.5211), (50.0, 0.0, -82.7485), 1.0000),
+    ((50.0, 0.0, 0.0), (50.0, -1.0, 2.0), 2.3669),
+    ((50.0, 2.4900, -0.0010), (50.0, -2.4900, 0.0009), 7.1792),
+    ((50.0, -0.0010, 2.4900), (50.0, 0.0009, -2.4900), 4.8045),
+    ((50.0, 2.5, 0.0), (50.0, 0.0, -2.5), 4.3065),
+    ((50.0, 2.5, 0.0), (73.0, 25.0, -18.0), 27.1492),
+    ((50.0, 2.5, 0.0), (61.0, -5.0, 29.0), 22.8977),
+    ((50.0, 2.5, 0.0), (56.0, -27.0, -3.0), 31.9030),
+    ((50.0, 2.5, 0.0), (58.0, 24.0, 15.0), 19.4535),
+    ((50.0, 2.5, 0.0), (50.0, 3.1736, 0.5854), 1.0000),
+    ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644),
+    ((63.0109, -31.0961, -5.8663), (62.8187, -29.7946, -4.0864), 1.2630),
+    ((61.2901, 3.7196, -5.3901), (61.4292, 2.2480, -4.9620), 1.8731),
+    ((35.0831, -44.1164, 3.7933), (35.0232, -40.0716, 1.5901), 1.8645),
+    ((2.0776, 0.0795, -1.1350), (0.9033, -0.0636, -0.5514), 0.9082),
+]
+
+
+def _random_labs(n, seed):
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.random(n) * 100, rng.random(n) * 200 - 100, rng.random(n) * 200 - 100])
+
+
+def test_ciede2000_sharma_pairs():
+    lab1 = np.array([p[0] for p in SHARMA_PAIRS])
+    lab2 = np.array([p[1] for p in SHARMA_PAIRS])
+    expected = np.array([p[2] for p in SHARMA_PAIRS])
+    assert np.abs(distance.delta_e_2000(lab1, lab2) - expected).max() < 1e-4
+
+
+@pytest.mark.parametrize('kernel', [distance.delta_e_94, distance.delta_e_2000],
+                         ids=lambda k: k.__name__)
+def test_symmetric(kernel):
+    a, b = _random_labs(2000, 0), _random_labs(2000, 1)
+    lab1 = np.concatenate([a, [p[0] for p in SHARMA_PAIRS]])
+    lab2 = np.concatenate([b, [p[1] for p in SHARMA_PAIRS]])
+    if kernel is distance.delta_e_94:
+        # CIE94 weights use the first color's chroma: symmetric only for
+        # pairs of equal chroma, such as a color and its hue rotation
+        angle = np.random.default_rng(2).random(len(lab1)) * 2 * np.pi
+        lab2 = lab1.copy()
+        lab2[:, 1] = lab1[:, 1] * np.cos(angle) - lab1[:, 2] * np.sin(angle)
+        lab2[:, 2] = lab1[:, 1] * np.sin(angle) + lab1[:, 2] * np.cos(angle)
+    assert np.allclose(kernel(lab1, lab2), kernel(lab2, lab1), atol=1e-9)
+
+
+def test_identical_colors_have_zero_distance():
+    labs = _random_labs(500, 3)
+    for method in distance.METHODS:
+        assert np.abs(distance.delta_e(labs, labs, method)).max() < 1e-9
+
+
+@pytest.mark.parametrize('method', distance.METHODS)
+def test_chunked_matrix_matches_unchunked(method):
+    a, b = _random_labs(700, 4), _random_labs(90, 5)
+    kernel = distance._kernel(method)
+    unchunked = kernel(a[:, None, :], b[None, :, :])
+    chunked = distance.delta_e_matrix(a, b, method, max_pairs=1000)
+    assert chunked.shape == (700, 90)
+    assert np.array_equal(chunked, unchunked)
+
+
+def test_delta_e_76_is_euclidean():
+    a, b = _random_labs(100, 6), _random_labs(100, 7)
+    assert np.allclose(distance.delta_e_76(a, b), np.linalg.norm(a - b, axis=1))
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        distance.delta_e((50.0, 0.0, 0.0), [(50.0, 1.0, 0.0)], 'CIE1976')
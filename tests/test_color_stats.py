@@ -0,0 +1,49 @@
+"""Streaming color statistics (COLORAIDE_utils.ColorStatsAccumulator) and their use per picking session."""
+
+import numpy as np
+
+from coloraide.COLORAIDE_utils import ColorStatsAccumulator
+from coloraide.operators.CPICKER_session import PickerSession
+
+
+def _batches():
+    rng = np.random.default_rng(0)
+    return [rng.random((rng.integers(1, 700), 3)) for _ in range(50)]
+
+
+def test_accumulator_matches_numpy():
+    batches = _batches()
+    acc = ColorStatsAccumulator()
+    for batch in batches:
+        acc.update(batch)
+    everything = np.concatenate(batches)
+    assert acc.count == len(everything)
+    assert np.allclose(acc.mean, everything.mean(axis=0), atol=1e-12)
+    assert np.allclose(acc.variance, everything.var(axis=0), atol=1e-12)
+    assert np.array_equal(acc.min, everything.min(axis=0))
+    assert np.array_equal(acc.max, everything.max(axis=0))
+    # Histogram percentiles are bin centers: within one 1/bins bin
+    for q in (5, 50, 95):
+        assert np.abs(acc.percentile(q) - np.percentile(everything, q, axis=0)).max() <= 1.0 / acc.bins
+
+
+def test_accumulator_reset():
+    acc = ColorStatsAccumulator()
+    acc.update(np.ones((10, 3)))
+    acc.reset()
+    assert acc.count == 0 and acc.statistics() is None and not acc.histogram.any()
+
+
+def test_session_accumulates_only_when_asked():
+    batches = [b.astype(np.float32) for b in _batches()]
+    session = PickerSession(3)
+    session.add_sample(batches[0])
+    assert session.session_mean() is None
+    for batch in batches[1:]:
+        session.add_sample(batch, accumulate=True)
+    everything = np.concatenate(batches[1:]).astype(np.float64)
+    assert np.allclose(session.session_mean(), everything.mean(axis=0), atol=1e-6)
+    stats = session.session_statistics()
+    assert np.allclose(stats['std'], everything.std(axis=0), atol=1e-6)
+    # A new session starts empty
+    assert PickerSession(3).session_statistics() is None
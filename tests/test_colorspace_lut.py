@@ -0,0 +1,70 @@
+"""Transfer-curve lookup tables in COLORAIDE_colorspace."""
+
+import numpy as np
+import pytest
+
+from coloraide import COLORAIDE_colorspace as cs
+
+
+def test_linear_to_srgb_lut_within_documented_error():
+    linear = np.linspace(0.0, 1.0, 2_000_001)
+    exact = cs.linear_to_srgb_array(linear)
+    error = np.abs(cs.linear_to_srgb_lut_array(linear) - exact).max()
+    assert error <= cs.LINEAR_TO_SRGB_LUT_MAX_ERROR
+
+
+def test_scalar_lut_matches_array_lut():
+    linear = np.random.default_rng(0).random(1000)
+    scalar = [cs.linear_to_srgb_lut(c) for c in linear]
+    assert np.allclose(scalar, cs.linear_to_srgb_lut_array(linear), atol=1e-12)
+
+
+def test_byte_table_is_exact():
+    codes = np.arange(256)
+    exact = [cs.srgb_to_linear(c / 255.0) for c in codes]
+    assert np.array_equal(cs.bytes_to_linear_array(codes, dtype=np.float64), exact)
+
+
+def test_linear_to_bytes_matches_rounded_curve():
+    steps = cs._LINEAR_BYTE_THRESHOLDS
+    # Random values plus values just off every byte step (the scalar curve's
+    # own rounding noise decides values closer than that)
+    linear = np.concatenate([
+        np.random.default_rng(1).random(200_000), steps * (1 - 1e-12), steps * (1 + 1e-12)])
+    expected = [round(cs.linear_to_srgb(c) * 255) for c in linear]
+    assert np.array_equal(cs.linear_to_bytes_array(linear), expected)
+
+
+def test_byte_steps_at_thresholds():
+    steps = cs._LINEAR_BYTE_THRESHOLDS
+    assert np.array_equal(cs.linear_to_bytes_array(steps), np.arange(1, 256))
+    assert np.array_equal(cs.linear_to_bytes_array(np.nextafter(steps, 0.0)), np.arange(255))
+
+
+def test_bytes_round_trip():
+    codes = np.arange(256, dtype=np.uint8)
+    assert np.array_equal(cs.linear_to_bytes_array(cs.bytes_to_linear_array(codes)), codes)
+    for code in range(256):
+        rgb = (code, 255 - code, code // 2)
+        assert cs.rgb_linear_to_bytes(cs.rgb_bytes_to_linear(rgb)) == rgb
+
+
+@pytest.mark.parametrize('size', [1, 10, 100, 1000])
+def test_transfer_arrays_match_analytic_curve(size):
+    # size × size RGB images with out-of-range values, as the picker and
+    # image paths pass them; the scalar functions are the reference
+    rng = np.random.default_rng(size)
+    image = rng.uniform(-0.1, 1.1, (size, size, 3))
+    flat = image.ravel().tolist()
+    to_linear = np.reshape([cs.srgb_to_linear(c) for c in flat], image.shape)
+    to_srgb = np.reshape([cs.linear_to_srgb(c) for c in flat], image.shape)
+
+    assert np.allclose(cs.srgb_to_linear_array(image), to_linear, rtol=0, atol=1e-15)
+    assert np.allclose(cs.linear_to_srgb_array(image), to_srgb, rtol=0, atol=1e-15)
+    lut = cs.linear_to_srgb_lut_array(image)
+    assert lut.shape == image.shape
+    assert np.abs(lut - to_srgb).max() <= cs.LINEAR_TO_SRGB_LUT_MAX_ERROR
+    # Image-precision results stay within float32 rounding of the curve
+    image32 = image.astype(cs.IMAGE_DTYPE)
+    assert np.allclose(cs.srgb_to_linear_array(image32), to_linear, rtol=0, atol=1e-6)
+    assert np.allclose(cs.linear_to_srgb_array(image32), to_srgb, rtol=0, atol=1e-6)
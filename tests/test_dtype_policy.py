@@ -0,0 +1,93 @@
+"""dtype policy of the array color kernels (COLORAIDE_colorspace / COLORAIDE_utils)."""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from coloraide import COLORAIDE_colorspace as cs
+from coloraide import COLORAIDE_utils as utils
+
+KERNELS = [
+    cs.srgb_to_linear_array,
+    cs.linear_to_srgb_array,
+    cs.linear_to_srgb_lut_array,
+    utils.rgb_to_hsv_array,
+    utils.hsv_to_rgb_array,
+    utils.rgb_to_hsl_array,
+    utils.hsl_to_rgb_array,
+    utils.rgb_to_xyz_array,
+    utils.xyz_to_rgb_array,
+    utils.xyz_to_lab_array,
+    utils.lab_to_xyz_array,
+    utils.rgb_to_lab_array,
+    utils.lab_to_rgb_array,
+    utils.rgb_to_oklab_array,
+    utils.oklab_to_rgb_array,
+    utils.oklab_to_oklch_array,
+    utils.oklch_to_oklab_array,
+]
+
+COLORS = np.random.default_rng(0).random((1000, 3))
+
+
+def _peak_ratio(func, data, **kwargs):
+    """Peak allocation of func(data) in units of data.nbytes."""
+    func(data, **kwargs)
+    tracemalloc.start()
+    try:
+        func(data, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak / data.nbytes
+
+
+@pytest.mark.parametrize('kernel', KERNELS, ids=lambda k: k.__name__)
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_kernels_keep_float_precision(kernel, dtype):
+    assert kernel(COLORS.astype(dtype)).dtype == dtype
+
+
+@pytest.mark.parametrize('kernel', KERNELS, ids=lambda k: k.__name__)
+def test_kernels_default_and_forced_dtype(kernel):
+    assert kernel(COLORS.tolist()).dtype == cs.UI_DTYPE
+    assert kernel(COLORS, dtype=np.float32).dtype == np.float32
+
+
+def test_as_float_array_copies_only_on_dtype_change():
+    data = COLORS.astype(np.float32)
+    assert cs.as_float_array(data) is data
+    assert cs.as_float_array(data, np.float32) is data
+    assert cs.as_float_array(data, np.float64).dtype == np.float64
+
+
+def test_byte_input_is_image_data():
+    codes = np.array([0, 128, 255], dtype=np.uint8)
+    assert cs.bytes_to_linear_array(codes).dtype == cs.IMAGE_DTYPE
+
+
+def test_linear_to_bytes_same_for_float32_and_float64():
+    steps = cs._LINEAR_BYTE_THRESHOLDS.astype(np.float32)
+    data = np.concatenate([
+        COLORS.astype(np.float32).ravel(), steps,
+        np.nextafter(steps, np.float32(0)), np.nextafter(steps, np.float32(2))])
+    assert np.array_equal(cs.linear_to_bytes_array(data),
+                          cs.linear_to_bytes_array(data.astype(np.float64)))
+
+
+@pytest.mark.parametrize('kernel', [cs.srgb_to_linear_array, cs.linear_to_srgb_array])
+def test_transfer_out_writes_in_place(kernel):
+    data = COLORS.astype(np.float32)
+    expected = kernel(data)
+    buffer = data.copy()
+    assert kernel(buffer, out=buffer) is buffer
+    assert np.array_equal(buffer, expected)
+
+
+@pytest.mark.parametrize('kernel', [cs.srgb_to_linear_array, cs.linear_to_srgb_array])
+def test_transfer_scratch_is_bounded(kernel):
+    data = np.random.default_rng(1).random((200_000, 3)).astype(np.float32)
+    # One scratch array and one mask besides the result
+    assert _peak_ratio(kernel, data) < 2.5
+    assert _peak_ratio(kernel, data, out=data.copy()) < 1.5
@@ -0,0 +1,47 @@
+"""Batch hex conversions in COLORAIDE_colorspace."""
+
+import numpy as np
+import pytest
+
+from coloraide import COLORAIDE_colorspace as cs
+
+
+def test_hex_forms():
+    colors, valid = cs.hex_array_to_linear(['#F80', 'ff8800', '#FF8800', '#ff880080'], with_alpha=True)
+    assert valid.all()
+    expected = cs.rgb_bytes_to_linear((255, 136, 0))
+    assert np.allclose(colors[:, :3], expected)
+    # #RGB / #RRGGBB are opaque; alpha is linear, not transfer-encoded
+    assert np.allclose(colors[:, 3], [1.0, 1.0, 1.0, 128 / 255])
+
+
+def test_invalid_entries_are_masked():
+    colors, valid = cs.hex_array_to_linear(['#00FF00', 'nothex', '#12345', '', '#GG0000', '#0000ff'])
+    assert valid.tolist() == [True, False, False, False, False, True]
+    assert not colors[~valid].any()
+    assert np.allclose(colors[[0, 5]], [[0, 1, 0], [0, 0, 1]])
+
+
+def test_round_trip_through_hex():
+    codes = np.random.default_rng(0).integers(0, 256, (500, 3))
+    hexes = ['#%02X%02X%02X' % tuple(c) for c in codes]
+    colors, valid = cs.hex_array_to_linear(hexes)
+    assert valid.all()
+    assert cs.linear_array_to_hex(colors) == hexes
+
+
+def test_linear_array_to_hex_shapes():
+    assert cs.linear_array_to_hex([]) == []
+    assert cs.linear_array_to_hex(np.empty((0, 3))) == []
+    assert cs.linear_array_to_hex((1.0, 0.0, 0.0)) == ['#FF0000']
+    assert cs.linear_array_to_hex([[0.0, 0.0, 1.0, 0.5]]) == ['#0000FF80']
+    assert cs.linear_array_to_hex(np.ones((2, 2, 3))) == ['#FFFFFF'] * 4
+    with pytest.raises(ValueError):
+        cs.linear_array_to_hex([[0.5, 0.5]])
+    with pytest.raises(ValueError):
+        cs.linear_array_to_hex([0.5])
+
+
+def test_empty_hex_input():
+    colors, valid = cs.hex_array_to_linear([])
+    assert colors.shape == (0, 3) and valid.shape == (0,)
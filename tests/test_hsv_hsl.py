@@ -0,0 +1,66 @@
+"""Scalar and array HSV/HSL conversions in COLORAIDE_utils."""
+
+import colorsys
+
+import numpy as np
+
+from coloraide import COLORAIDE_utils as utils
+
+
+def _colors():
+    rng = np.random.default_rng(0)
+    colors = rng.random((5000, 3))
+    # Greys, black, white and exact max-channel ties exercise every hue branch
+    edge = np.array([
+        [0.0, 0.0, 0.0], [1.0, 1.0, 1.0], [0.5, 0.5, 0.5],
+        [1.0, 1.0, 0.0], [0.0, 1.0, 1.0], [1.0, 0.0, 1.0],
+        [0.3, 0.3, 0.1], [0.1, 0.3, 0.3], [0.3, 0.1, 0.3],
+    ])
+    return np.concatenate([colors, edge, np.round(colors[:1000] * 4) / 4])
+
+
+def test_hsv_array_matches_scalar():
+    colors = _colors()
+    hsv = utils.rgb_to_hsv_array(colors)
+    assert np.array_equal(hsv, [utils.rgb_to_hsv(tuple(c)) for c in colors])
+    assert np.array_equal(utils.hsv_to_rgb_array(hsv), [utils.hsv_to_rgb(tuple(c)) for c in hsv])
+
+
+def test_hsl_array_matches_scalar():
+    colors = _colors()
+    hsl = utils.rgb_to_hsl_array(colors)
+    assert np.allclose(hsl, [utils.rgb_to_hsl(tuple(c)) for c in colors], atol=1e-15)
+    assert np.allclose(utils.hsl_to_rgb_array(hsl), [utils.hsl_to_rgb(tuple(c)) for c in hsl],
+                       atol=1e-15)
+
+
+def test_round_trips():
+    colors = _colors()
+    assert np.abs(utils.hsv_to_rgb_array(utils.rgb_to_hsv_array(colors)) - colors).max() < 1e-12
+    assert np.abs(utils.hsl_to_rgb_array(utils.rgb_to_hsl_array(colors)) - colors).max() < 1e-12
+
+
+def test_hsl_matches_colorsys():
+    colors = _colors()
+    expected = [(h, s, l) for h, l, s in (colorsys.rgb_to_hls(*c) for c in colors)]
+    assert np.allclose(utils.rgb_to_hsl_array(colors), expected, atol=1e-12)
+
+
+def test_array_kernels_keep_leading_shape():
+    image = np.random.default_rng(1).random((4, 5, 3))
+    assert utils.rgb_to_hsv_array(image).shape == (4, 5, 3)
+    assert utils.hsl_to_rgb_array(utils.rgb_to_hsl_array(image)).shape == (4, 5, 3)
+
+
+def test_million_colors_match_scalar():
+    # A full 1M-colour batch; every 7th snapped to 8-bit levels for exact channel ties
+    colors = np.random.default_rng(2).random((1_000_000, 3))
+    colors[::7] = np.round(colors[::7] * 255) / 255
+    hsv = utils.rgb_to_hsv_array(colors)
+    hsl = utils.rgb_to_hsl_array(colors)
+    assert hsv.shape == hsl.shape == (1_000_000, 3)
+    assert np.array_equal(hsv, [utils.rgb_to_hsv(c) for c in colors.tolist()])
+    assert np.allclose(hsl, [utils.rgb_to_hsl(c) for c in colors.tolist()], atol=1e-15)
+    assert np.array_equal(utils.hsv_to_rgb_array(hsv), [utils.hsv_to_rgb(c) for c in hsv.tolist()])
+    assert np.allclose(utils.hsl_to_rgb_array(hsl), [utils.hsl_to_rgb(c) for c in hsl.tolist()],
+                       atol=1e-15)
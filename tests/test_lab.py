@@ -0,0 +1,35 @@
+"""Batched LAB conversions in COLORAIDE_utils against the scalar path."""
+
+import numpy as np
+
+from coloraide.COLORAIDE_utils import lab_to_rgb, lab_to_rgb_array, rgb_to_lab, rgb_to_lab_array
+
+
+def _colors():
+    rng = np.random.default_rng(3)
+    edges = [(0, 0, 0), (1, 1, 1), (1, 0, 0), (0, 1, 0), (0, 0, 1),
+             (0.001, 0.001, 0.001), (0.5, 0.5, 0.5), (1, 1, 0)]
+    return np.vstack([rng.random((5000, 3)), edges])
+
+
+def test_rgb_to_lab_array_matches_scalar():
+    colors = _colors()
+    expected = np.array([rgb_to_lab(tuple(c)) for c in colors.tolist()])
+    assert np.allclose(rgb_to_lab_array(colors), expected, atol=1e-9)
+
+
+def test_lab_to_rgb_array_matches_scalar():
+    rng = np.random.default_rng(4)
+    lab = np.column_stack([rng.uniform(0, 100, 5000),
+                           rng.uniform(-128, 127, 5000),
+                           rng.uniform(-128, 127, 5000)])
+    expected = np.array([lab_to_rgb(tuple(c)) for c in lab.tolist()])
+    assert np.allclose(lab_to_rgb_array(lab), expected, atol=1e-9)
+
+
+def test_scalar_results_are_python_floats():
+    lab = rgb_to_lab((0.2, 0.4, 0.6))
+    rgb = lab_to_rgb(lab)
+    assert not any(isinstance(c, np.generic) for c in lab + rgb)
+    # The tabulated D50 white is rounded, so the round trip is close, not exact
+    assert np.allclose(rgb, (0.2, 0.4, 0.6), atol=1e-3)
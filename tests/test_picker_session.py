@@ -0,0 +1,98 @@
+"""PickerSession buffers and per-sample statistics (operators/CPICKER_session)."""
+
+import tracemalloc
+
+import numpy as np
+
+from coloraide.COLORAIDE_colorspace import linear_to_srgb_array
+from coloraide.operators.CPICKER_session import FLOAT_HISTOGRAM_BINS, PickerSession
+
+SIZE = 25
+
+
+# Linear channels of one sample, the unit the allocation bounds are given in
+SAMPLE_BYTES = SIZE * SIZE * 3 * 4
+REPEATS = 200
+# Leaking as little as 150 bytes per sample exceeds this
+RETAINED_BYTES = 150 * REPEATS
+
+
+def _allocated_during(func, repeats=REPEATS):
+    """
+    (retained, peak) bytes over repeats calls of func, after one warm-up
+    call: what is still allocated at the end, and the most any single call
+    allocated above what was live when it started. Both stay flat when every
+    call reuses the session's buffers; retained is then up to ~10 KB of
+    numpy's small-object caches (more after large arrays have run), while a
+    per-call leak grows with repeats.
+    """
+    func()
+    tracemalloc.start()
+    try:
+        peak = 0
+        for _ in range(repeats):
+            live = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            func()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - live)
+        return tracemalloc.get_traced_memory()[0], peak
+    finally:
+        tracemalloc.stop()
+
+
+def test_byte_samples_reuse_session_buffers():
+    session = PickerSession(SIZE)
+    bgra = np.random.default_rng(0).integers(0, 256, (SIZE, SIZE, 4), dtype=np.uint8)
+
+    def sample():
+        session.add_sample(session.linearize_bytes(bgra[:, :, 2::-1]))
+
+    retained, peak = _allocated_during(sample)
+    assert retained < RETAINED_BYTES
+    # Table take() straight into the session buffer: no per-sample arrays
+    assert peak < SAMPLE_BYTES / 4
+
+
+def test_float_samples_reuse_session_buffers():
+    session = PickerSession(SIZE)
+    pixels = np.random.default_rng(1).random(SIZE * SIZE * 3).astype(np.float32)
+
+    def sample():
+        session.store_float(pixels, SIZE * SIZE // 2, SIZE)
+        channels, _mean, _curr = session.take_float_sample()
+        session.add_sample(channels)
+
+    retained, peak = _allocated_during(sample)
+    assert retained < RETAINED_BYTES
+    # srgb_to_linear_array's one scratch array and mask, freed every sample
+    assert peak < 2.5 * SAMPLE_BYTES
+
+
+def _encoded_percentiles(session, channels, qs):
+    """Histogram percentiles and np.percentile (nearest rank) of channels, in sRGB."""
+    stats = session.sample_stats(('p5', 'median', 'p95'))
+    got = np.array([stats['p5'], stats['median'], stats['p95']])
+    assert np.array_equal(got, session.percentiles(qs))
+    expected = np.percentile(channels, qs, axis=0, method='inverted_cdf')
+    return linear_to_srgb_array(got), linear_to_srgb_array(expected)
+
+
+def test_byte_percentiles_match_numpy():
+    session = PickerSession(SIZE)
+    rgb = np.random.default_rng(2).integers(0, 256, (SIZE, SIZE, 3), dtype=np.uint8)
+    channels = session.linearize_bytes(rgb)
+    session.add_sample(channels)
+    got, expected = _encoded_percentiles(session, channels, (5, 50, 95))
+    # Binned on the 256 codes themselves: within one code
+    assert np.abs(got - expected).max() * 255 <= 1 + 1e-9
+
+
+def test_float_percentiles_match_numpy():
+    session = PickerSession(SIZE)
+    pixels = np.random.default_rng(3).random(SIZE * SIZE * 3).astype(np.float32)
+    session.store_float(pixels, SIZE * SIZE // 2, SIZE)
+    channels, _mean, _curr = session.take_float_sample()
+    session.add_sample(channels)
+    got, expected = _encoded_percentiles(session, channels, (5, 50, 95))
+    # Binned on FLOAT_HISTOGRAM_BINS steps of sRGB through the LUT: within one bin
+    assert np.abs(got - expected).max() <= 1.0 / FLOAT_HISTOGRAM_BINS + 1e-5
@@ -0,0 +1,63 @@
+"""X11 MIT-SHM capture (operators/CPICKER_screen) against a live display, e.g. Xvfb."""
+
+import ctypes
+import ctypes.util
+import os
+
+import numpy as np
+import pytest
+
+from coloraide.operators import CPICKER_screen as screen
+from coloraide.operators.CPICKER_session import PickerSession
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get('DISPLAY') or not ctypes.util.find_library('Xext'),
+    reason="needs an X display with libXext (run under Xvfb)")
+
+# Solid root background; 24-bit TrueColor pixel 0xRRGGBB
+BACKGROUND = (0x33, 0x66, 0x99)
+_IPC_STAT = 2
+
+
+@pytest.fixture
+def x11():
+    if not screen._load_x11():
+        pytest.skip("Xlib or the MIT-SHM extension is unavailable")
+    x11, display, root = screen._x11, screen._x11_display, screen._x11_root
+    x11.XSetWindowBackground.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong]
+    x11.XClearWindow.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+    r, g, b = BACKGROUND
+    x11.XSetWindowBackground(display, root, (r << 16) | (g << 8) | b)
+    x11.XClearWindow(display, root)
+    x11.XSync(display, 0)
+    yield screen
+    screen._close_x11()
+
+
+def test_sample_reads_screen_pixels(x11):
+    expected = np.array(BACKGROUND) / 255.0
+    channels, mean_srgb, curr_srgb = x11._sample_x11(16)
+    assert channels.shape == (16 * 16, 3)
+    assert np.allclose(mean_srgb, expected)
+    assert np.allclose(curr_srgb, expected)
+
+    # Through a smaller session: the backend grows it before writing
+    session = PickerSession(3)
+    channels, mean_srgb, _ = x11._sample_x11(25, session)
+    assert session.capacity >= 25 * 25
+    assert channels.shape == (25 * 25, 3)
+    assert np.allclose(mean_srgb, expected)
+
+
+def test_close_releases_the_segment(x11):
+    x11._sample_x11(16)
+    shmid = x11._x11_shm.shmid
+    assert x11._x11_capacity == 16 * 16
+
+    x11._close_x11()
+    assert x11._x11_image is None and x11._x11_shm is None
+    assert x11._x11_capacity == 0
+    assert x11._x11_display is None and x11._x11_ok is None
+    # Marked for removal at attach time; gone once both sides detached
+    stat = ctypes.create_string_buffer(256)
+    assert x11._libc.shmctl(shmid, _IPC_STAT, stat) == -1